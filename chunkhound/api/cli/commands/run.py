@@ -304,10 +304,12 @@ async def _process_directory(
     processed_patterns = [f"**/{pattern}" for pattern in include_patterns]
 
     # Process directory using indexing coordinator
+    # Embed new chunks while indexing; _generate_missing_embeddings picks up the rest
     result = await indexing_coordinator.process_directory(
         args.path,
         patterns=processed_patterns,
-        exclude_patterns=exclude_patterns
+        exclude_patterns=exclude_patterns,
+        generate_embeddings=not args.no_embeddings
     )
 
     if result["status"] in ["complete", "success"]:
@@ -316,6 +318,8 @@ async def _process_directory(
         formatter.info(f"   • Skipped: {result.get('skipped', 0)} files")
         formatter.info(f"   • Errors: {result.get('errors', 0)} files")
         formatter.info(f"   • Total chunks: {result.get('total_chunks', 0)}")
+        if "embeddings_generated" in result:
+            formatter.info(f"   • Embeddings generated: {result['embeddings_generated']}")
 
         # Report cleanup statistics
         cleanup = result.get('cleanup', {})
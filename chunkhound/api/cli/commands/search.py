@@ -0,0 +1,84 @@
+"""Search command module - keyword (BM25) and regex search over an indexed database."""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any
+
+from chunkhound.signal_coordinator import CLICoordinator
+from registry import configure_registry, create_search_service
+
+from ..utils.config_helpers import args_to_config, create_legacy_registry_config
+from ..utils.output import OutputFormatter
+
+# Lines of code shown under each result
+_PREVIEW_LINES = 6
+
+
+async def search_command(args: argparse.Namespace) -> None:
+    """Execute the search command using the service layer.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    formatter = OutputFormatter(verbose=args.verbose)
+
+    if not Path(args.db).exists():
+        formatter.error(f"Database not found: {args.db} (run 'chunkhound index' first)")
+        sys.exit(1)
+
+    # The MCP server holds the database lock; ask it to release access while searching
+    cli_coordinator = CLICoordinator(Path(args.db))
+
+    try:
+        if cli_coordinator.signal_coordinator.is_mcp_server_running():
+            if not cli_coordinator.request_database_access():
+                formatter.error("Failed to coordinate database access. Please stop the MCP server or use a different database file.")
+                sys.exit(1)
+
+        unified_config = args_to_config(args, Path.cwd())
+        configure_registry(create_legacy_registry_config(unified_config, no_embeddings=True))
+        search_service = create_search_service()
+
+        page_size = max(1, min(args.page_size, 100))
+        if args.mode == "regex":
+            results, pagination = search_service.search_regex(
+                args.query, page_size=page_size, path_filter=args.path, cursor=args.cursor
+            )
+        else:
+            results, pagination = search_service.search_text(
+                args.query, page_size=page_size, path_filter=args.path, cursor=args.cursor
+            )
+
+        if args.json:
+            formatter.json_output({"results": results, "pagination": pagination})
+        else:
+            _print_results(formatter, results, pagination)
+
+    finally:
+        cli_coordinator.release_database_access()
+
+
+def _print_results(formatter: OutputFormatter, results: list[dict[str, Any]], pagination: dict[str, Any]) -> None:
+    """Print search results with a short code preview each."""
+    if not results:
+        formatter.info("No results found")
+        return
+
+    for result in results:
+        symbol = result.get("symbol") or result.get("name") or ""
+        score = f"  [{result['score']:.2f}]" if "score" in result else ""
+        print(f"{result['file_path']}:{result['start_line']}-{result['end_line']}  {symbol}{score}")
+
+        code_lines = (result.get("content") or "").splitlines()
+        for line in code_lines[:_PREVIEW_LINES]:
+            print(f"    {line}")
+        if len(code_lines) > _PREVIEW_LINES:
+            print("    ...")
+        print()
+
+    if pagination.get("next_cursor"):
+        formatter.info(f"More results: --cursor {pagination['next_cursor']}")
+
+
+__all__: list[str] = ["search_command"]
@@ -34,6 +34,17 @@ if is_mcp_command():
     # Set database path environment variable
     os.environ["CHUNKHOUND_DB_PATH"] = str(db_path)
 
+    # HTTP transport flags reach the server through its configuration
+    if "--http" in sys.argv:
+        os.environ["CHUNKHOUND_MCP__TRANSPORT"] = "http"
+    for flag, env_var in (("--host", "CHUNKHOUND_MCP__HOST"), ("--port", "CHUNKHOUND_MCP__PORT")):
+        if flag in sys.argv:
+            flag_index = sys.argv.index(flag)
+            if flag_index + 1 < len(sys.argv):
+                os.environ[env_var] = sys.argv[flag_index + 1]
+    if "--cors" in sys.argv:
+        os.environ["CHUNKHOUND_MCP__CORS"] = "true"
+
     # Propagate OpenAI API key if available for semantic search
     openai_api_key = os.environ.get("OPENAI_API_KEY")
     if openai_api_key:
@@ -144,6 +155,10 @@ def validate_args(args: argparse.Namespace) -> None:
         if not ensure_database_directory(args.db):
             exit_on_validation_error("Cannot access database directory")
 
+    elif args.command == "search":
+        if not args.query.strip():
+            exit_on_validation_error("Search query must not be empty")
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the complete argument parser.
@@ -156,6 +171,7 @@ def create_parser() -> argparse.ArgumentParser:
     from .parsers.mcp_parser import add_mcp_subparser
     from .parsers.run_parser import add_run_subparser
     from .parsers.package_parser import add_package_subparser
+    from .parsers.search_parser import add_search_subparser
 
     parser = create_main_parser()
     subparsers = setup_subparsers(parser)
@@ -164,6 +180,7 @@ def create_parser() -> argparse.ArgumentParser:
     add_run_subparser(subparsers)
     add_package_subparser(subparsers)
     add_mcp_subparser(subparsers)
+    add_search_subparser(subparsers)
 
     return parser
 
@@ -192,6 +209,10 @@ async def async_main() -> None:
             from .commands.package import package_command
 
             await package_command(args)
+        elif args.command == "search":
+            from .commands.search import search_command
+
+            await search_command(args)
         else:
             logger.error(f"Unknown command: {args.command}")
             sys.exit(1)
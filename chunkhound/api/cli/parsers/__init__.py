@@ -3,10 +3,12 @@
 from .main_parser import create_main_parser, setup_subparsers
 from .mcp_parser import add_mcp_subparser
 from .run_parser import add_run_subparser
+from .search_parser import add_search_subparser
 
 __all__ = [
     "create_main_parser",
     "setup_subparsers",
     "add_run_subparser",
     "add_mcp_subparser",
+    "add_search_subparser",
 ]
@@ -23,6 +23,8 @@ Examples:
   chunkhound index . --db ./chunks.duckdb
   chunkhound index /code --include "*.py" --exclude "*/tests/*"
   chunkhound mcp --db ./chunks.duckdb
+  chunkhound search "parseConfig" --db ./chunks.duckdb
+  chunkhound search "def .*_handler" --mode regex --path src/
         """,
     )
 
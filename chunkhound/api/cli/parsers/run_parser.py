@@ -158,6 +158,13 @@ def add_run_subparser(subparsers: Any) -> argparse.ArgumentParser:
         help="Number of records per database transaction (default: 500, range: 1-10000)",
     )
 
+    run_parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="Number of worker processes used to parse files (default: indexing.max_concurrent)",
+    )
+
     # Legacy arguments - deprecated but maintained for backward compatibility
     run_parser.add_argument(
         "--batch-size",
@@ -0,0 +1,65 @@
+"""Search command argument parser for ChunkHound CLI."""
+
+import argparse
+from typing import Any, cast
+
+from .main_parser import add_common_arguments, add_database_argument
+
+
+def add_search_subparser(subparsers: Any) -> argparse.ArgumentParser:
+    """Add search command subparser to the main parser.
+
+    Args:
+        subparsers: Subparsers object from the main argument parser
+
+    Returns:
+        The configured search subparser
+    """
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Search an indexed database",
+        description="Search indexed code by keywords (BM25) or regular expression"
+    )
+
+    add_common_arguments(search_parser)
+    add_database_argument(search_parser)
+
+    search_parser.add_argument(
+        "query",
+        help="Keywords/identifiers (text mode) or regular expression (regex mode)",
+    )
+
+    search_parser.add_argument(
+        "--mode",
+        choices=["text", "regex"],
+        default="text",
+        help="Search mode: BM25 keyword search or regex search (default: text)",
+    )
+
+    search_parser.add_argument(
+        "--page-size",
+        type=int,
+        default=10,
+        help="Number of results to show (default: 10)",
+    )
+
+    search_parser.add_argument(
+        "--path",
+        help="Relative path to limit search scope (e.g., 'src/', 'tests/')",
+    )
+
+    search_parser.add_argument(
+        "--cursor",
+        help="next_cursor printed by a previous search, to show the next page",
+    )
+
+    search_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results and pagination as JSON",
+    )
+
+    return cast(argparse.ArgumentParser, search_parser)
+
+
+__all__: list[str] = ["add_search_subparser"]
@@ -75,6 +75,8 @@ def args_to_config(args: argparse.Namespace, project_dir: Path | None = None) ->
         indexing_config['debounce_ms'] = args.debounce_ms
     if hasattr(args, 'db_batch_size') and args.db_batch_size:
         indexing_config['db_batch_size'] = args.db_batch_size
+    if hasattr(args, 'parse_workers') and args.parse_workers:
+        indexing_config['max_concurrent'] = args.parse_workers
     if hasattr(args, 'force_reindex') and args.force_reindex:
         indexing_config['force_reindex'] = args.force_reindex
     if hasattr(args, 'cleanup') and args.cleanup:
@@ -110,10 +112,17 @@ def create_legacy_registry_config(config: ChunkHoundConfig, no_embeddings: bool
             'path': config.database.path,
             'type': 'duckdb',
             'batch_size': config.indexing.db_batch_size,
+            'regex_backend': config.database.regex_backend,
+            'regex_workers': config.database.regex_workers,
         },
         'embedding': {
             'batch_size': config.embedding.batch_size,
             'max_concurrent_batches': config.embedding.max_concurrent_batches,
+            'cache_max_entries': config.embedding.cache_max_entries,
+            'cache_max_age_days': config.embedding.cache_max_age_days,
+        },
+        'indexing': {
+            'max_concurrent': config.indexing.max_concurrent,
         }
     }
     
@@ -121,6 +130,7 @@ def create_legacy_registry_config(config: ChunkHoundConfig, no_embeddings: bool
         embedding_dict = {
             'provider': config.embedding.provider,
             'model': config.get_embedding_model(),
+            'coarse_dimensions': config.embedding.coarse_dimensions,
         }
         
         if config.embedding.api_key:
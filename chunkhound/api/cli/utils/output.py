@@ -111,8 +111,12 @@ def format_stats(stats: dict[str, Any]) -> str:
     files = stats.get('files', 0)
     chunks = stats.get('chunks', 0)
     embeddings = stats.get('embeddings', 0)
+    stale_indexes = stats.get('stale_vector_indexes', 0)
 
-    return f"{files} files, {chunks} chunks, {embeddings} embeddings"
+    formatted = f"{files} files, {chunks} chunks, {embeddings} embeddings"
+    if stale_indexes:
+        formatted += f" ({stale_indexes} vector index(es) stale - semantic search may be slow)"
+    return formatted
 
 
 def format_health_status(status: dict[str, Any]) -> str:
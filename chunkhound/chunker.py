@@ -1,12 +1,16 @@
 """Chunker module for ChunkHound - extracts semantic code units from parsed AST."""
 
+import hashlib
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
-# Core domain models
+# Comment and docstring symbols end in their start line ("comment:11",
+# "docstring:function:19"), which shifts with every edit above them
+_POSITIONAL_SYMBOL = re.compile(r"^((?:comment|docstring)(?::[^:]+)*):\d+$")
 
 
 class Chunker:
@@ -212,13 +216,37 @@ class Chunker:
         return unique_chunks
 
 
+def chunk_identity(chunk: dict[str, Any]) -> tuple[str, str, str]:
+    """Stable identity of a chunk within its file.
+
+    Line numbers in comment and docstring symbols are dropped, so those chunks
+    are identified by their parent symbol and content. The content hash covers
+    the exact code, so a whitespace-only edit replaces the stored text.
+
+    Args:
+        chunk: Chunk dict (parser output or stored chunk row)
+
+    Returns:
+        Tuple of (chunk type, symbol path, content hash)
+    """
+    chunk_type = chunk.get("chunk_type") or ""
+    if hasattr(chunk_type, "value"):
+        chunk_type = chunk_type.value
+    symbol = chunk.get("symbol") or ""
+    positional = _POSITIONAL_SYMBOL.match(symbol)
+    if positional:
+        symbol = positional.group(1)
+    code_hash = hashlib.sha256((chunk.get("code") or "").encode("utf-8")).hexdigest()
+    return (str(chunk_type), symbol, code_hash)
+
+
 @dataclass
 class ChunkDiff:
     """Represents the difference between old and new chunks for incremental updates."""
     chunks_to_delete: list[int]      # Chunk IDs to remove from database
     chunks_to_insert: list[dict[str, Any]]  # New chunks to add to database
-    chunks_to_update: list[dict[str, Any]]  # Modified chunks to update in database
-    unchanged_count: int             # Number of chunks preserved (for stats)
+    chunks_to_update: list[dict[str, Any]]  # Unchanged chunks that moved (new position, "id" of the kept row)
+    unchanged_count: int             # Number of chunk rows preserved, moved ones included (for stats)
 
 
 class IncrementalChunker:
@@ -228,6 +256,61 @@ class IncrementalChunker:
         """Initialize the incremental chunker."""
         self.base_chunker = Chunker()
 
+    def diff_chunks(self,
+                    old_chunks: list[dict[str, Any]],
+                    new_chunks: list[dict[str, Any]]) -> ChunkDiff:
+        """Diff stored chunks against freshly parsed ones by stable identity.
+
+        Chunks are matched on (chunk type, symbol path, content hash). Matched old
+        rows are kept, together with their embeddings; if their position in the
+        file changed they are reported for a position-only update. Unmatched new
+        chunks are inserted and unmatched old chunks deleted.
+
+        Args:
+            old_chunks: Stored chunks of the file (must carry "id")
+            new_chunks: Chunks produced by parsing the current file content
+
+        Returns:
+            ChunkDiff with the minimal set of database operations
+        """
+        # Identical chunks (same identity) are paired in file order
+        old_by_identity: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
+        for old in sorted(old_chunks, key=lambda chunk: chunk.get("start_line") or 0):
+            if old.get("id") is not None:
+                old_by_identity.setdefault(chunk_identity(old), []).append(old)
+
+        chunks_to_insert = []
+        chunks_to_update = []
+        unchanged_count = 0
+        for new in new_chunks:
+            candidates = old_by_identity.get(chunk_identity(new))
+            if not candidates:
+                chunks_to_insert.append(new)
+                continue
+
+            old = candidates.pop(0)
+            unchanged_count += 1
+            if self._position_changed(old, new):
+                chunks_to_update.append({**new, "id": old["id"]})
+
+        chunks_to_delete = [old["id"] for remaining in old_by_identity.values() for old in remaining]
+
+        logger.debug(f"Chunk diff: {len(chunks_to_insert)} to insert, {len(chunks_to_delete)} to delete, "
+                     f"{len(chunks_to_update)} moved, {unchanged_count} preserved")
+        return ChunkDiff(
+            chunks_to_delete=chunks_to_delete,
+            chunks_to_insert=chunks_to_insert,
+            chunks_to_update=chunks_to_update,
+            unchanged_count=unchanged_count
+        )
+
+    def _position_changed(self, old: dict[str, Any], new: dict[str, Any]) -> bool:
+        """Check whether a matched chunk moved within the file."""
+        for field in ("start_line", "end_line", "start_byte", "end_byte", "symbol"):
+            if new.get(field) is not None and old.get(field) != new.get(field):
+                return True
+        return False
+
     def chunk_file_differential(self,
                                file_path: Path,
                                old_chunks: list[dict[str, Any]],
@@ -257,45 +340,13 @@ class IncrementalChunker:
                 unchanged_count=len(old_chunks)
             )
 
-        # Generate new chunks from the complete parsed data
+        # Generate new chunks from the complete parsed data and diff by identity.
+        # Chunks outside the changed ranges match their stored rows by content,
+        # so structural changes need no special casing.
         new_chunks = self.base_chunker.chunk_file(file_path, new_parsed_data)
         logger.debug(f"Generated {len(new_chunks)} new chunks from parsed data")
 
-        # If we have a full file change or structural change, replace everything
-        has_structural_change = any(
-            change.get('type') in ['full_change', 'structural_change']
-            for change in changed_ranges
-        )
-
-        if has_structural_change:
-            logger.debug("Structural change detected, replacing all chunks")
-            old_chunk_ids = [chunk['id'] for chunk in old_chunks if chunk.get('id') is not None]
-            return ChunkDiff(
-                chunks_to_delete=old_chunk_ids,
-                chunks_to_insert=new_chunks,
-                chunks_to_update=[],
-                unchanged_count=0
-            )
-
-        # Identify which old chunks are affected by the changes
-        affected_chunk_ids = self.identify_affected_chunks(old_chunks, changed_ranges)
-        logger.debug(f"Identified {len(affected_chunk_ids)} affected chunks")
-
-        # Find new chunks that overlap with affected regions
-        affected_new_chunks = self.identify_new_chunks_in_ranges(new_chunks, changed_ranges)
-        logger.debug(f"Found {len(affected_new_chunks)} new chunks in changed ranges")
-
-        # Build the diff
-        chunks_to_delete = list(affected_chunk_ids)
-        chunks_to_insert = affected_new_chunks
-        unchanged_count = len(old_chunks) - len(affected_chunk_ids)
-
-        return ChunkDiff(
-            chunks_to_delete=chunks_to_delete,
-            chunks_to_insert=chunks_to_insert,
-            chunks_to_update=[],  # For now, we delete+insert rather than update
-            unchanged_count=unchanged_count
-        )
+        return self.diff_chunks(old_chunks, new_chunks)
 
     def identify_affected_chunks(self,
                                 old_chunks: list[dict[str, Any]],
@@ -316,25 +367,11 @@ class IncrementalChunker:
             if not chunk_id:
                 continue
 
-            chunk_start = chunk.get('start_line', 0)
-            chunk_end = chunk.get('end_line', 0)
-
             # Check if chunk overlaps with any changed range
             for change in changed_ranges:
-                # Convert byte positions to approximate line positions
-                # This is a simplified approach - in production we'd want more precise mapping
-                change_start_byte = change.get('start_byte', 0)
-                change_end_byte = change.get('end_byte', float('inf'))
-
-                # Simple heuristic: assume ~50 chars per line for byte-to-line conversion
-                # This is rough but works for detecting overlaps
-                change_start_line = max(1, change_start_byte // 50)
-                change_end_line = change_end_byte // 50 if change_end_byte != float('inf') else float('inf')
-
-                # Check for overlap: chunk intersects with changed range
-                if (chunk_start <= change_end_line and chunk_end >= change_start_line):
+                if self._overlaps_change(chunk, change):
                     affected_ids.add(chunk_id)
-                    logger.debug(f"Chunk {chunk_id} ({chunk_start}-{chunk_end}) overlaps with change ({change_start_line}-{change_end_line})")
+                    logger.debug(f"Chunk {chunk_id} ({chunk.get('start_line')}-{chunk.get('end_line')}) overlaps with change {change}")
                     break
 
         return affected_ids
@@ -354,22 +391,43 @@ class IncrementalChunker:
         chunks_in_ranges = []
 
         for chunk in new_chunks:
-            chunk_start = chunk.get('start_line', 0)
-            chunk_end = chunk.get('end_line', 0)
-
             # Check if chunk falls within any changed range
             for change in changed_ranges:
-                # Convert byte positions to approximate line positions
-                change_start_byte = change.get('start_byte', 0)
-                change_end_byte = change.get('end_byte', float('inf'))
-
-                change_start_line = max(1, change_start_byte // 50)
-                change_end_line = change_end_byte // 50 if change_end_byte != float('inf') else float('inf')
-
-                # Check if chunk overlaps with changed range
-                if (chunk_start <= change_end_line and chunk_end >= change_start_line):
+                if self._overlaps_change(chunk, change):
                     chunks_in_ranges.append(chunk)
-                    logger.debug(f"New chunk '{chunk.get('symbol', 'unknown')}' ({chunk_start}-{chunk_end}) falls in changed range")
+                    logger.debug(f"New chunk '{chunk.get('symbol', 'unknown')}' ({chunk.get('start_line')}-{chunk.get('end_line')}) falls in changed range")
                     break
 
         return chunks_in_ranges
+
+    def _overlaps_change(self, chunk: dict[str, Any], change: dict[str, Any]) -> bool:
+        """Check whether a chunk intersects a changed range.
+
+        Byte ranges are compared when both sides have them, otherwise line ranges
+        (1-based "start_line"/"end_line", or tree-sitter 0-based "start_point"/
+        "end_point"). A change without usable coordinates affects every chunk.
+        """
+        chunk_start_byte = chunk.get('start_byte')
+        chunk_end_byte = chunk.get('end_byte')
+        change_start_byte = change.get('start_byte')
+        if chunk_start_byte is not None and chunk_end_byte is not None and change_start_byte is not None:
+            change_end_byte = change.get('end_byte')
+            if change_end_byte is None:
+                return chunk_end_byte >= change_start_byte
+            # An insertion (empty range) touches the chunk that contains its position
+            return chunk_start_byte <= change_end_byte and chunk_end_byte >= change_start_byte
+
+        change_start_line = change.get('start_line')
+        change_end_line = change.get('end_line')
+        if change_start_line is None and change.get('start_point') is not None:
+            change_start_line = change['start_point'][0] + 1
+        if change_end_line is None and change.get('end_point') is not None:
+            change_end_line = change['end_point'][0] + 1
+
+        chunk_start_line = chunk.get('start_line')
+        chunk_end_line = chunk.get('end_line')
+        if change_start_line is None or chunk_start_line is None or chunk_end_line is None:
+            return True
+        if change_end_line is None:
+            return chunk_end_line >= change_start_line
+        return chunk_start_line <= change_end_line and chunk_end_line >= change_start_line
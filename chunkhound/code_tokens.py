@@ -0,0 +1,45 @@
+"""Code-aware tokenization for keyword (BM25) search.
+
+Identifiers are indexed whole and split into their camelCase and snake_case
+parts, all lower-cased, so "parseHttpResponse" is found by "parse http
+response", by "http_response" and by the full name.
+"""
+
+import re
+from collections import Counter
+
+_WORD_RE = re.compile(r"[A-Za-z0-9_]+")
+_PART_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+MIN_TERM_LENGTH = 2
+MAX_TERM_LENGTH = 64
+
+
+def _add_term(terms: Counter[str], term: str) -> None:
+    if MIN_TERM_LENGTH <= len(term) <= MAX_TERM_LENGTH:
+        terms[term] += 1
+
+
+def code_terms(text: str) -> Counter[str]:
+    """Term frequencies of a piece of code or a query.
+
+    Args:
+        text: Source code, docstrings, symbol names or query text
+
+    Returns:
+        Counter of lower-cased terms: every identifier plus, for compound
+        identifiers, each of its parts
+    """
+    terms: Counter[str] = Counter()
+    for word in _WORD_RE.findall(text):
+        _add_term(terms, word.strip("_").lower())
+        parts = _PART_RE.findall(word)
+        if len(parts) > 1:
+            for part in parts:
+                _add_term(terms, part.lower())
+    return terms
+
+
+def query_terms(query: str) -> list[str]:
+    """Distinct terms of a keyword query, in a stable order."""
+    return sorted(code_terms(query))
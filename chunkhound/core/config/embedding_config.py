@@ -34,6 +34,7 @@ class EmbeddingConfig(BaseSettings):
         CHUNKHOUND_EMBEDDING_BASE_URL=https://api.openai.com/v1
         CHUNKHOUND_EMBEDDING_BATCH_SIZE=100
         CHUNKHOUND_EMBEDDING_TIMEOUT=60
+        CHUNKHOUND_EMBEDDING_COARSE_DIMENSIONS=256
     """
 
     model_config = SettingsConfigDict(
@@ -95,6 +96,36 @@ class EmbeddingConfig(BaseSettings):
         description="Maximum concurrent embedding batches"
     )
 
+    query_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        le=1000000,
+        description="Search query embeddings kept in memory (LRU); 0 disables the query cache"
+    )
+
+    query_cache_ttl: int = Field(
+        default=3600,
+        ge=0,
+        description="Seconds a query embedding stays in the in-memory cache; 0 keeps it until evicted"
+    )
+
+    query_cache_persist: bool = Field(
+        default=False,
+        description="Also store query embeddings in the database embedding cache so they survive restarts"
+    )
+
+    cache_max_entries: int | None = Field(
+        default=200_000,
+        ge=1,
+        description="Entries kept in the database embedding cache; the least recently used are evicted beyond it"
+    )
+
+    cache_max_age_days: int | None = Field(
+        default=30,
+        ge=1,
+        description="Days an unused database embedding cache entry is kept; unset keeps entries until evicted by size"
+    )
+
     # Provider-Specific Configuration
     dimensions: int | None = Field(
         default=None,
@@ -103,6 +134,14 @@ class EmbeddingConfig(BaseSettings):
         description="Embedding dimensions (for openai-compatible provider)"
     )
 
+    coarse_dimensions: int | None = Field(
+        default=None,
+        ge=16,
+        le=4096,
+        description="Truncated prefix dimensions stored for coarse-to-fine semantic search "
+                    "(Matryoshka models such as text-embedding-3-*); disabled when unset"
+    )
+
     # BGE-IN-ICL Specific Configuration
     language: str = Field(
         default="auto",
@@ -167,6 +206,18 @@ class EmbeddingConfig(BaseSettings):
 
         return v
 
+    @field_validator('coarse_dimensions')
+    def validate_coarse_dimensions(cls, v: int | None, info) -> int | None:
+        """Reject truncation for models whose embeddings are not prefix-trained."""
+        if v is None:
+            return v
+
+        data = info.data or {}
+        if data.get('provider', 'openai') == 'openai' and data.get('model') == 'text-embedding-ada-002':
+            raise ValueError('coarse_dimensions requires a Matryoshka model such as text-embedding-3-small')
+
+        return v
+
     @field_validator('base_url')
     def validate_base_url(cls, v: str | None) -> str | None:
         """Validate and normalize base URL."""
@@ -42,6 +42,13 @@ class MCPConfig(BaseModel):
         default=False,
         description="Enable CORS for HTTP transport"
     )
+    
+    read_workers: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Searches and stats requests served concurrently, each on its own database cursor"
+    )
 
 
 class IndexingConfig(BaseModel):
@@ -86,8 +93,8 @@ class IndexingConfig(BaseModel):
     max_concurrent: int = Field(
         default=4,
         ge=1,
-        le=20,
-        description="Maximum concurrent file processing"
+        le=64,
+        description="Maximum concurrent file processing (parse worker processes)"
     )
     
     force_reindex: bool = Field(
@@ -108,6 +115,18 @@ class DatabaseConfig(BaseModel):
         default='.chunkhound.db',
         description="Path to SQLite database file"
     )
+    
+    regex_backend: Literal['sql', 'python'] = Field(
+        default='sql',
+        description="Regex search engine: DuckDB regexp_matches (RE2) or Python re over memory-mapped chunk text"
+    )
+    
+    regex_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Worker processes for the python regex backend"
+    )
 
 
 class ChunkHoundConfig(BaseSettings):
@@ -128,10 +147,12 @@ class ChunkHoundConfig(BaseSettings):
         CHUNKHOUND_EMBEDDING__PROVIDER=openai
         CHUNKHOUND_EMBEDDING__API_KEY=sk-...
         CHUNKHOUND_EMBEDDING__MODEL=text-embedding-3-small
+        CHUNKHOUND_EMBEDDING__QUERY_CACHE_PERSIST=true
         CHUNKHOUND_MCP__TRANSPORT=http
         CHUNKHOUND_MCP__PORT=3001
         CHUNKHOUND_INDEXING__WATCH=true
         CHUNKHOUND_DATABASE__PATH=custom.db
+        CHUNKHOUND_DATABASE__REGEX_BACKEND=python
         CHUNKHOUND_DEBUG=true
     """
     
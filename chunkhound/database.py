@@ -12,6 +12,7 @@ This maintains backward compatibility while using the new modular architecture.
 """
 
 import threading
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Any
 
@@ -145,7 +146,7 @@ class Database:
     # Search Methods - Delegate to SearchService
     # =============================================================================
 
-    def search_semantic(self, query_vector: list[float], provider: str, model: str, page_size: int = 10, offset: int = 0, threshold: float | None = None, path_filter: str | None = None) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    def search_semantic(self, query_vector: list[float], provider: str, model: str, page_size: int = 10, offset: int = 0, threshold: float | None = None, path_filter: str | None = None, cursor: str | None = None, include_total: bool = False) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """Perform semantic similarity search.
 
         Delegates to provider for actual search.
@@ -157,15 +158,56 @@ class Database:
             page_size=page_size,
             offset=offset,
             threshold=threshold,
-            path_filter=path_filter
+            path_filter=path_filter,
+            cursor=cursor,
+            include_total=include_total
         )
 
-    def search_regex(self, pattern: str, page_size: int = 10, offset: int = 0, path_filter: str | None = None) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    def search_regex(self, pattern: str, page_size: int = 10, offset: int = 0, path_filter: str | None = None, cursor: str | None = None, include_total: bool = False) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """Search code chunks using regex pattern.
 
         Delegates to provider for actual search.
         """
-        return self._provider.search_regex(pattern=pattern, page_size=page_size, offset=offset, path_filter=path_filter)
+        return self._provider.search_regex(
+            pattern=pattern,
+            page_size=page_size,
+            offset=offset,
+            path_filter=path_filter,
+            cursor=cursor,
+            include_total=include_total
+        )
+
+    def search_text(self, query: str, page_size: int = 10, offset: int = 0, path_filter: str | None = None, cursor: str | None = None, include_total: bool = False) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Search code chunks by keywords with BM25 ranking.
+
+        Delegates to provider for actual search.
+        """
+        return self._provider.search_text(
+            query=query,
+            page_size=page_size,
+            offset=offset,
+            path_filter=path_filter,
+            cursor=cursor,
+            include_total=include_total
+        )
+
+    def search_hybrid(self, query: str, query_vector: list[float] | None, provider: str | None = None, model: str | None = None, page_size: int = 10, offset: int = 0, path_filter: str | None = None, cursor: str | None = None, regex_pattern: str | None = None, include_total: bool = False) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Search code chunks by fusing semantic and keyword rankings.
+
+        Delegates to provider for actual search.
+        """
+        return self._provider.search_hybrid(
+            query=query,
+            query_embedding=query_vector,
+            provider=provider,
+            model=model,
+            page_size=page_size,
+            offset=offset,
+            path_filter=path_filter,
+            cursor=cursor,
+            regex_pattern=regex_pattern,
+            include_total=include_total
+        )
 
     # =============================================================================
     # Database Operations - Delegate to Provider
@@ -175,6 +217,34 @@ class Database:
         """Get database statistics."""
         return self._provider.get_stats()
 
+    def get_index_status(self) -> dict[str, Any]:
+        """Get vector index maintenance status (bulk mode, stale tables)."""
+        return self._provider.get_index_status()
+
+    def get_cached_embeddings(
+        self, provider: str, model: str, content_hashes: list[str], track_usage: bool = True
+    ) -> dict[str, list[float]]:
+        """Look up vectors in the content-addressed embedding cache."""
+        return self._provider.get_cached_embeddings(provider, model, content_hashes, track_usage)
+
+    def cache_embeddings(
+        self, provider: str, model: str, entries: list[tuple[str, list[float]]], evict: bool = True
+    ) -> int:
+        """Store (content_hash, vector) pairs in the content-addressed embedding cache."""
+        return self._provider.cache_embeddings(provider, model, entries, evict)
+
+    def set_embedding_storage(self, provider: str, model: str, dims: int, storage: str, keep_full: bool = True) -> None:
+        """Choose float, int8 or binary vector storage for an embedding partition."""
+        self._provider.set_embedding_storage(provider, model, dims, storage, keep_full)
+
+    def drop_embedding_partition(self, provider: str, model: str) -> int:
+        """Drop all stored vectors of a retired embedding provider/model."""
+        return self._provider.drop_embedding_partition(provider, model)
+
+    def get_pipeline_status(self) -> dict[str, Any]:
+        """Get per-stage queue depths of a running directory indexing pipeline."""
+        return self._indexing_coordinator.get_pipeline_status()
+
     def get_file_by_path(self, file_path: str) -> dict[str, Any] | None:
         """Get file record by path."""
         result = self._provider.get_file_by_path(file_path, as_model=False)
@@ -332,6 +402,15 @@ class Database:
         """Get database path."""
         return self._db_path
 
+    @property
+    def index_generation(self) -> int:
+        """Counter that changes on every write, reconnect or reattach."""
+        return self._provider.index_generation
+
+    def read_cursor(self) -> AbstractContextManager[None]:
+        """Context in which the calling thread's reads use its own database cursor."""
+        return self._provider.read_cursor()
+
     def get_file_discovery_cache_stats(self) -> dict[str, Any]:
         """Get file discovery cache statistics."""
         return self._file_discovery_cache.get_stats()
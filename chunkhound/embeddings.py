@@ -10,6 +10,8 @@ from typing import Any, Protocol
 import aiohttp
 from loguru import logger
 
+from .query_embedding_cache import QueryEmbeddingCache
+
 # Core domain models
 
 try:
@@ -539,9 +541,10 @@ class TEIProvider(OpenAICompatibleProvider):
 class EmbeddingManager:
     """Manages embedding providers and generation."""
 
-    def __init__(self) -> None:
+    def __init__(self, query_cache: QueryEmbeddingCache | None = None) -> None:
         self._providers: dict[str, EmbeddingProvider] = {}
         self._default_provider: str | None = None
+        self.query_cache = query_cache if query_cache is not None else QueryEmbeddingCache()
 
     def register_provider(self, provider: EmbeddingProvider, set_default: bool = False) -> None:
         """Register an embedding provider.
@@ -605,6 +608,27 @@ class EmbeddingManager:
             dims=provider.dims,
         )
 
+    async def embed_query(self, query: str, provider_name: str | None = None) -> list[float]:
+        """Embed a search query, reusing cached vectors for repeated queries.
+
+        Args:
+            query: Search query text
+            provider_name: Provider to use (uses default if None)
+
+        Returns:
+            Query embedding vector
+        """
+        provider = self.get_provider(provider_name)
+
+        cached = await self.query_cache.get(provider.name, provider.model, query)
+        if cached is not None:
+            return cached
+
+        embeddings = await provider.embed([query])
+        vector = embeddings[0]
+        await self.query_cache.put(provider.name, provider.model, query, vector)
+        return vector
+
 
 def create_openai_provider(
     api_key: str | None = None,
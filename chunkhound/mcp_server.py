@@ -9,7 +9,7 @@ import json
 import logging
 import os
 import sys
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
@@ -41,7 +41,10 @@ try:
     from .database import Database
     from .embeddings import EmbeddingManager
     from .file_watcher import FileWatcherManager
+    from .pagination import regex_cursor, semantic_cursor, text_cursor
     from .periodic_indexer import PeriodicIndexManager
+    from .query_embedding_cache import QueryEmbeddingCache
+    from .search_result_cache import SearchResultCache
     from .registry import configure_registry, get_registry
     from .signal_coordinator import SignalCoordinator
     from .task_coordinator import TaskCoordinator, TaskPriority
@@ -52,7 +55,10 @@ except ImportError:
     from chunkhound.database import Database
     from chunkhound.embeddings import EmbeddingManager
     from chunkhound.file_watcher import FileWatcherManager
+    from chunkhound.pagination import regex_cursor, semantic_cursor, text_cursor
     from chunkhound.periodic_indexer import PeriodicIndexManager
+    from chunkhound.query_embedding_cache import QueryEmbeddingCache
+    from chunkhound.search_result_cache import SearchResultCache
     from chunkhound.signal_coordinator import SignalCoordinator
     from chunkhound.task_coordinator import TaskCoordinator, TaskPriority
     from registry import configure_registry
@@ -66,6 +72,15 @@ _signal_coordinator: SignalCoordinator | None = None
 _task_coordinator: TaskCoordinator | None = None
 _periodic_indexer: PeriodicIndexManager | None = None
 
+# Ranked search results reused across pages until the index changes
+_search_result_cache = SearchResultCache()
+
+# Lazily loaded tiktoken encoding for response budgets (False once loading failed)
+_tokenizer: Any = None
+
+# Arguments that select a page or shape the response rather than the ranking
+_PAGING_ARGUMENTS = frozenset({"offset", "page_size", "cursor", "include_total", "max_response_tokens"})
+
 # Initialize MCP server with explicit stdio
 server = Server("ChunkHound Code Search")
 
@@ -85,12 +100,17 @@ def _build_mcp_registry_config(config: ChunkHoundConfig, db_path: Path) -> dict[
             'path': str(db_path),
             'type': 'duckdb',
             'batch_size': config.indexing.db_batch_size,
+            'regex_backend': config.database.regex_backend,
+            'regex_workers': config.database.regex_workers,
         },
         'embedding': {
             'batch_size': config.embedding.batch_size,
             'max_concurrent_batches': config.embedding.max_concurrent_batches,
             'provider': config.embedding.provider,
             'model': config.get_embedding_model(),
+            'coarse_dimensions': config.embedding.coarse_dimensions,
+            'cache_max_entries': config.embedding.cache_max_entries,
+            'cache_max_age_days': config.embedding.cache_max_age_days,
         }
     }
 
@@ -173,6 +193,14 @@ async def server_lifespan(server: Server) -> AsyncIterator[dict]:
             if missing_config and "CHUNKHOUND_DEBUG" in os.environ:
                 print(f"Server lifespan: Missing config (will use defaults): {missing_config}", file=sys.stderr)
 
+            # Repeated search queries reuse their embedding instead of calling the API
+            _embedding_manager.query_cache = QueryEmbeddingCache(
+                max_entries=unified_config.embedding.query_cache_size,
+                ttl_seconds=unified_config.embedding.query_cache_ttl,
+                run_store_read=_run_read,
+                run_store_write=_run_write,
+            )
+
             # Create provider using unified factory
             provider = EmbeddingProviderFactory.create_provider(unified_config.embedding)
             _embedding_manager.register_provider(provider, set_default=True)
@@ -224,6 +252,8 @@ async def server_lifespan(server: Server) -> AsyncIterator[dict]:
                     print(f"Server lifespan: IndexingCoordinator embedding provider available: {has_embedding_provider}", file=sys.stderr)
                 except Exception as debug_error:
                     print(f"Server lifespan: Debug check failed: {debug_error}", file=sys.stderr)
+            if unified_config is not None and unified_config.embedding.query_cache_persist:
+                _embedding_manager.query_cache.store = _database
         except Exception as db_error:
             if "CHUNKHOUND_DEBUG" in os.environ:
                 print(f"Server lifespan: Database connection error: {db_error}", file=sys.stderr)
@@ -237,7 +267,12 @@ async def server_lifespan(server: Server) -> AsyncIterator[dict]:
             print("Server lifespan: Signal coordination setup complete", file=sys.stderr)
 
         # Initialize task coordinator for priority-based operation processing
-        _task_coordinator = TaskCoordinator(max_queue_size=1000)
+        # Searches run on read workers with their own cursors; writes stay serialized
+        _task_coordinator = TaskCoordinator(
+            max_queue_size=1000,
+            read_workers=unified_config.mcp.read_workers if unified_config is not None else 4,
+            read_context=_database.read_cursor,
+        )
         await _task_coordinator.start()
         if "CHUNKHOUND_DEBUG" in os.environ:
             print("Server lifespan: Task coordinator initialized", file=sys.stderr)
@@ -516,8 +551,25 @@ async def process_file_change(file_path: Path, event_type: str):
         await _execute_file_processing()
 
 
+def _get_tokenizer():
+    """Shared tiktoken encoding, or None when tiktoken or its BPE file is unavailable."""
+    global _tokenizer
+    if _tokenizer is None:
+        _tokenizer = False
+        try:
+            import tiktoken
+            _tokenizer = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            # Missing package, or no network to fetch the encoding on first use
+            pass
+    return _tokenizer or None
+
+
 def estimate_tokens(text: str) -> int:
-    """Estimate token count using simple heuristic (3 chars ≈ 1 token for safety)."""
+    """Count tokens with tiktoken, or estimate them (3 chars ≈ 1 token for safety)."""
+    tokenizer = _get_tokenizer()
+    if tokenizer is not None:
+        return len(tokenizer.encode(text, disallowed_special=()))
     return len(text) // 3
 
 
@@ -540,57 +592,84 @@ def truncate_code(code: str, max_chars: int = 1000) -> tuple[str, bool]:
     return '\n'.join(truncated_lines) + '\n...', True
 
 
-def limit_response_size(response_data: dict[str, Any], max_tokens: int) -> dict[str, Any]:
-    """Limit response size to fit within token limits by reducing results."""
-    if not response_data.get("results"):
-        return response_data
+def _next_page_cursor(result: dict[str, Any]) -> str:
+    """Keyset cursor positioned after a result of any search tool."""
+    if "similarity" in result:
+        return semantic_cursor(result)
+    if "score" in result:
+        return text_cursor(result)
+    return regex_cursor(result)
 
-    # Start with full response and iteratively reduce until under limit
-    limited_results = response_data["results"][:]
 
-    while limited_results:
-        # Create test response with current results
-        test_response = {
-            "results": limited_results,
-            "pagination": response_data["pagination"]
-        }
+def _page_pagination(pagination: dict[str, Any], kept: list[dict[str, Any]], total_results: int) -> dict[str, Any]:
+    """Pagination metadata for the results that made it into the response."""
+    if not total_results:
+        return pagination
 
-        # Estimate token count
-        response_text = json.dumps(test_response, default=str)
-        token_count = estimate_tokens(response_text)
-
-        if token_count <= max_tokens:
-            # Update pagination to reflect actual returned results
-            actual_count = len(limited_results)
-            updated_pagination = response_data["pagination"].copy()
-            updated_pagination["page_size"] = actual_count
-            updated_pagination["has_more"] = (
-                updated_pagination.get("has_more", False) or
-                actual_count < len(response_data["results"])
-            )
-            if actual_count < len(response_data["results"]):
-                updated_pagination["next_offset"] = updated_pagination.get("offset", 0) + actual_count
+    updated_pagination = dict(pagination, page_size=len(kept))
+    if len(kept) < total_results:
+        updated_pagination["has_more"] = True
+        updated_pagination["next_offset"] = updated_pagination.get("offset", 0) + len(kept)
+        if "next_cursor" in updated_pagination:
+            updated_pagination["next_cursor"] = _next_page_cursor(kept[-1]) if kept else pagination.get("next_cursor")
+    return updated_pagination
 
-            return {
-                "results": limited_results,
-                "pagination": updated_pagination
-            }
 
-        # Remove results from the end to reduce size
-        # Remove in chunks for efficiency
-        reduction_size = max(1, len(limited_results) // 4)
-        limited_results = limited_results[:-reduction_size]
+def build_search_response(results: list[dict[str, Any]], pagination: dict[str, Any], max_tokens: int) -> str:
+    """Serialize a search page, keeping as many results as fit within max_tokens.
 
-    # If even empty results exceed token limit, return minimal response
-    return {
-        "results": [],
-        "pagination": {
-            "offset": response_data["pagination"].get("offset", 0),
-            "page_size": 0,
-            "has_more": len(response_data["results"]) > 0,
-            "total": response_data["pagination"].get("total", 0)
-        }
-    }
+    Each result is serialized and counted once, in ranking order. The first
+    result that does not fit gets its content cut down with truncate_code to
+    the remaining budget (marked content_truncated) rather than being dropped;
+    it and everything after it that does not fit are left for the next page.
+    """
+    # Rewritten pagination may carry a cursor as long as the one of any result
+    reserve = estimate_tokens(json.dumps({"results": [], "pagination": pagination}, default=str))
+    if results:
+        reserve += estimate_tokens(_next_page_cursor(results[0])) * 2 + 16
+    budget = max_tokens - reserve
+
+    pieces: list[str] = []
+    kept: list[dict[str, Any]] = []
+    costs: list[int] = []
+    for result in results:
+        piece = json.dumps(result, default=str)
+        # Two extra tokens for the ", " separator
+        cost = estimate_tokens(piece) + 2
+        truncated = cost > budget
+        if truncated:
+            content = result.get("content")
+            if isinstance(content, str) and content:
+                bare = {**result, "content": "", "content_truncated": True}
+                bare_cost = estimate_tokens(json.dumps(bare, default=str)) + 2
+                # Convert the remaining tokens to characters at this content's own
+                # density, less a margin as cutting at a line break shifts it slightly
+                max_chars = int(0.9 * (budget - bare_cost) * len(content) / max(1, cost - bare_cost))
+                if max_chars >= 200:
+                    code, _ = truncate_code(content, max_chars)
+                    result = {**bare, "content": code}
+                    piece = json.dumps(result, default=str)
+                    cost = estimate_tokens(piece) + 2
+            if cost > budget:
+                break
+        pieces.append(piece)
+        kept.append(result)
+        costs.append(cost)
+        budget -= cost
+        if truncated:
+            break
+
+    # The reserve covers real cursors; this only trims if a path was unusually long
+    while True:
+        pagination_text = json.dumps(_page_pagination(pagination, kept, len(results)), default=str)
+        envelope = estimate_tokens(f'{{"results": [], "pagination": {pagination_text}}}')
+        if not kept or sum(costs) + envelope <= max_tokens:
+            break
+        costs.pop()
+        pieces.pop()
+        kept.pop()
+
+    return f'{{"results": [{", ".join(pieces)}], "pagination": {pagination_text}}}'
 
 
 def convert_to_ndjson(results: list[dict[str, Any]]) -> str:
@@ -601,6 +680,65 @@ def convert_to_ndjson(results: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
+async def _run_read(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking database read on a read worker cursor, or inline without a coordinator."""
+    if _task_coordinator:
+        return await _task_coordinator.run_read(func, *args, **kwargs)
+    return func(*args, **kwargs)
+
+
+async def _run_write(func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """Queue a blocking database write on the write lane without waiting for it, or run it inline."""
+    if _task_coordinator:
+        await _task_coordinator.queue_task_nowait(TaskPriority.LOW, func, *args, **kwargs)
+        return
+    func(*args, **kwargs)
+
+
+async def _cached_search(
+    tool: str,
+    arguments: dict[str, Any],
+    offset: int,
+    page_size: int,
+    cursor: str | None,
+    include_total: bool,
+    cursor_fn: Callable[[dict[str, Any]], str],
+    search: Callable[[int, int], Awaitable[tuple[list[dict[str, Any]], dict[str, Any]]]],
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Serve an offset page from the search result cache, running the search on a miss.
+
+    Args:
+        tool: Tool name, part of the cache key
+        arguments: Tool arguments; all but the paging ones are part of the cache key
+        offset: Number of results to skip
+        page_size: Number of results to return
+        cursor: Keyset cursor; cursor pages always go to the database
+        include_total: Whether the total match count is needed
+        cursor_fn: Builds next_cursor from the last result of a page
+        search: Runs the search for (page_size, offset)
+
+    Returns:
+        (results, pagination) as returned by the database search methods
+    """
+    if cursor:
+        return await search(page_size, offset)
+
+    key = json.dumps(
+        [tool, {k: v for k, v in arguments.items() if k not in _PAGING_ARGUMENTS}],
+        sort_keys=True, default=str
+    )
+    # Read before searching so a concurrent write can only make the entry look stale
+    generation = _database.index_generation
+    page = _search_result_cache.get_page(key, generation, offset, page_size, include_total, cursor_fn)
+    if page is not None:
+        return page
+
+    results, pagination = await search(_search_result_cache.window(offset, page_size), 0)
+    return _search_result_cache.put(
+        key, generation, results, pagination, offset, page_size, include_total, cursor_fn
+    )
+
+
 @server.call_tool()
 async def call_tool(
     name: str, arguments: dict
@@ -618,6 +756,8 @@ async def call_tool(
         offset = max(0, arguments.get("offset", 0))
         max_tokens = max(1000, min(arguments.get("max_response_tokens", 20000), 25000))
         path_filter = arguments.get("path")
+        cursor = arguments.get("cursor")
+        include_total = bool(arguments.get("include_total", False))
 
         async def _execute_regex_search():
             # Check connection instead of forcing reconnection (fixes race condition)
@@ -626,31 +766,23 @@ async def call_tool(
                     print("Database not connected, reconnecting before regex search", file=sys.stderr)
                 _database.reconnect()
 
-            results, pagination = _database.search_regex(pattern=pattern, page_size=page_size, offset=offset, path_filter=path_filter)
+            async def _search(limit: int, start: int):
+                return await _run_read(
+                    _database.search_regex,
+                    pattern=pattern,
+                    page_size=limit,
+                    offset=start,
+                    path_filter=path_filter,
+                    cursor=cursor,
+                    include_total=include_total
+                )
 
-            # Format response with pagination metadata
-            response_data = {
-                "results": results,
-                "pagination": pagination
-            }
+            results, pagination = await _cached_search(
+                name, arguments, offset, page_size, cursor, include_total, regex_cursor, _search
+            )
 
-            # Apply response size limiting
-            limited_response = limit_response_size(response_data, max_tokens)
-            response_text = json.dumps(limited_response, default=str)
-
-            # Final safety check - ensure we never exceed MCP limit
-            if estimate_tokens(response_text) > 25000:
-                # Emergency fallback - return minimal response
-                emergency_response = {
-                    "results": [],
-                    "pagination": {
-                        "offset": offset,
-                        "page_size": 0,
-                        "has_more": True,
-                        "total": limited_response["pagination"].get("total", 0)
-                    }
-                }
-                response_text = json.dumps(emergency_response, default=str)
+            # Serialize once, trimming results to the token budget
+            response_text = build_search_response(results, pagination, max_tokens)
 
             return [types.TextContent(type="text", text=response_text)]
 
@@ -662,6 +794,50 @@ async def call_tool(
         except Exception as e:
             raise Exception(f"Search failed: {str(e)}")
 
+    elif name == "search_text":
+        query = arguments.get("query", "")
+        page_size = max(1, min(arguments.get("page_size", 10), 100))
+        offset = max(0, arguments.get("offset", 0))
+        max_tokens = max(1000, min(arguments.get("max_response_tokens", 20000), 25000))
+        path_filter = arguments.get("path")
+        cursor = arguments.get("cursor")
+        include_total = bool(arguments.get("include_total", False))
+
+        async def _execute_text_search():
+            # Check connection instead of forcing reconnection (fixes race condition)
+            if _database and not _database.is_connected():
+                if "CHUNKHOUND_DEBUG" in os.environ:
+                    print("Database not connected, reconnecting before text search", file=sys.stderr)
+                _database.reconnect()
+
+            async def _search(limit: int, start: int):
+                return await _run_read(
+                    _database.search_text,
+                    query=query,
+                    page_size=limit,
+                    offset=start,
+                    path_filter=path_filter,
+                    cursor=cursor,
+                    include_total=include_total
+                )
+
+            results, pagination = await _cached_search(
+                name, arguments, offset, page_size, cursor, include_total, text_cursor, _search
+            )
+
+            # Serialize once, trimming results to the token budget
+            response_text = build_search_response(results, pagination, max_tokens)
+
+            return [types.TextContent(type="text", text=response_text)]
+
+        try:
+            if _task_coordinator:
+                return await _task_coordinator.queue_task(TaskPriority.HIGH, _execute_text_search)
+            else:
+                return await _execute_text_search()
+        except Exception as e:
+            raise Exception(f"Text search failed: {str(e)}")
+
     elif name == "search_semantic":
         query = arguments.get("query", "")
         page_size = max(1, min(arguments.get("page_size", 10), 100))
@@ -671,6 +847,8 @@ async def call_tool(
         model = arguments.get("model", "text-embedding-3-small")
         threshold = arguments.get("threshold")
         path_filter = arguments.get("path")
+        cursor = arguments.get("cursor")
+        include_total = bool(arguments.get("include_total", False))
 
         if not _embedding_manager or not _embedding_manager.list_providers():
             raise Exception("No embedding providers available. Set OPENAI_API_KEY to enable semantic search.")
@@ -687,45 +865,31 @@ async def call_tool(
             try:
                 # Use asyncio.wait_for with MCP-safe timeout (12 seconds)
                 # This is shorter than OpenAI's 30s timeout but allows most requests to complete
-                result = await asyncio.wait_for(
-                    _embedding_manager.embed_texts([query], provider),
-                    timeout=12.0
+                async def _search(limit: int, start: int):
+                    query_vector = await asyncio.wait_for(
+                        _embedding_manager.embed_query(query, provider),
+                        timeout=12.0
+                    )
+                    return await _run_read(
+                        _database.search_semantic,
+                        query_vector=query_vector,
+                        provider=provider,
+                        model=model,
+                        page_size=limit,
+                        offset=start,
+                        threshold=threshold,
+                        path_filter=path_filter,
+                        cursor=cursor,
+                        include_total=include_total
+                    )
+
+                # Later pages of a cached search skip the embedding call as well
+                results, pagination = await _cached_search(
+                    name, arguments, offset, page_size, cursor, include_total, semantic_cursor, _search
                 )
-                query_vector = result.embeddings[0]
 
-                results, pagination = _database.search_semantic(
-                    query_vector=query_vector,
-                    provider=provider,
-                    model=model,
-                    page_size=page_size,
-                    offset=offset,
-                    threshold=threshold,
-                    path_filter=path_filter
-                )
-
-                # Format response with pagination metadata
-                response_data = {
-                    "results": results,
-                    "pagination": pagination
-                }
-
-                # Apply response size limiting
-                limited_response = limit_response_size(response_data, max_tokens)
-                response_text = json.dumps(limited_response, default=str)
-
-                # Final safety check - ensure we never exceed MCP limit
-                if estimate_tokens(response_text) > 25000:
-                    # Emergency fallback - return minimal response
-                    emergency_response = {
-                        "results": [],
-                        "pagination": {
-                            "offset": offset,
-                            "page_size": 0,
-                            "has_more": True,
-                            "total": limited_response["pagination"].get("total", 0)
-                        }
-                    }
-                    response_text = json.dumps(emergency_response, default=str)
+                # Serialize once, trimming results to the token budget
+                response_text = build_search_response(results, pagination, max_tokens)
 
                 return [types.TextContent(type="text", text=response_text)]
 
@@ -741,9 +905,76 @@ async def call_tool(
         except Exception as e:
             raise Exception(f"Semantic search failed: {str(e)}")
 
+    elif name == "search_hybrid":
+        query = arguments.get("query", "")
+        page_size = max(1, min(arguments.get("page_size", 10), 100))
+        offset = max(0, arguments.get("offset", 0))
+        max_tokens = max(1000, min(arguments.get("max_response_tokens", 20000), 25000))
+        provider = arguments.get("provider", "openai")
+        model = arguments.get("model", "text-embedding-3-small")
+        regex_pattern = arguments.get("pattern")
+        path_filter = arguments.get("path")
+        cursor = arguments.get("cursor")
+        include_total = bool(arguments.get("include_total", False))
+
+        async def _execute_hybrid_search():
+            # Check connection instead of forcing reconnection (fixes race condition)
+            if _database and not _database.is_connected():
+                if "CHUNKHOUND_DEBUG" in os.environ:
+                    print("Database not connected, reconnecting before hybrid search", file=sys.stderr)
+                _database.reconnect()
+
+            async def _search(limit: int, start: int):
+                # Without embedding providers the keyword leg alone ranks the results
+                query_vector = None
+                if _embedding_manager and _embedding_manager.list_providers():
+                    try:
+                        # Same MCP-safe timeout as semantic search
+                        query_vector = await asyncio.wait_for(
+                            _embedding_manager.embed_query(query, provider),
+                            timeout=12.0
+                        )
+                    except asyncio.TimeoutError:
+                        raise Exception("Hybrid search timed out while embedding the query. Please try again.")
+
+                return await _run_read(
+                    _database.search_hybrid,
+                    query=query,
+                    query_vector=query_vector,
+                    provider=provider,
+                    model=model,
+                    page_size=limit,
+                    offset=start,
+                    path_filter=path_filter,
+                    cursor=cursor,
+                    regex_pattern=regex_pattern,
+                    include_total=include_total
+                )
+
+            results, pagination = await _cached_search(
+                name, arguments, offset, page_size, cursor, include_total, text_cursor, _search
+            )
+
+            # Serialize once, trimming results to the token budget
+            response_text = build_search_response(results, pagination, max_tokens)
+
+            return [types.TextContent(type="text", text=response_text)]
+
+        try:
+            if _task_coordinator:
+                return await _task_coordinator.queue_task(TaskPriority.HIGH, _execute_hybrid_search)
+            else:
+                return await _execute_hybrid_search()
+        except Exception as e:
+            raise Exception(f"Hybrid search failed: {str(e)}")
+
     elif name == "get_stats":
         async def _execute_get_stats():
-            stats = _database.get_stats()
+            stats = await _run_read(_database.get_stats)
+            stats['vector_index_status'] = await _run_read(_database.get_index_status)
+            if _embedding_manager:
+                stats['query_embedding_cache'] = _embedding_manager.query_cache.get_stats()
+            stats['search_result_cache'] = _search_result_cache.get_stats()
             if _task_coordinator:
                 # Add task coordinator stats
                 stats['task_coordinator'] = _task_coordinator.get_stats()
@@ -794,11 +1025,30 @@ async def list_tools() -> list[types.Tool]:
                     "page_size": {"type": "integer", "description": "Number of results per page (1-100)", "default": 10},
                     "offset": {"type": "integer", "description": "Starting position for pagination", "default": 0},
                     "max_response_tokens": {"type": "integer", "description": "Maximum response size in tokens (1000-25000)", "default": 20000},
-                    "path": {"type": "string", "description": "Optional relative path to limit search scope (e.g., 'src/', 'tests/')"}
+                    "path": {"type": "string", "description": "Optional relative path to limit search scope (e.g., 'src/', 'tests/')"},
+                    "cursor": {"type": "string", "description": "next_cursor from the previous page; continues after its last result (takes precedence over offset)"},
+                    "include_total": {"type": "boolean", "description": "Count all matches and include the exact total (slower: scans every candidate chunk)", "default": False}
                 },
                 "required": ["pattern"]
             }
         ),
+        types.Tool(
+            name="search_text",
+            description="Search code by keywords and identifiers with BM25 ranking (camelCase and snake_case names are split into words) and pagination support.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Keywords or identifiers to search for"},
+                    "page_size": {"type": "integer", "description": "Number of results per page (1-100)", "default": 10},
+                    "offset": {"type": "integer", "description": "Starting position for pagination", "default": 0},
+                    "max_response_tokens": {"type": "integer", "description": "Maximum response size in tokens (1000-25000)", "default": 20000},
+                    "path": {"type": "string", "description": "Optional relative path to limit search scope (e.g., 'src/', 'tests/')"},
+                    "cursor": {"type": "string", "description": "next_cursor from the previous page; continues after its last result (takes precedence over offset)"},
+                    "include_total": {"type": "boolean", "description": "Include the exact number of matching chunks", "default": False}
+                },
+                "required": ["query"]
+            }
+        ),
         types.Tool(
             name="search_semantic",
             description="Search code using semantic similarity with pagination support.",
@@ -812,14 +1062,36 @@ async def list_tools() -> list[types.Tool]:
                     "provider": {"type": "string", "description": "Embedding provider to use", "default": "openai"},
                     "model": {"type": "string", "description": "Embedding model to use", "default": "text-embedding-3-small"},
                     "threshold": {"type": "number", "description": "Distance threshold for filtering results (optional)"},
-                    "path": {"type": "string", "description": "Optional relative path to limit search scope (e.g., 'src/', 'tests/')"}
+                    "path": {"type": "string", "description": "Optional relative path to limit search scope (e.g., 'src/', 'tests/')"},
+                    "cursor": {"type": "string", "description": "next_cursor from the previous page; continues after its last result (takes precedence over offset)"},
+                    "include_total": {"type": "boolean", "description": "Include an estimated total result count", "default": False}
+                },
+                "required": ["query"]
+            }
+        ),
+        types.Tool(
+            name="search_hybrid",
+            description="Search code by meaning and keywords at once: semantic and BM25 rankings fused with reciprocal rank fusion, with pagination support. Falls back to keywords alone when no embedding provider is available.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Natural language or keyword search query"},
+                    "page_size": {"type": "integer", "description": "Number of results per page (1-100)", "default": 10},
+                    "offset": {"type": "integer", "description": "Starting position for pagination", "default": 0},
+                    "max_response_tokens": {"type": "integer", "description": "Maximum response size in tokens (1000-25000)", "default": 20000},
+                    "provider": {"type": "string", "description": "Embedding provider to use", "default": "openai"},
+                    "model": {"type": "string", "description": "Embedding model to use", "default": "text-embedding-3-small"},
+                    "pattern": {"type": "string", "description": "Optional regular expression every result must match"},
+                    "path": {"type": "string", "description": "Optional relative path to limit search scope (e.g., 'src/', 'tests/')"},
+                    "cursor": {"type": "string", "description": "next_cursor from the previous page; continues after its last result (takes precedence over offset)"},
+                    "include_total": {"type": "boolean", "description": "Include the number of fused candidates", "default": False}
                 },
                 "required": ["query"]
             }
         ),
         types.Tool(
             name="get_stats",
-            description="Get database statistics including file, chunk, and embedding counts",
+            description="Get database statistics including file, chunk, and embedding counts and vector index staleness",
             inputSchema={
                 "type": "object",
                 "properties": {}
@@ -1046,9 +1318,69 @@ async def handle_mcp_with_validation():
             )
 
 
+async def run_http_server(host: str, port: int, cors: bool = False) -> None:
+    """Serve MCP over streamable HTTP so one process serves many clients.
+
+    Every client gets its own MCP session (Mcp-Session-Id header) on the /mcp
+    endpoint: POST carries JSON-RPC requests, answered as JSON or an SSE
+    stream, and GET opens an SSE stream for server notifications. All sessions
+    share the database, embedding manager, caches and task coordinator set up
+    once by server_lifespan.
+
+    Args:
+        host: Interface to bind
+        port: TCP port to listen on
+        cors: Allow cross-origin requests from browser-based clients
+    """
+    try:
+        import uvicorn
+        from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+        from starlette.applications import Starlette
+        from starlette.middleware.cors import CORSMiddleware
+        from starlette.routing import Route
+    except ImportError as e:
+        raise RuntimeError(
+            f"HTTP transport requires mcp>=1.8 with its starlette and uvicorn dependencies: {e}"
+        ) from e
+
+    session_manager = StreamableHTTPSessionManager(app=server)
+
+    class MCPEndpoint:
+        """Raw ASGI endpoint, so Starlette hands the session manager scope/receive/send."""
+
+        async def __call__(self, scope, receive, send) -> None:
+            await session_manager.handle_request(scope, receive, send)
+
+    @asynccontextmanager
+    async def http_lifespan(app: Any) -> AsyncIterator[None]:
+        async with server_lifespan(server), session_manager.run():
+            print(f"ChunkHound MCP server listening on http://{host}:{port}/mcp", file=sys.stderr)
+            yield
+
+    app: Any = Starlette(
+        routes=[Route("/mcp", endpoint=MCPEndpoint(), methods=["GET", "POST", "DELETE"])],
+        lifespan=http_lifespan,
+    )
+    if cors:
+        app = CORSMiddleware(
+            app,
+            allow_origins=["*"],
+            allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+            allow_headers=["*"],
+            expose_headers=["Mcp-Session-Id"],
+        )
+
+    http_server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+    await http_server.serve()
+
+
 async def main():
     """Main entry point for the MCP server with robust error handling."""
-    await handle_mcp_with_validation()
+    mcp_config = ChunkHoundConfig.load_hierarchical().mcp
+    if mcp_config.transport == "http":
+        await run_http_server(mcp_config.host, mcp_config.port, mcp_config.cors)
+    else:
+        await handle_mcp_with_validation()
 
 
 if __name__ == "__main__":
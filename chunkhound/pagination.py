@@ -0,0 +1,61 @@
+"""Opaque pagination cursors for keyset-paginated search results."""
+
+import base64
+import json
+from typing import Any
+
+
+def encode_cursor(position: dict[str, Any]) -> str:
+    """Encode a result position as an opaque, URL-safe cursor string.
+
+    Args:
+        position: JSON-serializable sort key of the last returned row
+
+    Returns:
+        Cursor string to hand back to the client
+    """
+    payload = json.dumps(position, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, required_keys: tuple[str, ...] = ()) -> dict[str, Any]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+        required_keys: Keys the position must contain
+
+    Returns:
+        Decoded position
+
+    Raises:
+        ValueError: If the cursor is malformed or lacks a required key
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+
+    if not isinstance(position, dict) or any(key not in position for key in required_keys):
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}")
+    return position
+
+
+def semantic_cursor(result: dict[str, Any]) -> str:
+    """Cursor positioned after a semantic search result (similarity DESC, chunk_id ASC)."""
+    return encode_cursor({"similarity": result["similarity"], "chunk_id": result["chunk_id"]})
+
+
+def regex_cursor(result: dict[str, Any]) -> str:
+    """Cursor positioned after a regex search result (file_path, start_line, chunk_id ASC)."""
+    return encode_cursor({
+        "file_path": result["file_path"],
+        "start_line": result["start_line"],
+        "chunk_id": result["chunk_id"],
+    })
+
+
+def text_cursor(result: dict[str, Any]) -> str:
+    """Cursor positioned after a keyword search result (score DESC, chunk_id ASC)."""
+    return encode_cursor({"score": result["score"], "chunk_id": result["chunk_id"]})
@@ -105,7 +105,7 @@ class CodeParser:
             # Cache miss - parse and cache
             tree = self._parse_tree_directly(file_path, source_code)
             if tree:
-                self.tree_cache.put(file_path, tree)
+                self.tree_cache.put(file_path, tree, source_code.encode('utf-8'))
             return tree
         else:
             # Fallback: parse directly without cache
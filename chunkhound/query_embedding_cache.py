@@ -0,0 +1,187 @@
+"""
+Query Embedding Cache for repeated semantic searches.
+
+Agents repeat identical search queries constantly within a session, and each
+semantic search otherwise pays an embedding API round trip. This module keeps
+query text -> vector in an LRU bounded by size and age, optionally backed by
+the database's content-addressed embedding cache so vectors survive restarts.
+Persisted query vectors are kept out of the chunk cache's hit/miss counters and
+recency tracking, and the store calls can be routed off the event loop.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
+
+from loguru import logger
+
+from core.models import chunk_content_hash
+
+
+class EmbeddingCacheStore(Protocol):
+    """Persistent content-addressed embedding cache (implemented by the database)."""
+
+    def get_cached_embeddings(
+        self, provider: str, model: str, content_hashes: list[str], track_usage: bool = True
+    ) -> dict[str, list[float]]:
+        ...
+
+    def cache_embeddings(
+        self, provider: str, model: str, entries: list[tuple[str, list[float]]], evict: bool = True
+    ) -> int:
+        ...
+
+
+StoreRunner = Callable[..., Awaitable[Any]]
+
+
+async def _run_inline(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return func(*args, **kwargs)
+
+
+class QueryEmbeddingCache:
+    """LRU cache of query embeddings keyed by provider, model and query text."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: int = 3600,
+        store: EmbeddingCacheStore | None = None,
+        run_store_read: StoreRunner = _run_inline,
+        run_store_write: StoreRunner = _run_inline,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of query vectors kept in memory; 0 disables caching
+            ttl_seconds: Time-to-live for in-memory entries in seconds; 0 never expires
+            store: Optional persistent cache consulted on memory misses and written
+                on new embeddings
+            run_store_read: Awaitable runner for store lookups, called as
+                run_store_read(func, *args); defaults to calling inline
+            run_store_write: Awaitable runner for store writes, same signature
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        self.run_store_read = run_store_read
+        self.run_store_write = run_store_write
+
+        # Cache structure: (provider, model, query hash) -> (vector, timestamp)
+        self._cache: OrderedDict[tuple[str, str, str], tuple[list[float], float]] = OrderedDict()
+
+        # Statistics for monitoring
+        self.stats = {
+            'hits': 0,
+            'store_hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """Whether lookups can hit at all."""
+        return self.max_entries > 0 or self.store is not None
+
+    async def get(self, provider: str, model: str, query: str) -> list[float] | None:
+        """Look up the embedding of a query.
+
+        Args:
+            provider: Embedding provider name
+            model: Embedding model name
+            query: Query text; line endings and surrounding whitespace are ignored
+
+        Returns:
+            Cached vector, or None on a miss
+        """
+        query_hash = chunk_content_hash(query)
+        key = (provider, model, query_hash)
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            vector, timestamp = entry
+            if self.ttl_seconds and time.time() - timestamp > self.ttl_seconds:
+                del self._cache[key]
+                self.stats['expirations'] += 1
+            else:
+                self._cache.move_to_end(key)
+                self.stats['hits'] += 1
+                return vector
+
+        if self.store is not None:
+            try:
+                found = await self.run_store_read(
+                    self.store.get_cached_embeddings, provider, model, [query_hash], track_usage=False
+                )
+                stored = found.get(query_hash)
+            except Exception as e:
+                logger.warning(f"Failed to read persisted query embedding: {e}")
+                stored = None
+            if stored is not None:
+                self.stats['store_hits'] += 1
+                vector = list(stored)
+                self._remember(key, vector)
+                return vector
+
+        self.stats['misses'] += 1
+        return None
+
+    async def put(self, provider: str, model: str, query: str, vector: list[float]) -> None:
+        """Store a freshly generated query embedding.
+
+        Args:
+            provider: Embedding provider name
+            model: Embedding model name
+            query: Query text
+            vector: Embedding of the query
+        """
+        query_hash = chunk_content_hash(query)
+        self._remember((provider, model, query_hash), vector)
+
+        if self.store is not None:
+            # Query and chunk vectors share the content-addressed table: the same
+            # text embeds to the same vector with the same model. Eviction is left
+            # to chunk writes so a search never pays for a full eviction pass.
+            try:
+                await self.run_store_write(
+                    self.store.cache_embeddings, provider, model, [(query_hash, vector)], evict=False
+                )
+            except Exception as e:
+                logger.warning(f"Failed to persist query embedding: {e}")
+
+    def clear(self) -> None:
+        """Clear all in-memory entries."""
+        count = len(self._cache)
+        self._cache.clear()
+        self.stats['evictions'] += count
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, size and hit rate
+        """
+        hits = self.stats['hits'] + self.stats['store_hits']
+        total_requests = hits + self.stats['misses']
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            **self.stats,
+            'cache_size': len(self._cache),
+            'max_entries': self.max_entries,
+            'persistent': self.store is not None,
+            'hit_rate_percent': round(hit_rate, 2)
+        }
+
+    def _remember(self, key: tuple[str, str, str], vector: list[float]) -> None:
+        """Insert an entry, evicting the least recently used beyond max_entries."""
+        if self.max_entries <= 0:
+            return
+
+        self._cache[key] = (vector, time.time())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self.stats['evictions'] += 1
@@ -0,0 +1,165 @@
+"""Compile regular expressions into trigram queries for candidate chunk lookup.
+
+A trigram query is a boolean tree over trigrams that every match of the regex
+must contain (as in Google Code Search / zoekt). Chunks whose code lacks the
+required trigrams cannot match, so only the remaining candidates need to be
+verified with the real regex.
+
+Trigrams are case-folded, and only ASCII trigrams are used in queries so that
+Python and DuckDB case folding always agree.
+
+Patterns are parsed with Python's regex parser. For DuckDB (RE2) patterns that
+is only safe where both dialects read the same literals: RE2 bracket
+expressions such as [[:space:]] look to Python like a class followed by a
+literal "]", so such patterns get no trigram query and are fully scanned.
+"""
+
+import re
+from typing import Any
+
+try:
+    import re._constants as sre_constants  # type: ignore[import-not-found]
+    import re._parser as sre_parse  # type: ignore[import-not-found]
+except ImportError:  # Python < 3.11
+    import sre_constants  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
+# Query nodes: ("tri", trigram), ("and", [nodes]), ("or", [nodes]); None matches all
+TrigramQuery = tuple[str, Any] | None
+
+_LITERAL = sre_constants.LITERAL
+_SUBPATTERN = sre_constants.SUBPATTERN
+_BRANCH = sre_constants.BRANCH
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+_ZERO_WIDTH = (sre_constants.AT,)
+_POSSESSIVE_REPEAT = getattr(sre_constants, "POSSESSIVE_REPEAT", None)
+_ATOMIC_GROUP = getattr(sre_constants, "ATOMIC_GROUP", None)
+
+# POSIX classes, collating elements and equivalence classes ([:alpha:], [.a.], [=a=])
+_RE2_BRACKET_EXPRESSION = re.compile(r"\[[:.=]")
+
+
+def extract_trigrams(text: str) -> set[str]:
+    """Case-folded ASCII trigrams of a literal string."""
+    folded = text.lower()
+    return {
+        folded[i:i + 3]
+        for i in range(len(folded) - 2)
+        if folded[i:i + 3].isascii()
+    }
+
+
+def regex_trigram_query(pattern: str, backend: str = "sql") -> TrigramQuery:
+    """Build the trigram query every match of pattern must satisfy.
+
+    Args:
+        pattern: Regular expression (Python/RE2 common syntax)
+        backend: Engine that runs the pattern: "sql" (DuckDB's RE2) or "python" (re)
+
+    Returns:
+        Query tree, or None when the pattern requires no trigram (or cannot be
+        parsed, or may be read differently by RE2), in which case every chunk is
+        a candidate
+    """
+    if backend == "sql" and _RE2_BRACKET_EXPRESSION.search(pattern):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+    return _simplify(_sequence_query(list(parsed)))
+
+
+def _and(nodes: list[TrigramQuery]) -> TrigramQuery:
+    required = [node for node in nodes if node is not None]
+    if not required:
+        return None
+    return required[0] if len(required) == 1 else ("and", required)
+
+
+def _literal_run_query(run: list[str]) -> TrigramQuery:
+    return _and([("tri", trigram) for trigram in sorted(extract_trigrams("".join(run)))])
+
+
+def _sequence_query(items: list[tuple[Any, Any]]) -> TrigramQuery:
+    """Trigrams required by a concatenation: literal runs plus required sub-parts."""
+    parts: list[TrigramQuery] = []
+    run: list[str] = []
+
+    for op, arg in items:
+        if op == _LITERAL:
+            run.append(chr(arg))
+            continue
+        if op in _ZERO_WIDTH:
+            # Anchors and boundaries do not consume text, so the run continues
+            continue
+
+        parts.append(_literal_run_query(run))
+        run = []
+
+        if op == _SUBPATTERN:
+            parts.append(_sequence_query(list(arg[-1])))
+        elif _ATOMIC_GROUP is not None and op == _ATOMIC_GROUP:
+            parts.append(_sequence_query(list(arg)))
+        elif op in _REPEATS or (_POSSESSIVE_REPEAT is not None and op == _POSSESSIVE_REPEAT):
+            min_count, _, body = arg
+            if min_count >= 1:
+                parts.append(_sequence_query(list(body)))
+        elif op == _BRANCH:
+            alternatives = [_sequence_query(list(branch)) for branch in arg[1]]
+            if all(alternative is not None for alternative in alternatives):
+                parts.append(("or", alternatives))
+        # Character classes, wildcards, backreferences, lookarounds: no requirement
+
+    parts.append(_literal_run_query(run))
+    return _and(parts)
+
+
+def _simplify(node: TrigramQuery) -> TrigramQuery:
+    """Flatten nested and/or nodes of the same kind."""
+    if node is None or node[0] == "tri":
+        return node
+    kind, children = node
+    flat: list[TrigramQuery] = []
+    for child in (_simplify(c) for c in children):
+        if child is not None and child[0] == kind:
+            flat.extend(child[1])
+        else:
+            flat.append(child)
+    if kind == "or" and any(child is None for child in flat):
+        return None
+    flat = [child for child in flat if child is not None]
+    if not flat:
+        return None
+    return flat[0] if len(flat) == 1 else (kind, flat)
+
+
+def trigram_query_sql(node: tuple[str, Any], table: str = "chunk_trigrams") -> tuple[str, list[Any]]:
+    """Render a non-empty trigram query as SQL selecting candidate chunk ids.
+
+    Args:
+        node: Query tree from regex_trigram_query (must not be None)
+        table: Posting table with (trigram, chunk_id) rows
+
+    Returns:
+        (sql, params) for a SELECT chunk_id query
+    """
+    kind, value = node
+    if kind == "tri":
+        return f"SELECT chunk_id FROM {table} WHERE trigram = ?", [value]
+
+    leaves = [child[1] for child in value if child[0] == "tri"]
+    if kind == "and" and len(leaves) == len(value):
+        # Flat conjunction: one scan of the postings, keeping chunks that hold all of them
+        placeholders = ", ".join("?" * len(leaves))
+        sql = (
+            f"SELECT chunk_id FROM {table} WHERE trigram IN ({placeholders}) "
+            f"GROUP BY chunk_id HAVING COUNT(DISTINCT trigram) = {len(leaves)}"
+        )
+        return sql, list(leaves)
+
+    operator = " INTERSECT " if kind == "and" else " UNION "
+    parts = [trigram_query_sql(child, table) for child in value]
+    sql = operator.join(f"({part_sql})" for part_sql, _ in parts)
+    params = [param for _, part_params in parts for param in part_params]
+    return sql, params
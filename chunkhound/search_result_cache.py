@@ -0,0 +1,197 @@
+"""
+Search Result Cache for paging through repeated searches.
+
+Agents page through the same search with offset=0, 10, 20... and every page
+would otherwise re-run the whole regex, keyword or semantic query (plus a COUNT
+when a total is requested). This module keeps the ranked head of each search
+once and slices later pages from memory. Entries are only valid for the index
+generation they were computed at: any write through the database provider
+bumps the generation, which drops the whole cache on the next lookup.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+
+class _CachedSearch(NamedTuple):
+    """Ranked results of one search from offset 0, plus what lies beyond them."""
+
+    results: list[dict[str, Any]]
+    has_more: bool
+    total: int | None
+    total_is_estimate: bool
+
+
+class SearchResultCache:
+    """LRU cache of ranked search results, valid for a single index generation."""
+
+    def __init__(self, max_entries: int = 64, prefetch_pages: int = 5):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of searches kept; 0 disables caching
+            prefetch_pages: Pages fetched on a miss, so the following pages hit
+        """
+        self.max_entries = max_entries
+        self.prefetch_pages = prefetch_pages
+
+        # Cache structure: search key -> ranked results from offset 0
+        self._cache: OrderedDict[str, _CachedSearch] = OrderedDict()
+        self._generation: int | None = None
+
+        # Statistics for monitoring
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'invalidations': 0
+        }
+
+    def window(self, offset: int, page_size: int) -> int:
+        """Number of results to fetch from offset 0 when a page misses.
+
+        Grows with the offset, so paging to the end of a long ranking costs a
+        logarithmic number of searches rather than one per prefetch window.
+        """
+        return 2 * offset + page_size * max(1, self.prefetch_pages)
+
+    def get_page(
+        self,
+        key: str,
+        generation: int,
+        offset: int,
+        page_size: int,
+        include_total: bool,
+        cursor_fn: Callable[[dict[str, Any]], str],
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]] | None:
+        """Slice a page out of a cached search.
+
+        Args:
+            key: Search key (tool plus every argument that affects ranking)
+            generation: Current index generation of the database
+            offset: Number of results to skip
+            page_size: Number of results to return
+            include_total: Whether the caller needs the total match count
+            cursor_fn: Builds the next_cursor from the last result of the page
+
+        Returns:
+            (results, pagination) shaped like the database search methods, or
+            None when the page is not covered by the cache
+        """
+        self._check_generation(generation)
+
+        entry = self._cache.get(key)
+        if entry is None or (include_total and entry.total is None):
+            self.stats['misses'] += 1
+            return None
+
+        if offset + page_size > len(entry.results) and entry.has_more:
+            # The page runs past the cached head of the ranking
+            self.stats['misses'] += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self.stats['hits'] += 1
+        return self._slice(entry, offset, page_size, include_total, cursor_fn)
+
+    def put(
+        self,
+        key: str,
+        generation: int,
+        results: list[dict[str, Any]],
+        pagination: dict[str, Any],
+        offset: int,
+        page_size: int,
+        include_total: bool,
+        cursor_fn: Callable[[dict[str, Any]], str],
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Store the results of a search fetched from offset 0 and slice the requested page.
+
+        Args:
+            key: Search key (tool plus every argument that affects ranking)
+            generation: Index generation read before the search ran
+            results: Ranked results starting at offset 0 (see window())
+            pagination: Pagination metadata returned with the results
+            offset: Number of results to skip for the requested page
+            page_size: Number of results in the requested page
+            include_total: Whether the caller needs the total match count
+            cursor_fn: Builds the next_cursor from the last result of the page
+
+        Returns:
+            (results, pagination) of the requested page
+        """
+        entry = _CachedSearch(
+            results=results,
+            has_more=bool(pagination.get("has_more")),
+            total=pagination.get("total"),
+            total_is_estimate=bool(pagination.get("total_is_estimate")),
+        )
+
+        # A write that landed while the search ran already made it stale
+        if self.max_entries > 0 and (self._generation is None or generation >= self._generation):
+            self._check_generation(generation)
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self.stats['evictions'] += 1
+
+        return self._slice(entry, offset, page_size, include_total, cursor_fn)
+
+    def clear(self) -> None:
+        """Clear all cached searches."""
+        count = len(self._cache)
+        self._cache.clear()
+        self.stats['evictions'] += count
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, size and hit rate
+        """
+        total_requests = self.stats['hits'] + self.stats['misses']
+        hit_rate = (self.stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            **self.stats,
+            'cache_size': len(self._cache),
+            'max_entries': self.max_entries,
+            'generation': self._generation,
+            'hit_rate_percent': round(hit_rate, 2)
+        }
+
+    @staticmethod
+    def _slice(
+        entry: _CachedSearch,
+        offset: int,
+        page_size: int,
+        include_total: bool,
+        cursor_fn: Callable[[dict[str, Any]], str],
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Page of a cached search, with pagination shaped like the database search methods."""
+        end = offset + page_size
+        page = entry.results[offset:end]
+        has_more = end < len(entry.results) or entry.has_more
+        pagination: dict[str, Any] = {
+            "offset": offset,
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_offset": offset + len(page) if has_more else None,
+            "next_cursor": cursor_fn(page[-1]) if has_more and page else None
+        }
+        if include_total and entry.total is not None:
+            pagination["total"] = entry.total
+            if entry.total_is_estimate:
+                pagination["total_is_estimate"] = True
+        return page, pagination
+
+    def _check_generation(self, generation: int) -> None:
+        """Drop every entry computed at another index generation."""
+        if generation == self._generation:
+            return
+        if self._cache:
+            self.stats['invalidations'] += 1
+            self._cache.clear()
+        self._generation = generation
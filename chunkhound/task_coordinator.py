@@ -2,12 +2,21 @@
 """
 Task Coordinator - Priority Queue System for MCP Server
 Ensures search operations get priority over file processing operations.
+
+Reads (HIGH and MEDIUM priority) are served by a pool of read workers and run
+concurrently; writes (LOW and BACKGROUND) go through a single write worker, so
+they stay serialized and a long indexing task never holds up a search queued
+behind it. Blocking database reads are moved off the event loop with run_read,
+which executes them on worker threads that each read through their own cursor.
 """
 
 import asyncio
+import functools
 import logging
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Any
@@ -23,6 +32,10 @@ class TaskPriority(IntEnum):
     BACKGROUND = 20  # Periodic indexing, maintenance tasks
 
 
+# Priorities served by the read workers; all others are writes
+READ_PRIORITIES = frozenset({TaskPriority.HIGH, TaskPriority.MEDIUM})
+
+
 @dataclass
 class Task:
     """Represents a task to be executed."""
@@ -47,15 +60,26 @@ class TaskCoordinator:
     Ensures user-facing operations (searches) get priority over background operations (file processing).
     """
 
-    def __init__(self, max_queue_size: int = 1000):
+    def __init__(self,
+                 max_queue_size: int = 1000,
+                 read_workers: int = 4,
+                 read_context: Callable[[], AbstractContextManager[Any]] | None = None):
         """
         Initialize task coordinator.
 
         Args:
-            max_queue_size: Maximum number of tasks to queue before blocking
+            max_queue_size: Maximum number of tasks to queue before blocking, per lane
+            read_workers: Number of read tasks (searches, stats) executed concurrently
+            read_context: Context entered on a worker thread around each run_read
+                call, binding that thread's database cursor (Database.read_cursor).
+                Without it run_read executes on the event loop.
         """
-        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max_queue_size)
-        self._worker_task: asyncio.Task | None = None
+        self._read_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max_queue_size)
+        self._write_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max_queue_size)
+        self._read_workers = max(1, read_workers)
+        self._read_context = read_context
+        self._read_executor: ThreadPoolExecutor | None = None
+        self._worker_tasks: list[asyncio.Task] = []
         self._shutdown_event = asyncio.Event()
         self._running = False
         self._stats = {
@@ -66,14 +90,22 @@ class TaskCoordinator:
         }
 
     async def start(self) -> None:
-        """Start the task coordinator worker."""
+        """Start the read workers and the write worker."""
         if self._running:
             return
 
         self._running = True
         self._shutdown_event.clear()
-        self._worker_task = asyncio.create_task(self._worker_loop())
-        logger.info("TaskCoordinator started")
+        if self._read_context is not None:
+            self._read_executor = ThreadPoolExecutor(
+                max_workers=self._read_workers, thread_name_prefix="chunkhound-read"
+            )
+        self._worker_tasks = [
+            asyncio.create_task(self._worker_loop(self._read_queue))
+            for _ in range(self._read_workers)
+        ]
+        self._worker_tasks.append(asyncio.create_task(self._worker_loop(self._write_queue)))
+        logger.info(f"TaskCoordinator started ({self._read_workers} read workers, 1 write worker)")
 
     async def stop(self, timeout: float = 30.0) -> None:
         """
@@ -89,17 +121,19 @@ class TaskCoordinator:
         self._running = False
         self._shutdown_event.set()
 
-        # Wait for worker to finish current task and drain queue
-        if self._worker_task:
-            try:
-                await asyncio.wait_for(self._worker_task, timeout=timeout)
-            except asyncio.TimeoutError:
-                logger.warning("TaskCoordinator worker did not stop gracefully, cancelling")
-                self._worker_task.cancel()
-                try:
-                    await self._worker_task
-                except asyncio.CancelledError:
-                    pass
+        # Wait for workers to finish current tasks and drain the queues
+        if self._worker_tasks:
+            _, pending = await asyncio.wait(self._worker_tasks, timeout=timeout)
+            if pending:
+                logger.warning("TaskCoordinator workers did not stop gracefully, cancelling")
+                for worker_task in pending:
+                    worker_task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            self._worker_tasks = []
+
+        if self._read_executor is not None:
+            self._read_executor.shutdown(wait=False, cancel_futures=True)
+            self._read_executor = None
 
         logger.info("TaskCoordinator stopped")
 
@@ -137,9 +171,9 @@ class TaskCoordinator:
         )
 
         try:
-            await self._queue.put(task)
+            await self._queue_for(priority).put(task)
             self._stats['tasks_queued'] += 1
-            self._stats['queue_size'] = self._queue.qsize()
+            self._stats['queue_size'] = self._queued_count()
 
             # Wait for task completion
             return await future
@@ -182,39 +216,77 @@ class TaskCoordinator:
         )
 
         try:
-            self._queue.put_nowait(task)
+            self._queue_for(priority).put_nowait(task)
             self._stats['tasks_queued'] += 1
-            self._stats['queue_size'] = self._queue.qsize()
+            self._stats['queue_size'] = self._queued_count()
             return future
 
         except asyncio.QueueFull:
             logger.error("Task queue is full, rejecting task")
             raise
 
+    async def run_read(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking database read off the event loop.
+
+        The call executes on a read worker thread inside read_context, so it uses
+        that thread's own cursor and runs in parallel with other reads and with
+        the write worker. Without a read_context it runs inline.
+
+        Args:
+            func: Synchronous read function (e.g. Database.search_regex)
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Result of the function
+        """
+        if self._read_executor is None or self._read_context is None:
+            return func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._read_executor, functools.partial(self._call_in_read_context, func, *args, **kwargs)
+        )
+
     def get_stats(self) -> dict[str, Any]:
         """Get task coordinator statistics."""
         return {
             **self._stats,
-            'queue_size': self._queue.qsize(),
+            'queue_size': self._queued_count(),
+            'read_queue_size': self._read_queue.qsize(),
+            'write_queue_size': self._write_queue.qsize(),
+            'read_workers': self._read_workers,
             'is_running': self._running
         }
 
-    async def _worker_loop(self) -> None:
-        """Main worker loop that processes tasks from the priority queue."""
+    def _queue_for(self, priority: TaskPriority) -> asyncio.PriorityQueue:
+        """Lane of a task: reads go to the read workers, everything else to the write worker."""
+        return self._read_queue if priority in READ_PRIORITIES else self._write_queue
+
+    def _queued_count(self) -> int:
+        return self._read_queue.qsize() + self._write_queue.qsize()
+
+    def _call_in_read_context(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self._read_context():
+            return func(*args, **kwargs)
+
+    async def _worker_loop(self, queue: asyncio.PriorityQueue) -> None:
+        """Worker loop that processes tasks from one lane's priority queue."""
         logger.info("TaskCoordinator worker started")
 
-        while self._running or not self._queue.empty():
+        while self._running or not queue.empty():
             try:
                 # Use a short timeout to allow checking shutdown flag
                 try:
-                    task = await asyncio.wait_for(self._queue.get(), timeout=1.0)
+                    task = await asyncio.wait_for(queue.get(), timeout=1.0)
                 except asyncio.TimeoutError:
                     # Check if we should shutdown
                     if self._shutdown_event.is_set():
                         break
                     continue
 
-                self._stats['queue_size'] = self._queue.qsize()
+                self._stats['queue_size'] = self._queued_count()
 
                 # Execute the task
                 try:
@@ -232,7 +304,7 @@ class TaskCoordinator:
                     self._stats['tasks_failed'] += 1
 
                 finally:
-                    self._queue.task_done()
+                    queue.task_done()
 
             except Exception as e:
                 logger.error(f"Worker loop error: {e}", exc_info=True)
@@ -14,11 +14,31 @@ else:
 
 from loguru import logger
 
+# Approximate heap footprint of one tree-sitter subtree node. The bindings do not
+# expose tree memory, so trees are accounted for by node count.
+_TREE_NODE_BYTES = 64
+
+
+def estimate_tree_bytes(tree: Any) -> int:
+    """Estimate the memory held by a tree-sitter tree.
+
+    Args:
+        tree: Parsed tree-sitter syntax tree
+
+    Returns:
+        Approximate size in bytes, 0 if the tree cannot be inspected
+    """
+    try:
+        return tree.root_node.descendant_count * _TREE_NODE_BYTES
+    except Exception:
+        return 0
+
 
 class TreeCacheEntry:
     """Represents a cached syntax tree with metadata."""
 
-    def __init__(self, tree: Any, file_path: Path, mtime: float, size: int):
+    def __init__(self, tree: Any, file_path: Path, mtime: float, size: int,
+                 source: bytes | None = None, language: Any = None):
         """Initialize cache entry.
 
         Args:
@@ -26,11 +46,21 @@ class TreeCacheEntry:
             file_path: Path to the source file
             mtime: File modification time when parsed
             size: File size in bytes when parsed
+            source: Exact source bytes the tree was parsed from, required for
+                incremental reparsing
+            language: Tree-sitter language the tree was parsed with, required for
+                incremental reparsing
         """
         self.tree = tree
         self.file_path = file_path
         self.mtime = mtime
         self.size = size
+        self.source = source
+        # Trees do not keep their language alive; reading or editing a tree whose
+        # Language object was freed crashes the interpreter
+        self.language = language
+        # Bytes held by this entry: the tree itself plus the retained source
+        self.memory_bytes = estimate_tree_bytes(tree) + (len(source) if source is not None else size)
         self.access_time = time.time()
         self.hit_count = 0
 
@@ -61,11 +91,12 @@ class TreeCache:
 
         Args:
             max_entries: Maximum number of cached trees
-            max_memory_mb: Approximate memory limit in MB (rough estimate)
+            max_memory_mb: Memory limit in MB for cached trees and retained sources
         """
         self.max_entries = max_entries
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         self._cache: OrderedDict[str, TreeCacheEntry] = OrderedDict()
+        self._memory_bytes = 0
         self._lock = RLock()  # Thread-safe operations
 
         # Statistics
@@ -98,7 +129,7 @@ class TreeCache:
             # Check if entry is still valid
             if not entry.is_valid():
                 logger.debug(f"Cache invalidation (stale): {file_path}")
-                del self._cache[cache_key]
+                self._remove(cache_key)
                 self._invalidations += 1
                 self._misses += 1
                 return None
@@ -137,12 +168,41 @@ class TreeCache:
             logger.debug(f"Cache hit for comparison (potentially stale): {file_path}")
             return entry.tree
 
-    def put(self, file_path: Path, tree: Any) -> None:
+    def pop_for_reparse(self, file_path: Path) -> tuple[Any, bytes, Any] | None:
+        """Take the previous tree and the source it was parsed from out of the cache.
+
+        Like get_for_comparison, the entry is returned even if the file changed
+        since - that is the point of an incremental reparse. The entry is removed
+        because the caller edits the tree in place; it is expected to put() the
+        reparsed tree back. Only entries cached together with their source and
+        language qualify.
+
+        Args:
+            file_path: Path to source file
+
+        Returns:
+            (tree, source bytes, language) if available, None otherwise
+        """
+        cache_key = str(file_path.resolve())
+
+        with self._lock:
+            entry = self._cache.get(cache_key)
+            if entry is None or entry.source is None or entry.language is None:
+                self._misses += 1
+                return None
+
+            self._remove(cache_key)
+            self._hits += 1
+            return entry.tree, entry.source, entry.language
+
+    def put(self, file_path: Path, tree: Any, source: bytes | None = None, language: Any = None) -> None:
         """Cache a parsed syntax tree.
 
         Args:
             file_path: Path to source file
             tree: Parsed tree-sitter syntax tree
+            source: Source bytes the tree was parsed from; enables pop_for_reparse
+            language: Tree-sitter language the tree was parsed with; enables pop_for_reparse
         """
         if tree is None:
             logger.warning(f"Attempted to cache None tree for {file_path}")
@@ -155,19 +215,24 @@ class TreeCache:
             mtime = stat.st_mtime
             size = stat.st_size
         except (OSError, FileNotFoundError) as e:
-            logger.warning(f"Cannot stat file for caching {file_path}: {e}")
-            return
+            if source is None:
+                logger.warning(f"Cannot stat file for caching {file_path}: {e}")
+                return
+            # In-memory source: never valid for get(), still usable for reparsing
+            mtime = 0.0
+            size = len(source)
 
         with self._lock:
             # Create new entry
-            entry = TreeCacheEntry(tree, file_path, mtime, size)
+            entry = TreeCacheEntry(tree, file_path, mtime, size, source, language)
 
             # If key already exists, remove old entry
             if cache_key in self._cache:
-                del self._cache[cache_key]
+                self._remove(cache_key)
 
             # Add new entry
             self._cache[cache_key] = entry
+            self._memory_bytes += entry.memory_bytes
 
             # Enforce cache limits
             self._enforce_limits()
@@ -187,7 +252,7 @@ class TreeCache:
 
         with self._lock:
             if cache_key in self._cache:
-                del self._cache[cache_key]
+                self._remove(cache_key)
                 self._invalidations += 1
                 logger.debug(f"Invalidated cache entry: {file_path}")
                 return True
@@ -198,6 +263,7 @@ class TreeCache:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._memory_bytes = 0
             logger.info(f"Cleared tree cache ({count} entries)")
 
     def _enforce_limits(self) -> None:
@@ -206,13 +272,15 @@ class TreeCache:
         while len(self._cache) > self.max_entries:
             self._evict_lru()
 
-        # Rough memory enforcement (estimated)
-        # Each tree is roughly estimated based on file size
-        estimated_memory = sum(entry.size for entry in self._cache.values())
-        while estimated_memory > self.max_memory_bytes and self._cache:
-            evicted_entry = self._evict_lru()
-            if evicted_entry:
-                estimated_memory -= evicted_entry.size
+        # Enforce memory limit on tree size plus retained source bytes
+        while self._memory_bytes > self.max_memory_bytes and self._cache:
+            self._evict_lru()
+
+    def _remove(self, cache_key: str) -> TreeCacheEntry:
+        """Remove an entry and release its memory accounting."""
+        entry = self._cache.pop(cache_key)
+        self._memory_bytes -= entry.memory_bytes
+        return entry
 
     def _evict_lru(self) -> TreeCacheEntry | None:
         """Evict least recently used entry.
@@ -225,6 +293,7 @@ class TreeCache:
 
         # OrderedDict maintains insertion order, so first item is LRU
         cache_key, entry = self._cache.popitem(last=False)
+        self._memory_bytes -= entry.memory_bytes
         self._evictions += 1
         logger.debug(f"Evicted LRU entry: {entry.file_path}")
         return entry
@@ -248,7 +317,7 @@ class TreeCache:
                 'evictions': self._evictions,
                 'invalidations': self._invalidations,
                 'total_requests': total_requests,
-                'estimated_memory_mb': round(sum(entry.size for entry in self._cache.values()) / 1024 / 1024, 2),
+                'estimated_memory_mb': round(self._memory_bytes / 1024 / 1024, 2),
                 'max_memory_mb': round(self.max_memory_bytes / 1024 / 1024, 2)
             }
 
@@ -273,7 +342,7 @@ class TreeCache:
                     stale_keys.append(cache_key)
 
             for key in stale_keys:
-                del self._cache[key]
+                self._remove(key)
                 self._invalidations += 1
 
         if stale_keys:
@@ -301,6 +370,7 @@ class TreeCache:
                 'file_path': str(entry.file_path),
                 'cached_mtime': entry.mtime,
                 'cached_size': entry.size,
+                'memory_bytes': entry.memory_bytes,
                 'access_time': entry.access_time,
                 'hit_count': entry.hit_count,
                 'is_valid': entry.is_valid(),
@@ -12,13 +12,14 @@ The models follow these principles:
 - Backward compatibility with existing dictionary-based interfaces
 """
 
-from .chunk import Chunk
+from .chunk import Chunk, chunk_content_hash
 from .embedding import Embedding, EmbeddingResult
 from .file import File
 
 __all__ = [
     "File",
     "Chunk",
+    "chunk_content_hash",
     "Embedding",
     "EmbeddingResult",
 ]
@@ -5,6 +5,7 @@ that has been extracted from a source file. The Chunk model encapsulates chunk m
 content, and provides methods for working with chunk data in a type-safe manner.
 """
 
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -22,6 +23,22 @@ from ..types import (
 )
 
 
+def chunk_content_hash(code: str) -> str:
+    """Hash chunk code after normalizing line endings and surrounding whitespace.
+
+    Trailing whitespace on each line, line-ending style and leading/trailing
+    blank lines do not change the hash.
+
+    Args:
+        code: Raw chunk code
+
+    Returns:
+        Hex-encoded SHA-256 digest of the normalized code
+    """
+    normalized = "\n".join(line.rstrip() for line in code.splitlines()).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 @dataclass(frozen=True)
 class Chunk:
     """Domain model representing a semantic code chunk.
@@ -267,6 +284,11 @@ class Chunk:
             return self.end_byte - self.start_byte + 1
         return None
 
+    @property
+    def content_hash(self) -> str:
+        """Get the hash of the normalized code content (see chunk_content_hash)."""
+        return chunk_content_hash(self.code)
+
     @property
     def display_name(self) -> str:
         """Get a human-readable display name for this chunk."""
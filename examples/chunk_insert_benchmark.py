@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Chunk Insert Benchmark
+
+Measures per-file chunk insert latency as the chunks table grows, comparing:
+
+- legacy:  executemany INSERT followed by "SELECT id ... ORDER BY id DESC LIMIT n"
+- batch:   DuckDBProvider.insert_chunks_batch (sequence pre-allocation, one
+           INSERT ... SELECT from a staged relation)
+
+Usage:
+    python examples/chunk_insert_benchmark.py --sizes 0 100000 1000000 --files 50
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+try:
+    from core.models import Chunk, File
+    from core.types import ChunkType, Language
+    from providers.database.duckdb_provider import DuckDBProvider
+except ImportError:
+    print("Error: chunkhound package not found. Please install chunkhound first.")
+    sys.exit(1)
+
+
+def _legacy_insert(provider: DuckDBProvider, chunks: list[Chunk]) -> list[int]:
+    """Previous insert_chunks_batch implementation, kept here for comparison."""
+    conn = provider.connection
+    conn.executemany("""
+        INSERT INTO chunks (file_id, chunk_type, symbol, code, start_line, end_line,
+                          start_byte, end_byte, size, signature, language)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [
+        [c.file_id, c.chunk_type.value, c.symbol, c.code, c.start_line, c.end_line,
+         c.start_byte, c.end_byte, len(c.code), None, c.language.value]
+        for c in chunks
+    ])
+    results = conn.execute(f"SELECT id FROM chunks ORDER BY id DESC LIMIT {len(chunks)}").fetchall()
+    return [row[0] for row in reversed(results)]
+
+
+def _grow_table(provider: DuckDBProvider, file_id: int, target_rows: int) -> None:
+    """Fill the chunks table with synthetic rows up to target_rows."""
+    current = provider.connection.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+    missing = target_rows - current
+    if missing <= 0:
+        return
+    provider.connection.execute(f"""
+        INSERT INTO chunks (file_id, chunk_type, symbol, code, start_line, end_line, size, language)
+        SELECT {file_id}, 'function', 'filler_' || i, 'def filler(): pass', 1, 1, 18, 'python'
+        FROM range(?) t(i)
+    """, [missing])
+
+
+def _make_chunks(file_id: int, count: int) -> list[Chunk]:
+    return [
+        Chunk(
+            file_id=file_id,
+            symbol=f"func_{i}",
+            start_line=i * 3 + 1,
+            end_line=i * 3 + 3,
+            code=f"def func_{i}(x):\n    y = x * {i}\n    return y",
+            chunk_type=ChunkType.FUNCTION,
+            language=Language.PYTHON,
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-file chunk insert latency vs table size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 100_000, 500_000, 1_000_000],
+                        help="chunks table sizes to measure at")
+    parser.add_argument("--files", type=int, default=50, help="Files inserted per measurement")
+    parser.add_argument("--chunks-per-file", type=int, default=30, help="Chunks per simulated file")
+    args = parser.parse_args()
+
+    provider = DuckDBProvider(":memory:")
+    provider.connect()
+    file_id = provider.insert_file(File(path="bench/filler.py", mtime=time.time(),
+                                        language=Language.PYTHON, size_bytes=0))
+
+    print(f"{'table rows':>12} | {'legacy ms/file':>15} | {'batch ms/file':>14}")
+    try:
+        for size in sorted(args.sizes):
+            _grow_table(provider, file_id, size)
+            timings: dict[str, list[float]] = {"legacy": [], "batch": []}
+
+            for mode, insert in (("legacy", lambda c: _legacy_insert(provider, c)),
+                                 ("batch", provider.insert_chunks_batch)):
+                for _ in range(args.files):
+                    chunks = _make_chunks(file_id, args.chunks_per_file)
+                    start = time.perf_counter()
+                    insert(chunks)
+                    timings[mode].append((time.perf_counter() - start) * 1000)
+
+            rows = provider.connection.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+            print(f"{rows:>12} | {statistics.median(timings['legacy']):>15.2f} | "
+                  f"{statistics.median(timings['batch']):>14.2f}")
+    finally:
+        provider.disconnect(skip_checkpoint=True)
+
+
+if __name__ == "__main__":
+    main()
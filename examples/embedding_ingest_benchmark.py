@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Embedding Ingest Benchmark
+
+Compares the two ingest paths of DuckDBProvider.insert_embeddings_batch:
+
+- values: every vector rendered into a literal VALUES clause (legacy path)
+- arrow:  batch registered as an Arrow float32 relation and INSERT ... SELECT
+
+Both the new-row path (INSERT) and the update path (INSERT OR REPLACE) are
+measured against a throwaway database.
+
+Usage:
+    python examples/embedding_ingest_benchmark.py --rows 5000 --dims 1536
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    from core.models import Chunk, File
+    from core.types import ChunkType, Language
+    from providers.database.duckdb_provider import PYARROW_AVAILABLE, DuckDBProvider
+except ImportError:
+    print("Error: chunkhound package not found. Please install chunkhound first.")
+    sys.exit(1)
+
+
+def _create_provider(db_path: Path, chunk_count: int) -> tuple[DuckDBProvider, list[int]]:
+    """Create a provider with a single file and `chunk_count` chunks to attach vectors to."""
+    provider = DuckDBProvider(db_path)
+    provider.connect()
+
+    file_id = provider.insert_file(File(
+        path="bench/module.py",
+        mtime=time.time(),
+        language=Language.PYTHON,
+        size_bytes=0,
+    ))
+    chunks = [
+        Chunk(
+            file_id=file_id,
+            symbol=f"func_{i}",
+            start_line=i + 1,
+            end_line=i + 2,
+            code=f"def func_{i}():\n    return {i}",
+            chunk_type=ChunkType.FUNCTION,
+            language=Language.PYTHON,
+        )
+        for i in range(chunk_count)
+    ]
+    chunk_ids = provider.insert_chunks_batch(chunks)
+    return provider, chunk_ids
+
+
+def _make_batch(chunk_ids: list[int], dims: int, model: str) -> list[dict]:
+    """Generate random embedding rows for the given chunk ids."""
+    return [
+        {
+            "chunk_id": chunk_id,
+            "provider": "bench",
+            "model": model,
+            "embedding": [random.random() for _ in range(dims)],
+            "dims": dims,
+        }
+        for chunk_id in chunk_ids
+    ]
+
+
+def run_mode(mode: str, rows: int, dims: int, batch_size: int) -> dict[str, float]:
+    """Run insert + replace passes for one ingest mode and return timings."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        provider, chunk_ids = _create_provider(Path(tmp_dir) / "bench.duckdb", rows)
+        provider.embedding_ingest_mode = mode
+
+        try:
+            batches = [chunk_ids[i:i + batch_size] for i in range(0, len(chunk_ids), batch_size)]
+
+            insert_start = time.perf_counter()
+            for ids in batches:
+                # Threshold above batch size keeps the HNSW drop/recreate out of the timing
+                provider.insert_embeddings_batch(_make_batch(ids, dims, "m"), batch_size=batch_size + 1)
+            insert_time = time.perf_counter() - insert_start
+
+            replace_start = time.perf_counter()
+            for ids in batches:
+                provider.insert_embeddings_batch(_make_batch(ids, dims, "m"), batch_size=batch_size + 1)
+            replace_time = time.perf_counter() - replace_start
+        finally:
+            provider.disconnect(skip_checkpoint=True)
+
+    return {
+        "insert_s": insert_time,
+        "insert_rows_per_s": rows / insert_time,
+        "replace_s": replace_time,
+        "replace_rows_per_s": rows / replace_time,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark embedding ingest paths")
+    parser.add_argument("--rows", type=int, default=2000, help="Number of embeddings to insert")
+    parser.add_argument("--dims", type=int, default=1536, help="Embedding dimensions")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per insert_embeddings_batch call")
+    args = parser.parse_args()
+
+    modes = ["values"]
+    if PYARROW_AVAILABLE:
+        modes.append("arrow")
+    else:
+        print("pyarrow not installed - only the VALUES path will be measured")
+
+    print(f"rows={args.rows} dims={args.dims} batch_size={args.batch_size}")
+    results = {}
+    for mode in modes:
+        results[mode] = run_mode(mode, args.rows, args.dims, args.batch_size)
+        r = results[mode]
+        print(f"{mode:>6}: insert {r['insert_s']:.2f}s ({r['insert_rows_per_s']:.0f} rows/s), "
+              f"replace {r['replace_s']:.2f}s ({r['replace_rows_per_s']:.0f} rows/s)")
+
+    if "arrow" in results:
+        print(f"speedup: insert {results['values']['insert_s'] / results['arrow']['insert_s']:.1f}x, "
+              f"replace {results['values']['replace_s'] / results['arrow']['replace_s']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
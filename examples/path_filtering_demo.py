@@ -27,21 +27,21 @@ async def main():
 
     # Demo 1: Search for class definitions in all files
     print("\n=== Demo 1: Search for class definitions (no path filter) ===")
-    results, pagination = db.search_regex(r"class\s+\w+", page_size=5)
+    results, pagination = db.search_regex(r"class\s+\w+", page_size=5, include_total=True)
     print(f"Found {pagination['total']} total results, showing first {len(results)}:")
     for r in results:
         print(f"  - {r['file_path']}: {r['symbol']} (line {r['start_line']})")
 
     # Demo 2: Search for class definitions only in providers/ directory
     print("\n=== Demo 2: Search for class definitions in providers/ ===")
-    results, pagination = db.search_regex(r"class\s+\w+", page_size=10, path_filter="providers/")
+    results, pagination = db.search_regex(r"class\s+\w+", page_size=10, path_filter="providers/", include_total=True)
     print(f"Found {pagination['total']} results:")
     for r in results:
         print(f"  - {r['file_path']}: {r['symbol']} (line {r['start_line']})")
 
     # Demo 3: Search for test functions
     print("\n=== Demo 3: Search for test functions in tests/ ===")
-    results, pagination = db.search_regex(r"def\s+test_\w+", page_size=10, path_filter="tests/")
+    results, pagination = db.search_regex(r"def\s+test_\w+", page_size=10, path_filter="tests/", include_total=True)
     print(f"Found {pagination['total']} test functions:")
     for r in results[:5]:  # Show first 5
         print(f"  - {r['file_path']}: {r['symbol']} (line {r['start_line']})")
@@ -50,7 +50,7 @@ async def main():
 
     # Demo 4: Search in specific file
     print("\n=== Demo 4: Search in specific file ===")
-    results, pagination = db.search_regex(r"def\s+\w+", page_size=20, path_filter="chunkhound/mcp_server.py")
+    results, pagination = db.search_regex(r"def\s+\w+", page_size=20, path_filter="chunkhound/mcp_server.py", include_total=True)
     print(f"Found {pagination['total']} functions in mcp_server.py:")
     for r in results[:3]:
         print(f"  - {r['symbol']} (line {r['start_line']})")
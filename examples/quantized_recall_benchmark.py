@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Quantized Vector Storage Benchmark
+
+Measures recall@10 against exact cosine ranking and on-disk size for each
+embedding storage mode of DuckDBProvider.set_embedding_storage:
+
+- float:        FLOAT[dims] vectors behind an HNSW index (default)
+- int8:         scaled TINYINT codes, with or without full vectors for re-rank
+- binary:       1-bit sign codes, with or without full vectors for re-rank
+
+Vectors are drawn around a set of random centroids so nearest neighbours are
+meaningful. Every mode runs against its own throwaway database.
+
+Usage:
+    python examples/quantized_recall_benchmark.py --rows 20000 --dims 384 --queries 50
+"""
+
+import argparse
+import math
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    from core.models import Chunk, File
+    from core.types import ChunkType, Language
+    from providers.database.duckdb_provider import DuckDBProvider
+except ImportError:
+    print("Error: chunkhound package not found. Please install chunkhound first.")
+    sys.exit(1)
+
+MODES = [
+    ("float", True),
+    ("int8", True),
+    ("int8", False),
+    ("binary", True),
+    ("binary", False),
+]
+
+
+def _clustered_vectors(count: int, centroids: list[list[float]], rng: random.Random) -> list[list[float]]:
+    """Generate vectors scattered around the given centroids."""
+    return [
+        [value + rng.gauss(0, 0.35) for value in rng.choice(centroids)]
+        for _ in range(count)
+    ]
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    return dot / (math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b)) or 1.0)
+
+
+def _bytes_per_vector(storage: str, keep_full: bool, dims: int) -> int:
+    """Raw vector payload per row, excluding the HNSW graph."""
+    code_bytes = {"float": 0, "int8": dims + 4, "binary": math.ceil(dims / 8)}[storage]
+    full_bytes = 4 * dims if storage == "float" or keep_full else 0
+    return code_bytes + full_bytes
+
+
+def run_mode(storage: str, keep_full: bool, vectors: list[list[float]], queries: list[list[float]],
+             truth: list[set[int]]) -> dict[str, float]:
+    """Index all vectors in one storage mode and measure recall, latency and size."""
+    dims = len(vectors[0])
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "bench.duckdb"
+        provider = DuckDBProvider(db_path)
+        provider.connect()
+        try:
+            provider.set_embedding_storage("bench", "bench-model", dims, storage, keep_full)
+
+            file_id = provider.insert_file(File(
+                path="bench/module.py",
+                mtime=time.time(),
+                language=Language.PYTHON,
+                size_bytes=0,
+            ))
+            chunk_ids = provider.insert_chunks_batch([
+                Chunk(
+                    file_id=file_id,
+                    symbol=f"func_{i}",
+                    start_line=i + 1,
+                    end_line=i + 2,
+                    code=f"def func_{i}():\n    return {i}",
+                    chunk_type=ChunkType.FUNCTION,
+                    language=Language.PYTHON,
+                )
+                for i in range(len(vectors))
+            ])
+            provider.insert_embeddings_batch([
+                {"chunk_id": chunk_id, "provider": "bench", "model": "bench-model", "embedding": vector, "dims": dims}
+                for chunk_id, vector in zip(chunk_ids, vectors)
+            ])
+            provider._maybe_checkpoint(force=True)
+            row_of_chunk = {chunk_id: row for row, chunk_id in enumerate(chunk_ids)}
+
+            hits = 0
+            start = time.perf_counter()
+            for query, expected in zip(queries, truth):
+                results, _ = provider.search_semantic(query, "bench", "bench-model", page_size=10)
+                hits += len({row_of_chunk[r["chunk_id"]] for r in results} & expected)
+            elapsed = time.perf_counter() - start
+        finally:
+            provider.disconnect()
+
+        return {
+            "recall": hits / (10 * len(queries)),
+            "latency_ms": elapsed * 1000 / len(queries),
+            "bytes_per_vector": _bytes_per_vector(storage, keep_full, dims),
+            "db_mb": db_path.stat().st_size / (1024 * 1024),
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark quantized embedding storage")
+    parser.add_argument("--rows", type=int, default=20000, help="Number of embeddings to index")
+    parser.add_argument("--dims", type=int, default=384, help="Embedding dimensions")
+    parser.add_argument("--queries", type=int, default=50, help="Number of queries")
+    parser.add_argument("--clusters", type=int, default=64, help="Number of vector clusters")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    centroids = [[rng.gauss(0, 1) for _ in range(args.dims)] for _ in range(args.clusters)]
+    vectors = _clustered_vectors(args.rows, centroids, rng)
+    queries = _clustered_vectors(args.queries, centroids, rng)
+    print(f"Computing exact top-10 for {args.queries} queries over {args.rows} vectors...")
+    truth = [
+        set(sorted(range(len(vectors)), key=lambda row: -_cosine(query, vectors[row]))[:10])
+        for query in queries
+    ]
+
+    print(f"{'mode':<18} {'recall@10':>10} {'ms/query':>10} {'bytes/vec':>10} {'db MB':>8}")
+    for storage, keep_full in MODES:
+        result = run_mode(storage, keep_full, vectors, queries, truth)
+        label = storage if storage == "float" else f"{storage}{'+rerank' if keep_full else ''}"
+        print(f"{label:<18} {result['recall']:>10.3f} {result['latency_ms']:>10.1f} "
+              f"{result['bytes_per_vector']:>10} {result['db_mb']:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
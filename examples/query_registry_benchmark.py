@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Query Registry Benchmark
+
+Measures per-language parse_file latency with the compiled-query registry:
+
+- cold: registry cleared before every file, so every extraction pass compiles
+        its queries again (previous behaviour of calling Language.query inline)
+- warm: queries compiled once and reused across files
+
+Each language parses a synthetic file built by repeating a small sample.
+
+Usage:
+    python examples/query_registry_benchmark.py --files 20 --repeat 50
+    python examples/query_registry_benchmark.py --languages python java go
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    from loguru import logger
+
+    from core.types import Language
+    from providers.parsing.queries import clear_query_cache, get_query_cache_size
+    from registry import get_registry
+except ImportError:
+    print("Error: chunkhound package not found. Please install chunkhound first.")
+    sys.exit(1)
+
+SAMPLES: dict[Language, tuple[str, str]] = {
+    Language.PYTHON: (".py", '''
+class Shape{i}:
+    """A shape."""
+
+    def area(self):
+        # compute area
+        return {i} * 2
+
+    def scale(self, factor):
+        return self.area() * factor
+
+
+def helper_{i}(x):
+    """Helper function."""
+    return x + {i}
+'''),
+    Language.JAVA: (".java", '''
+/** A shape. */
+class Shape{i} {{
+    // compute area
+    int area() {{ return {i} * 2; }}
+    int scale(int factor) {{ return area() * factor; }}
+}}
+'''),
+    Language.JAVASCRIPT: (".js", '''
+// helper
+function helper{i}(x) {{ return x + {i}; }}
+class Shape{i} {{
+    area() {{ return {i} * 2; }}
+}}
+const arrow{i} = (x) => x * {i};
+'''),
+    Language.TYPESCRIPT: (".ts", '''
+interface Sized{i} {{ size: number; }}
+// helper
+function helper{i}(x: number): number {{ return x + {i}; }}
+class Shape{i} implements Sized{i} {{
+    size = {i};
+    area(): number {{ return this.size * 2; }}
+}}
+'''),
+    Language.GO: (".go", '''
+// Shape{i} is a shape.
+type Shape{i} struct {{ size int }}
+
+// Area computes the area.
+func (s Shape{i}) Area() int {{ return s.size * {i} }}
+
+func helper{i}(x int) int {{ return x + {i} }}
+'''),
+    Language.RUST: (".rs", '''
+/// A shape.
+struct Shape{i} {{ size: i32 }}
+
+impl Shape{i} {{
+    // compute area
+    fn area(&self) -> i32 {{ self.size * {i} }}
+}}
+
+fn helper_{i}(x: i32) -> i32 {{ x + {i} }}
+'''),
+    Language.C: (".c", '''
+/* A shape. */
+struct shape_{i} {{ int size; }};
+
+// helper
+int helper_{i}(int x) {{ return x + {i}; }}
+'''),
+    Language.CPP: (".cpp", '''
+// A shape.
+class Shape{i} {{
+public:
+    int area() const {{ return {i} * 2; }}
+}};
+
+int helper_{i}(int x) {{ return x + {i}; }}
+'''),
+    Language.KOTLIN: (".kt", '''
+// A shape.
+class Shape{i}(val size: Int) {{
+    fun area(): Int = size * {i}
+}}
+
+fun helper{i}(x: Int): Int = x + {i}
+'''),
+    Language.BASH: (".sh", '''
+# helper
+helper_{i}() {{
+    echo $(( $1 + {i} ))
+}}
+'''),
+    Language.MARKDOWN: (".md", '''
+# Section {i}
+
+Some text for section {i}.
+
+```python
+print({i})
+```
+'''),
+}
+
+
+def _make_source(template: str, repeat: int) -> str:
+    return "".join(template.format(i=i) for i in range(repeat))
+
+
+def _time_files(parser, paths: list[Path], cold: bool) -> list[float]:
+    timings = []
+    for path in paths:
+        if cold:
+            clear_query_cache()
+        start = time.perf_counter()
+        parser.parse_file(path)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the compiled tree-sitter query registry")
+    parser.add_argument("--files", type=int, default=20, help="Files parsed per language and mode")
+    parser.add_argument("--repeat", type=int, default=50, help="Sample repetitions per file")
+    parser.add_argument("--languages", nargs="+", default=None,
+                        help="Languages to measure (default: all with a sample)")
+    args = parser.parse_args()
+
+    logger.remove()
+    registry = get_registry()
+    languages = [Language(name) for name in args.languages] if args.languages else list(SAMPLES)
+
+    print(f"{'language':>12} | {'queries':>7} | {'cold ms/file':>12} | {'warm ms/file':>12} | {'speedup':>7}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for language in languages:
+            if language not in SAMPLES:
+                print(f"{language.value:>12} | no sample")
+                continue
+            try:
+                lang_parser = registry.get_language_parser(language)
+            except Exception as e:
+                lang_parser = None
+                print(f"{language.value:>12} | parser unavailable: {e}")
+                continue
+            if lang_parser is None:
+                print(f"{language.value:>12} | parser unavailable")
+                continue
+
+            extension, template = SAMPLES[language]
+            paths = []
+            for n in range(args.files):
+                path = Path(tmp_dir) / f"{language.value}_{n}{extension}"
+                path.write_text(_make_source(template, args.repeat))
+                paths.append(path)
+
+            cold = statistics.median(_time_files(lang_parser, paths, cold=True))
+            clear_query_cache()
+            warm = statistics.median(_time_files(lang_parser, paths, cold=False))
+            queries = get_query_cache_size()
+            print(f"{language.value:>12} | {queries:>7} | {cold:>12.2f} | {warm:>12.2f} | {cold / warm:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Regex Backend Benchmark
+
+Compares the two search_regex engines of DuckDBProvider on a synthetic corpus:
+
+- sql:     DuckDB regexp_matches (RE2) inside the query
+- python:  Python re over the memory-mapped chunk text segment, sharded across
+           worker processes
+
+Each pattern is timed for the first page (streaming, early termination) and for
+include_total=True, which matches every candidate chunk. The first python run
+also pays for exporting chunk code into the segment; that cost is reported
+separately.
+
+Usage:
+    python examples/regex_backend_benchmark.py --chunks 200000 --workers 4 --repeat 3
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    from core.models import Chunk, File
+    from core.types import ChunkType, Language
+    from providers.database.duckdb_provider import DuckDBProvider
+except ImportError:
+    print("Error: chunkhound package not found. Please install chunkhound first.")
+    sys.exit(1)
+
+PATTERNS = [
+    r"def process_\w+",
+    r"return\s+result_\d+",
+    r"[A-Z][a-z]+Error",
+    r"\bvalue\s*=\s*\d{3,}",
+    r"(?i)todo|fixme",
+]
+
+WORDS = ["value", "result", "handler", "config", "process", "item", "buffer", "state"]
+
+
+def _chunk_code(i: int, rng: random.Random) -> str:
+    """Synthetic function body with a mix of identifiers, literals and comments."""
+    name = f"{rng.choice(WORDS)}_{i}"
+    lines = [f"def process_{name}(arg):"]
+    for _ in range(rng.randint(3, 20)):
+        word = rng.choice(WORDS)
+        lines.append(f"    {word} = {rng.randint(0, 5000)}  # {rng.choice(WORDS)} {word}")
+    if rng.random() < 0.05:
+        lines.append("    # TODO: handle ValueError")
+    lines.append(f"    return result_{i % 97}")
+    return "\n".join(lines)
+
+
+def _time_search(provider: DuckDBProvider, pattern: str, include_total: bool, repeat: int) -> float:
+    """Best-of-repeat wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        provider.search_regex(pattern, page_size=10, include_total=include_total)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark regex search backends")
+    parser.add_argument("--chunks", type=int, default=200000, help="Number of chunks to index")
+    parser.add_argument("--files", type=int, default=2000, help="Number of files the chunks are spread over")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes for the python backend")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        provider = DuckDBProvider(Path(tmp_dir) / "bench.duckdb")
+        provider.connect()
+        try:
+            print(f"Indexing {args.chunks} chunks over {args.files} files...")
+            per_file = max(1, args.chunks // args.files)
+            for file_index in range(args.files):
+                file_id = provider.insert_file(File(
+                    path=f"bench/module_{file_index}.py",
+                    mtime=time.time(),
+                    language=Language.PYTHON,
+                    size_bytes=0,
+                ))
+                first = file_index * per_file
+                provider.insert_chunks_batch([
+                    Chunk(
+                        file_id=file_id,
+                        symbol=f"func_{i}",
+                        start_line=(i - first) * 25 + 1,
+                        end_line=(i - first) * 25 + 24,
+                        code=_chunk_code(i, rng),
+                        chunk_type=ChunkType.FUNCTION,
+                        language=Language.PYTHON,
+                    )
+                    for i in range(first, first + per_file)
+                ])
+
+            provider.regex_backend = "python"
+            provider.regex_workers = args.workers
+            start = time.perf_counter()
+            provider.search_regex(PATTERNS[0], page_size=1)
+            print(f"Segment export: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+            print(f"{'pattern':<26} {'backend':<8} {'page ms':>9} {'total ms':>10} {'matches':>9}")
+            for pattern in PATTERNS:
+                for backend in ("sql", "python"):
+                    provider.regex_backend = backend
+                    _, pagination = provider.search_regex(pattern, page_size=10, include_total=True)
+                    page_ms = _time_search(provider, pattern, False, args.repeat)
+                    total_ms = _time_search(provider, pattern, True, args.repeat)
+                    print(f"{pattern:<26} {backend:<8} {page_ms:>9.1f} {total_ms:>10.1f} "
+                          f"{pagination.get('total', 0):>9}")
+        finally:
+            provider.disconnect()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
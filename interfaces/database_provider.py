@@ -1,5 +1,6 @@
 """DatabaseProvider protocol for ChunkHound - abstract interface for database implementations."""
 
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -23,6 +24,15 @@ class DatabaseProvider(Protocol):
         """Check if database connection is active."""
         ...
 
+    @property
+    def index_generation(self) -> int:
+        """Counter that changes whenever indexed data may have changed (for result caching)."""
+        ...
+
+    def read_cursor(self) -> AbstractContextManager[None]:
+        """Context in which the calling thread reads on its own cursor (concurrent read workers)."""
+        ...
+
     # Connection Management
     def connect(self) -> None:
         """Establish database connection and initialize schema."""
@@ -49,6 +59,18 @@ class DatabaseProvider(Protocol):
         """Drop vector index for specific provider/model/dims combination."""
         ...
 
+    def begin_bulk_index_mode(self) -> None:
+        """Start a bulk write session that defers vector index rebuilds until it ends."""
+        ...
+
+    def end_bulk_index_mode(self) -> int:
+        """End a bulk write session and rebuild any vector indexes dropped during it."""
+        ...
+
+    def get_index_status(self) -> dict[str, Any]:
+        """Get vector index maintenance status (bulk mode, stale tables)."""
+        ...
+
     # File Operations
     def insert_file(self, file: File) -> int:
         """Insert file record and return file ID."""
@@ -58,6 +80,10 @@ class DatabaseProvider(Protocol):
         """Get file record by path."""
         ...
 
+    def get_files_by_paths(self, paths: list[str]) -> dict[str, dict[str, Any]]:
+        """Get file records (with chunk_count) for many paths in one query."""
+        ...
+
     def get_file_by_id(self, file_id: int, as_model: bool = False) -> dict[str, Any] | File | None:
         """Get file record by ID."""
         ...
@@ -79,6 +105,26 @@ class DatabaseProvider(Protocol):
         """Insert multiple chunks in batch and return chunk IDs."""
         ...
 
+    def store_files_batch(self, file_batch: list[tuple[File, list[Chunk]]]) -> list[tuple[int, list[int]]]:
+        """Upsert files, replace their chunks and return (file_id, chunk_ids) in one transaction."""
+        ...
+
+    def apply_chunk_diff(
+        self,
+        file_id: int,
+        delete_ids: list[int],
+        moved_chunks: list[dict[str, Any]],
+        insert_chunks: list[Chunk]
+    ) -> list[int]:
+        """Delete, reposition and insert chunks of one file; returns inserted chunk IDs."""
+        ...
+
+    def update_files_batch(
+        self, file_diffs: list[tuple[File, list[int], list[dict[str, Any]], list[Chunk]]]
+    ) -> list[list[int]]:
+        """Update modified files and apply their chunk diffs in one transaction; returns inserted chunk IDs per file."""
+        ...
+
     def get_chunk_by_id(self, chunk_id: int, as_model: bool = False) -> dict[str, Any] | Chunk | None:
         """Get chunk record by ID."""
         ...
@@ -118,6 +164,30 @@ class DatabaseProvider(Protocol):
         """Get set of chunk IDs that already have embeddings for given provider/model."""
         ...
 
+    def set_embedding_storage(self, provider: str, model: str, dims: int, storage: str, keep_full: bool = True) -> None:
+        """Choose float, int8 or binary vector storage for a provider/model/dims partition."""
+        ...
+
+    def drop_embedding_partition(self, provider: str, model: str) -> int:
+        """Drop all stored vectors of a retired provider/model; returns partitions dropped."""
+        ...
+
+    def get_cached_embeddings(
+        self, provider: str, model: str, content_hashes: list[str], track_usage: bool = True
+    ) -> dict[str, list[float]]:
+        """Look up content-addressed cached embeddings by hash of normalized chunk text."""
+        ...
+
+    def cache_embeddings(
+        self, provider: str, model: str, entries: list[tuple[str, list[float]]], evict: bool = True
+    ) -> int:
+        """Store (content_hash, vector) pairs in the embedding cache."""
+        ...
+
+    def get_embedding_cache_stats(self) -> dict[str, int]:
+        """Get embedding cache entry count and hit/miss counters."""
+        ...
+
     def delete_embeddings_by_chunk_id(self, chunk_id: int) -> None:
         """Delete all embeddings for a specific chunk."""
         ...
@@ -131,7 +201,9 @@ class DatabaseProvider(Protocol):
         page_size: int = 10,
         offset: int = 0,
         threshold: float | None = None,
-        path_filter: str | None = None
+        path_filter: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """Perform semantic vector search.
         
@@ -140,31 +212,92 @@ class DatabaseProvider(Protocol):
             provider: Embedding provider name
             model: Embedding model name
             page_size: Number of results per page
-            offset: Starting position for pagination
+            offset: Starting position for pagination, ignored when cursor is set
             threshold: Optional similarity threshold
             path_filter: Optional relative path to limit search scope (e.g., 'src/', 'tests/')
+            cursor: Optional next_cursor from a previous page (keyset pagination)
+            include_total: Include an estimated total in the pagination metadata
         
         Returns:
             Tuple of (results, pagination_metadata)
         """
         ...
 
-    def search_regex(self, pattern: str, page_size: int = 10, offset: int = 0, path_filter: str | None = None) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    def search_regex(
+        self,
+        pattern: str,
+        page_size: int = 10,
+        offset: int = 0,
+        path_filter: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """Perform regex search on code content.
         
         Args:
             pattern: Regular expression pattern to search for
             page_size: Number of results per page
-            offset: Starting position for pagination
+            offset: Starting position for pagination, ignored when cursor is set
             path_filter: Optional relative path to limit search scope (e.g., 'src/', 'tests/')
+            cursor: Optional next_cursor from a previous page (keyset pagination)
+            include_total: Include the exact match count in the pagination metadata
         
         Returns:
             Tuple of (results, pagination_metadata)
         """
         ...
 
-    def search_text(self, query: str, page_size: int = 10, offset: int = 0) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        """Perform full-text search on code content.
+    def search_text(
+        self,
+        query: str,
+        page_size: int = 10,
+        offset: int = 0,
+        path_filter: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Perform BM25-ranked keyword search on chunk symbols and code.
+        
+        Args:
+            query: Keywords or identifiers; camelCase and snake_case names are
+                split into their parts
+            page_size: Number of results per page
+            offset: Starting position for pagination, ignored when cursor is set
+            path_filter: Optional relative path to limit search scope (e.g., 'src/', 'tests/')
+            cursor: Optional next_cursor from a previous page (keyset pagination)
+            include_total: Include the exact match count in the pagination metadata
+        
+        Returns:
+            Tuple of (results, pagination_metadata)
+        """
+        ...
+
+    def search_hybrid(
+        self,
+        query: str,
+        query_embedding: list[float] | None,
+        provider: str | None = None,
+        model: str | None = None,
+        page_size: int = 10,
+        offset: int = 0,
+        path_filter: str | None = None,
+        cursor: str | None = None,
+        regex_pattern: str | None = None,
+        include_total: bool = False
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Perform hybrid search fusing vector and BM25 rankings (reciprocal rank fusion).
+        
+        Args:
+            query: Query text for the keyword leg
+            query_embedding: Query embedding for the vector leg, or None for keywords only
+            provider: Embedding provider name
+            model: Embedding model name
+            page_size: Number of results per page
+            offset: Starting position for pagination, ignored when cursor is set
+            path_filter: Optional relative path to limit search scope (e.g., 'src/', 'tests/')
+            cursor: Optional next_cursor from a previous page (keyset pagination)
+            regex_pattern: Optional regular expression results must match
+            include_total: Include the number of fused candidates in the pagination metadata
         
         Returns:
             Tuple of (results, pagination_metadata)
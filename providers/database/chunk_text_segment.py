@@ -0,0 +1,183 @@
+"""Memory-mapped chunk text segment scanned by Python regex worker processes.
+
+Alternative backend for search_regex when DuckDB's RE2-based regexp_matches is
+too slow or does not support the pattern (backreferences, lookarounds). Chunk
+code is exported into one contiguous UTF-8 file with a chunk_id -> (start, end)
+offset map. The segment is kept current incrementally: new chunks are appended
+and deleted chunks forgotten, which is enough because chunk code is never
+rewritten in place. Searches split the requested chunks into shards scanned with
+Python's re module in worker processes that each mmap the same file, so chunk
+text never crosses the process boundary.
+"""
+
+import mmap
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from loguru import logger
+
+# Chunks per worker task; requests up to this size are matched in-process
+_SHARD_SIZE = 512
+
+# Rows fetched per round trip while exporting chunk code
+_EXPORT_BATCH_SIZE = 5000
+
+
+def _match_spans(segment_path: str, pattern: str, spans: list[tuple[int, int, int]]) -> list[int]:
+    """Return the chunk IDs of spans (chunk_id, start, end) whose text matches pattern."""
+    compiled = re.compile(pattern)
+    matched = []
+    with open(segment_path, "rb") as segment_file:
+        with mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for chunk_id, start, end in spans:
+                if compiled.search(view[start:end].decode("utf-8")):
+                    matched.append(chunk_id)
+    return matched
+
+
+class ChunkTextSegment:
+    """Chunk code exported to a memory-mapped file for Python regex scans."""
+
+    def __init__(self, max_workers: int = 4):
+        """Initialize an empty segment backed by a temporary file.
+
+        Args:
+            max_workers: Number of worker processes; 1 matches in-process
+        """
+        fd, self._path = tempfile.mkstemp(prefix="chunkhound-chunks-", suffix=".seg")
+        os.close(fd)
+        self._spans: dict[int, tuple[int, int]] = {}
+        self._size = 0
+        self._dead_bytes = 0
+        self._max_workers = max(1, max_workers)
+        self._executor: ProcessPoolExecutor | None = None
+
+        # Read workers search from several threads; compaction rewrites the file
+        self._lock = threading.Lock()
+
+    @property
+    def chunk_count(self) -> int:
+        """Number of chunks currently exported."""
+        return len(self._spans)
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the segment file, including text of deleted chunks."""
+        return self._size
+
+    def sync(self, connection: Any) -> None:
+        """Bring the segment up to date with the chunks table.
+
+        Chunks with an ID above the newest exported one are appended. Only when
+        the number of chunks at or below it differs from the exported count is
+        the full ID list read to forget deleted chunks and pick up late commits.
+        Once deleted text outweighs live text the file is rewritten.
+
+        Args:
+            connection: DuckDB connection holding the chunks table
+        """
+        with self._lock:
+            self._sync(connection)
+
+    def _sync(self, connection: Any) -> None:
+        max_chunk_id = max(self._spans, default=0)
+        live_count = connection.execute(
+            "SELECT COUNT(*) FROM chunks WHERE id <= ?", [max_chunk_id]
+        ).fetchone()[0]
+
+        missing_ids: list[int] = []
+        if live_count != len(self._spans):
+            live_ids = {
+                row[0] for row in
+                connection.execute("SELECT id FROM chunks WHERE id <= ?", [max_chunk_id]).fetchall()
+            }
+            for chunk_id in [chunk_id for chunk_id in self._spans if chunk_id not in live_ids]:
+                start, end = self._spans.pop(chunk_id)
+                self._dead_bytes += end - start
+            missing_ids = sorted(live_ids.difference(self._spans))
+
+        if self._dead_bytes > self._size - self._dead_bytes:
+            logger.debug(f"Compacting chunk text segment ({self._dead_bytes} dead bytes)")
+            self._spans.clear()
+            self._size = 0
+            self._dead_bytes = 0
+            missing_ids = []
+            max_chunk_id = 0
+            with open(self._path, "wb"):
+                pass
+
+        if missing_ids:
+            self._append(connection.execute(
+                "SELECT id, code FROM chunks WHERE id IN (SELECT unnest(?::BIGINT[]))", [missing_ids]
+            ))
+        self._append(connection.execute(
+            "SELECT id, code FROM chunks WHERE id > ? ORDER BY id", [max_chunk_id]
+        ))
+
+    def _append(self, result: Any) -> None:
+        """Append (id, code) rows from a query result to the segment file."""
+        with open(self._path, "ab") as segment_file:
+            while rows := result.fetchmany(_EXPORT_BATCH_SIZE):
+                for chunk_id, code in rows:
+                    data = code.encode("utf-8")
+                    segment_file.write(data)
+                    self._spans[chunk_id] = (self._size, self._size + len(data))
+                    self._size += len(data)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that holds an open DuckDB connection and
+            # background threads is not safe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.debug(f"Started regex pool with {self._max_workers} workers")
+        return self._executor
+
+    def search(self, pattern: str, chunk_ids: list[int]) -> set[int]:
+        """Match pattern against the text of the given chunks.
+
+        Args:
+            pattern: Python regular expression
+            chunk_ids: Chunks to test; IDs not in the segment are skipped
+
+        Returns:
+            IDs of the chunks whose code contains a match
+
+        Raises:
+            re.error: If the pattern does not compile
+        """
+        re.compile(pattern)
+        with self._lock:
+            return self._search(pattern, chunk_ids)
+
+    def _search(self, pattern: str, chunk_ids: list[int]) -> set[int]:
+        spans = [(chunk_id, *self._spans[chunk_id]) for chunk_id in chunk_ids if chunk_id in self._spans]
+        if not spans:
+            return set()
+
+        if len(spans) <= _SHARD_SIZE or self._max_workers == 1:
+            return set(_match_spans(self._path, pattern, spans))
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(_match_spans, self._path, pattern, spans[i:i + _SHARD_SIZE])
+            for i in range(0, len(spans), _SHARD_SIZE)
+        ]
+        return {chunk_id for future in futures for chunk_id in future.result()}
+
+    def close(self) -> None:
+        """Stop the worker processes and delete the segment file."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        try:
+            os.unlink(self._path)
+        except OSError:
+            pass
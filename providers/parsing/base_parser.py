@@ -9,6 +9,8 @@ from loguru import logger
 from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig, ParseResult
+from providers.parsing.incremental import parse_source
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Language as TSLanguage
@@ -121,6 +123,7 @@ class TreeSitterParserBase:
         """
         start_time = time.time()
         chunks = []
+        changed_ranges = None
         errors = []
         warnings = []
 
@@ -155,7 +158,7 @@ class TreeSitterParserBase:
                     metadata={"file_path": str(file_path)}
                 )
 
-            tree = self._parser.parse(bytes(source, 'utf8'))
+            tree, changed_ranges = parse_source(self._parser, file_path, source)
 
             # Extract semantic units - delegate to subclass
             chunks = self._extract_chunks(tree.root_node, source, file_path)
@@ -174,7 +177,7 @@ class TreeSitterParserBase:
             parse_time=time.time() - start_time,
             errors=errors,
             warnings=warnings,
-            metadata={"file_path": str(file_path)}
+            metadata={"file_path": str(file_path), "changed_ranges": changed_ranges}
         )
 
     def _extract_chunks(self, tree_node: TSNode, source: str, file_path: Path) -> list[dict[str, Any]]:
@@ -257,7 +260,7 @@ class TreeSitterParserBase:
             
         try:
             for pattern in comment_patterns:
-                query = self._language.query(pattern)
+                query = get_query(self._language, pattern)
                 matches = query.matches(tree_node)
                 
                 for match in matches:
@@ -311,7 +314,7 @@ class TreeSitterParserBase:
             
         try:
             for pattern, context in docstring_patterns:
-                query = self._language.query(pattern)
+                query = get_query(self._language, pattern)
                 matches = query.matches(tree_node)
                 
                 for match in matches:
@@ -9,6 +9,8 @@ from loguru import logger
 from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig, ParseResult
+from providers.parsing.incremental import parse_source
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Language as TSLanguage
@@ -144,6 +146,7 @@ class CParser:
         """
         start_time = time.time()
         chunks = []
+        changed_ranges = None
         errors = []
         warnings = []
 
@@ -178,7 +181,7 @@ class CParser:
                     metadata={"file_path": str(file_path)}
                 )
 
-            tree = self._parser.parse(bytes(source, 'utf8'))
+            tree, changed_ranges = parse_source(self._parser, file_path, source)
 
             # Extract semantic units
             chunks = self._extract_chunks(tree.root_node, source, file_path)
@@ -197,7 +200,7 @@ class CParser:
             parse_time=time.time() - start_time,
             errors=errors,
             warnings=warnings,
-            metadata={"file_path": str(file_path)}
+            metadata={"file_path": str(file_path), "changed_ranges": changed_ranges}
         )
 
     def _extract_chunks(
@@ -277,7 +280,7 @@ class CParser:
                 return chunks
 
             # Query for function definitions
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_definition
                     declarator: (function_declarator
                         declarator: (identifier) @function_name
@@ -318,7 +321,7 @@ class CParser:
                 return chunks
 
             # Query for struct and union declarations
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (struct_specifier
                     name: (type_identifier) @struct_name
                 ) @struct_def
@@ -371,7 +374,7 @@ class CParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (enum_specifier
                     name: (type_identifier) @enum_name
                 ) @enum_def
@@ -410,7 +413,7 @@ class CParser:
                 return chunks
 
             # Query for global variable declarations (not inside functions/structs)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (translation_unit
                     (declaration
                         declarator: (init_declarator
@@ -458,7 +461,7 @@ class CParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (type_definition
                     declarator: (type_identifier) @typedef_name
                 ) @typedef_def
@@ -497,7 +500,7 @@ class CParser:
                 return chunks
 
             # Query for preprocessor definitions
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (preproc_def
                     name: (identifier) @macro_name
                 ) @macro_def
@@ -590,7 +593,7 @@ class CParser:
             
         try:
             # Extract documentation comments (/** ... */)
-            query = self._language.query("(comment) @comment")
+            query = get_query(self._language, "(comment) @comment")
             matches = query.matches(tree_node)
             
             for match in matches:
@@ -651,7 +654,7 @@ class CParser:
             
         try:
             for pattern in comment_patterns:
-                query = self._language.query(pattern)
+                query = get_query(self._language, pattern)
                 matches = query.matches(tree_node)
                 
                 for match in matches:
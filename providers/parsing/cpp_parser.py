@@ -9,6 +9,8 @@ from loguru import logger
 from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig, ParseResult
+from providers.parsing.incremental import parse_source
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Language as TSLanguage
@@ -145,6 +147,7 @@ class CppParser:
         """
         start_time = time.time()
         chunks = []
+        changed_ranges = None
         errors = []
         warnings = []
 
@@ -179,7 +182,7 @@ class CppParser:
                     metadata={"file_path": str(file_path)}
                 )
 
-            tree = self._parser.parse(bytes(source, 'utf8'))
+            tree, changed_ranges = parse_source(self._parser, file_path, source)
 
             # Extract semantic units
             chunks = self._extract_chunks(tree.root_node, source, file_path)
@@ -198,7 +201,7 @@ class CppParser:
             parse_time=time.time() - start_time,
             errors=errors,
             warnings=warnings,
-            metadata={"file_path": str(file_path)}
+            metadata={"file_path": str(file_path), "changed_ranges": changed_ranges}
         )
 
     def _extract_chunks(
@@ -308,7 +311,7 @@ class CppParser:
                 return chunks
 
             # Simplified query for function definitions
-            query = self._language.query("(function_definition) @function_def")
+            query = get_query(self._language, "(function_definition) @function_def")
 
             matches = query.matches(tree_node)
 
@@ -352,7 +355,7 @@ class CppParser:
                 return chunks
 
             # Query for class, struct, and union declarations
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_specifier
                     name: (type_identifier) @class_name
                 ) @class_def
@@ -429,7 +432,7 @@ class CppParser:
 
             # Simplified query for namespace definitions
             # Note: This might need adjustment based on tree-sitter-cpp grammar
-            query = self._language.query("(namespace_definition) @namespace_def")
+            query = get_query(self._language, "(namespace_definition) @namespace_def")
 
             matches = query.matches(tree_node)
 
@@ -471,7 +474,7 @@ class CppParser:
                 return chunks
 
             # Query for enum definitions (including enum class)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (enum_specifier
                     name: (type_identifier) @enum_name
                 ) @enum_def
@@ -510,7 +513,7 @@ class CppParser:
                 return chunks
 
             # Query for global variable declarations (not inside functions/classes)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (translation_unit
                     (declaration
                         declarator: (init_declarator
@@ -559,7 +562,7 @@ class CppParser:
                 return chunks
 
             # Query for type declarations (typedef, using, type aliases)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (type_definition
                     declarator: (type_identifier) @typedef_name
                 ) @typedef_def
@@ -625,7 +628,7 @@ class CppParser:
                 return chunks
 
             # Query for preprocessor definitions
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (preproc_def
                     name: (identifier) @macro_name
                 ) @macro_def
@@ -718,7 +721,7 @@ class CppParser:
             
         try:
             # Extract documentation comments (/** ... */ and ///)
-            query = self._language.query("(comment) @comment")
+            query = get_query(self._language, "(comment) @comment")
             matches = query.matches(tree_node)
             
             for match in matches:
@@ -781,7 +784,7 @@ class CppParser:
             
         try:
             for pattern in comment_patterns:
-                query = self._language.query(pattern)
+                query = get_query(self._language, pattern)
                 matches = query.matches(tree_node)
                 
                 for match in matches:
@@ -9,6 +9,8 @@ from loguru import logger
 from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig, ParseResult
+from providers.parsing.incremental import parse_source
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Language as TSLanguage
@@ -120,6 +122,7 @@ class CSharpParser:
         """
         start_time = time.time()
         chunks = []
+        changed_ranges = None
         errors = []
         warnings = []
 
@@ -154,7 +157,7 @@ class CSharpParser:
                     metadata={"file_path": str(file_path)}
                 )
 
-            tree = self._parser.parse(bytes(source, 'utf8'))
+            tree, changed_ranges = parse_source(self._parser, file_path, source)
 
             # Extract namespace context
             namespace_nodes = self._extract_namespace_nodes(tree.root_node, source)
@@ -222,6 +225,7 @@ class CSharpParser:
             warnings=warnings,
             metadata={
                 "file_path": str(file_path),
+                "changed_ranges": changed_ranges,
                 "namespace_count": len(namespace_nodes) if namespace_nodes else 0
             }
         )
@@ -238,7 +242,7 @@ class CSharpParser:
             if self._language is None:
                 return namespace_nodes
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (namespace_declaration
                     name: (qualified_name) @namespace_name
                 ) @namespace_def
@@ -276,7 +280,7 @@ class CSharpParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration
                     name: (identifier) @class_name
                 ) @class_def
@@ -347,7 +351,7 @@ class CSharpParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (interface_declaration
                     name: (identifier) @interface_name
                 ) @interface_def
@@ -412,7 +416,7 @@ class CSharpParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (struct_declaration
                     name: (identifier) @struct_name
                 ) @struct_def
@@ -477,7 +481,7 @@ class CSharpParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (enum_declaration
                     name: (identifier) @enum_name
                 ) @enum_def
@@ -536,7 +540,7 @@ class CSharpParser:
                 return method_chunks
 
             # Find all classes and structs first to associate methods with their parents
-            parent_query = self._language.query("""
+            parent_query = get_query(self._language, """
                 (class_declaration
                     name: (identifier) @class_name
                 ) @class_def
@@ -585,7 +589,7 @@ class CSharpParser:
                 if self._language is None:
                     continue
 
-                method_query = self._language.query("""
+                method_query = get_query(self._language, """
                     (method_declaration
                         name: (identifier) @method_name
                     ) @method_def
@@ -691,7 +695,7 @@ class CSharpParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration
                     name: (identifier) @nested_class_name
                 ) @nested_class_def
@@ -815,7 +819,7 @@ class CSharpParser:
                 return chunks
 
             # Query for comment nodes
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (comment) @comment
             """)
 
@@ -878,7 +882,7 @@ class CSharpParser:
                 return chunks
 
             # Query for XML doc comment nodes
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (comment) @xmldoc
             """)
 
@@ -9,6 +9,8 @@ from loguru import logger
 from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig, ParseResult
+from providers.parsing.incremental import parse_source
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Language as TSLanguage
@@ -140,6 +142,7 @@ class GoParser:
         """
         start_time = time.time()
         chunks = []
+        changed_ranges = None
         errors = []
         warnings = []
 
@@ -174,7 +177,7 @@ class GoParser:
                     metadata={"file_path": str(file_path)}
                 )
 
-            tree = self._parser.parse(bytes(source, 'utf8'))
+            tree, changed_ranges = parse_source(self._parser, file_path, source)
 
             # Extract package name for context
             package_name = self._extract_package(tree.root_node, source) if tree else ""
@@ -215,6 +218,7 @@ class GoParser:
             warnings=warnings,
             metadata={
                 "file_path": str(file_path),
+                "changed_ranges": changed_ranges,
                 "package_name": package_name if 'package_name' in locals() else ""
             }
         )
@@ -237,7 +241,7 @@ class GoParser:
             if self._language is None:
                 return ""
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (package_clause
                     (package_identifier) @package_name
                 ) @package_def
@@ -271,7 +275,7 @@ class GoParser:
                 return chunks
 
             # Query for function declarations (regular functions, not methods)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_declaration
                     name: (identifier) @func_name
                 ) @func_def
@@ -346,7 +350,7 @@ class GoParser:
                 return chunks
 
             # Query for method declarations (functions with receivers)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (method_declaration
                     receiver: (parameter_list
                         (parameter_declaration
@@ -434,7 +438,7 @@ class GoParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (type_declaration
                     (type_spec
                         name: (type_identifier) @struct_name
@@ -495,7 +499,7 @@ class GoParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (type_declaration
                     (type_spec
                         name: (type_identifier) @interface_name
@@ -557,7 +561,7 @@ class GoParser:
                 return chunks
 
             # Query for type aliases (not structs or interfaces)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (type_declaration
                     (type_spec
                         name: (type_identifier) @type_name
@@ -625,7 +629,7 @@ class GoParser:
                 return chunks
 
             # Query for var and const declarations
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (var_declaration) @var_def
                 (const_declaration) @const_def
             """)
@@ -741,7 +745,7 @@ class GoParser:
                 return names
 
             # Use tree-sitter query to find specific variable/constant identifiers
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (var_spec
                     name: (identifier) @var_name
                 )
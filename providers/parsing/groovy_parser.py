@@ -9,6 +9,7 @@ from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig
 from providers.parsing.base_parser import TreeSitterParserBase
+from providers.parsing.queries import get_query
 
 try:
     import tree_sitter_groovy
@@ -182,7 +183,7 @@ class GroovyParser(TreeSitterParserBase):
                 return ""
 
             # Groovy package declaration structure
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (package_declaration
                     (scoped_identifier) @package_name
                 ) @package_def
@@ -219,7 +220,7 @@ class GroovyParser(TreeSitterParserBase):
                 return chunks
 
             # Query for class declarations
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration
                     name: (identifier) @class_name
                 ) @class_def
@@ -262,7 +263,7 @@ class GroovyParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (interface_declaration
                     name: (identifier) @interface_name
                 ) @interface_def
@@ -305,7 +306,7 @@ class GroovyParser(TreeSitterParserBase):
                 return chunks
 
             # Groovy traits are class_declaration with @Trait annotation
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration
                     (modifiers) @modifiers
                     (identifier) @trait_name
@@ -359,7 +360,7 @@ class GroovyParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (enum_declaration
                     name: (identifier) @enum_name
                 ) @enum_def
@@ -402,7 +403,7 @@ class GroovyParser(TreeSitterParserBase):
                 return chunks
 
             # Query for methods and constructors within classes
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (method_declaration
                     name: (identifier) @method_name
                 ) @method_def
@@ -486,7 +487,7 @@ class GroovyParser(TreeSitterParserBase):
                 return chunks
 
             # Query for closure expressions (they are 'closure' nodes)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (closure) @closure_def
             """)
 
@@ -0,0 +1,134 @@
+"""Incremental tree-sitter reparsing shared by the parser providers.
+
+The previous tree and source of every parsed file are kept in the TreeCache.
+When the same file is parsed again, the edit between the two sources is derived
+from their common prefix and suffix and applied to the old tree with Tree.edit().
+Parser.parse() then reuses every subtree outside the edit, so a small change in a
+large file reparses in milliseconds.
+"""
+
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from chunkhound.tree_cache import TreeCache, get_default_cache
+
+# Prefix/suffix scan compares blocks of this size before narrowing to the byte
+_SCAN_BLOCK = 4096
+
+
+def common_prefix_length(old: bytes, new: bytes) -> int:
+    """Length of the longest common prefix of two byte strings."""
+    limit = min(len(old), len(new))
+    old_view, new_view = memoryview(old), memoryview(new)
+    offset = 0
+    while offset < limit:
+        end = min(offset + _SCAN_BLOCK, limit)
+        if old_view[offset:end] != new_view[offset:end]:
+            while old[offset] == new[offset]:
+                offset += 1
+            return offset
+        offset = end
+    return limit
+
+
+def common_suffix_length(old: bytes, new: bytes, limit: int) -> int:
+    """Length of the longest common suffix of two byte strings, at most limit."""
+    old_view, new_view = memoryview(old), memoryview(new)
+    old_len, new_len = len(old), len(new)
+    matched = 0
+    while matched < limit:
+        step = min(_SCAN_BLOCK, limit - matched)
+        if (old_view[old_len - matched - step:old_len - matched]
+                != new_view[new_len - matched - step:new_len - matched]):
+            while old[old_len - matched - 1] == new[new_len - matched - 1]:
+                matched += 1
+            return matched
+        matched += step
+    return limit
+
+
+def _point_at(source: bytes, byte_offset: int) -> tuple[int, int]:
+    """Tree-sitter (row, column) point of a byte offset; column is in bytes."""
+    row = source.count(b"\n", 0, byte_offset)
+    line_start = source.rfind(b"\n", 0, byte_offset) + 1
+    return row, byte_offset - line_start
+
+
+def _range_to_dict(start_byte: int, end_byte: int,
+                   start_point: Any, end_point: Any) -> dict[str, Any]:
+    return {
+        "start_byte": start_byte,
+        "end_byte": end_byte,
+        "start_point": tuple(start_point),
+        "end_point": tuple(end_point),
+    }
+
+
+def parse_source(
+    parser: Any, file_path: Path, source: str, cache: TreeCache | None = None
+) -> tuple[Any, list[dict[str, Any]] | None]:
+    """Parse source with tree-sitter, reusing the previous tree of file_path.
+
+    Args:
+        parser: Tree-sitter parser for the file's language
+        file_path: Path identifying the file in the tree cache
+        source: Current source text
+        cache: Tree cache holding previous trees, the default cache if None
+
+    Returns:
+        Tuple of (tree, changed_ranges). changed_ranges is None after a full
+        parse; after an incremental reparse it lists the changed regions in new
+        source coordinates as dicts with start_byte/end_byte/start_point/end_point,
+        the format IncrementalChunker accepts.
+    """
+    cache = cache or get_default_cache()
+    new_source = bytes(source, "utf8")
+
+    previous = cache.pop_for_reparse(file_path)
+    if previous is not None and previous[2] != parser.language:
+        previous = None
+
+    if previous is None:
+        tree = parser.parse(new_source)
+        cache.put(file_path, tree, new_source, parser.language)
+        return tree, None
+
+    old_tree, old_source, language = previous
+    if old_source == new_source:
+        cache.put(file_path, old_tree, old_source, language)
+        return old_tree, []
+
+    prefix = common_prefix_length(old_source, new_source)
+    suffix = common_suffix_length(
+        old_source, new_source, min(len(old_source), len(new_source)) - prefix
+    )
+    old_end_byte = len(old_source) - suffix
+    new_end_byte = len(new_source) - suffix
+    start_point = _point_at(new_source, prefix)
+    new_end_point = _point_at(new_source, new_end_byte)
+
+    old_tree.edit(
+        start_byte=prefix,
+        old_end_byte=old_end_byte,
+        new_end_byte=new_end_byte,
+        start_point=start_point,
+        old_end_point=_point_at(old_source, old_end_byte),
+        new_end_point=new_end_point,
+    )
+    tree = parser.parse(new_source, old_tree)
+    cache.put(file_path, tree, new_source, parser.language)
+
+    # changed_ranges() only reports structural changes; an edit inside a token
+    # keeps the tree shape, so the edited span itself is always included
+    changed_ranges = [_range_to_dict(prefix, new_end_byte, start_point, new_end_point)]
+    changed_ranges.extend(
+        _range_to_dict(r.start_byte, r.end_byte, r.start_point, r.end_point)
+        for r in old_tree.changed_ranges(tree)
+    )
+    logger.debug(
+        f"Incremental reparse of {file_path}: edit {prefix}-{old_end_byte} -> "
+        f"{prefix}-{new_end_byte}, {len(changed_ranges) - 1} structural changes"
+    )
+    return tree, changed_ranges
@@ -9,6 +9,8 @@ from loguru import logger
 from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig, ParseResult
+from providers.parsing.incremental import parse_source
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Language as TSLanguage
@@ -118,6 +120,7 @@ class JavaParser:
         """
         start_time = time.time()
         chunks = []
+        changed_ranges = None
         errors = []
         warnings = []
 
@@ -152,7 +155,7 @@ class JavaParser:
                     metadata={"file_path": str(file_path)}
                 )
 
-            tree = self._parser.parse(bytes(source, 'utf8'))
+            tree, changed_ranges = parse_source(self._parser, file_path, source)
 
             # Extract package name for context
             package_name = self._extract_package(tree.root_node, source) if tree else ""
@@ -193,6 +196,7 @@ class JavaParser:
             warnings=warnings,
             metadata={
                 "file_path": str(file_path),
+                "changed_ranges": changed_ranges,
                 "package_name": package_name if 'package_name' in locals() else ""
             }
         )
@@ -215,7 +219,7 @@ class JavaParser:
             if self._language is None:
                 return ""
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (package_declaration) @package_def
             """)
 
@@ -252,7 +256,7 @@ class JavaParser:
                 return chunks
 
             # Query for top-level classes
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration
                     name: (identifier) @class_name
                 ) @class_def
@@ -330,7 +334,7 @@ class JavaParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (interface_declaration
                     name: (identifier) @interface_name
                 ) @interface_def
@@ -402,7 +406,7 @@ class JavaParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (enum_declaration
                     name: (identifier) @enum_name
                 ) @enum_def
@@ -468,7 +472,7 @@ class JavaParser:
                 return method_chunks
 
             # Find all classes first to associate methods with their classes
-            class_query = self._language.query("""
+            class_query = get_query(self._language, """
                 (class_declaration
                     name: (identifier) @class_name
                 ) @class_def
@@ -506,7 +510,7 @@ class JavaParser:
                 if self._language is None:
                     continue
 
-                method_query = self._language.query("""
+                method_query = get_query(self._language, """
                     (method_declaration
                         name: (identifier) @method_name
                     ) @method_def
@@ -629,7 +633,7 @@ class JavaParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration
                     name: (identifier) @inner_class_name
                 ) @inner_class_def
@@ -791,7 +795,7 @@ class JavaParser:
 
             # Query for comment nodes (Java tree-sitter might not support comment queries)
             try:
-                query = self._language.query("""
+                query = get_query(self._language, """
                     (line_comment) @comment
                     (block_comment) @comment
                 """)
@@ -860,7 +864,7 @@ class JavaParser:
 
             # Query for Javadoc comment nodes (Java tree-sitter might not support comment queries)
             try:
-                query = self._language.query("""
+                query = get_query(self._language, """
                     (block_comment) @javadoc
                 """)
             except Exception:
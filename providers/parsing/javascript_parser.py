@@ -9,6 +9,7 @@ from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig
 from providers.parsing.base_parser import TreeSitterParserBase
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Node as TSNode
@@ -101,7 +102,7 @@ class JavaScriptParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_declaration
                     name: (identifier) @function_name
                 ) @function_def
@@ -168,7 +169,7 @@ class JavaScriptParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration
                     name: (identifier) @class_name
                 ) @class_def
@@ -213,7 +214,7 @@ class JavaScriptParser(TreeSitterParserBase):
                 return chunks
 
             # Look for function components (functions returning JSX)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_declaration
                     name: (identifier) @component_name
                 ) @component_def
@@ -292,7 +293,7 @@ class JavaScriptParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (method_definition) @method_def
             """)
 
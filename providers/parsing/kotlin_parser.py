@@ -9,6 +9,8 @@ from loguru import logger
 from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig, ParseResult
+from providers.parsing.incremental import parse_source
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Language as TSLanguage
@@ -144,6 +146,7 @@ class KotlinParser:
         """
         start_time = time.time()
         chunks = []
+        changed_ranges = None
         errors = []
         warnings = []
 
@@ -178,7 +181,7 @@ class KotlinParser:
                     metadata={"file_path": str(file_path)}
                 )
 
-            tree = self._parser.parse(bytes(source, 'utf8'))
+            tree, changed_ranges = parse_source(self._parser, file_path, source)
 
             # Extract semantic units
             chunks = self._extract_chunks(tree.root_node, source, file_path)
@@ -197,7 +200,7 @@ class KotlinParser:
             parse_time=time.time() - start_time,
             errors=errors,
             warnings=warnings,
-            metadata={"file_path": str(file_path)}
+            metadata={"file_path": str(file_path), "changed_ranges": changed_ranges}
         )
 
     def _extract_chunks(
@@ -287,7 +290,7 @@ class KotlinParser:
             if self._language is None:
                 return ""
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (package_header) @package_def
             """)
 
@@ -325,7 +328,7 @@ class KotlinParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration) @class_def
             """)
 
@@ -374,7 +377,7 @@ class KotlinParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration
                     (modifiers
                         (class_modifier "data")
@@ -423,7 +426,7 @@ class KotlinParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (object_declaration
                     name: (simple_identifier) @object_name
                 ) @object_def
@@ -469,7 +472,7 @@ class KotlinParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (companion_object
                     name: (simple_identifier)? @companion_name
                 ) @companion_def
@@ -525,7 +528,7 @@ class KotlinParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration) @interface_def
             """)
 
@@ -579,7 +582,7 @@ class KotlinParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration) @enum_def
             """)
 
@@ -633,7 +636,7 @@ class KotlinParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_declaration) @function_def
             """)
 
@@ -696,7 +699,7 @@ class KotlinParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (property_declaration
                     (variable_declaration
                         (simple_identifier) @property_name
@@ -811,7 +814,7 @@ class KotlinParser:
             
         try:
             # Kotlin tree-sitter may not support multiline_comment queries
-            query = self._language.query("(multiline_comment) @comment")
+            query = get_query(self._language, "(multiline_comment) @comment")
             matches = query.matches(tree_node)
             
             for match in matches:
@@ -869,7 +872,7 @@ class KotlinParser:
             
         try:
             for pattern in comment_patterns:
-                query = self._language.query(pattern)
+                query = get_query(self._language, pattern)
                 matches = query.matches(tree_node)
                 
                 for match in matches:
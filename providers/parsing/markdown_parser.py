@@ -9,6 +9,8 @@ from loguru import logger
 from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig, ParseResult
+from providers.parsing.incremental import parse_source
+from providers.parsing.queries import get_query
 
 try:
     import tree_sitter_markdown as tsmarkdown
@@ -139,6 +141,7 @@ class MarkdownParser:
         """
         start_time = time.time()
         chunks = []
+        changed_ranges = None
         errors = []
         warnings = []
 
@@ -173,7 +176,7 @@ class MarkdownParser:
                     metadata={"file_path": str(file_path)}
                 )
 
-            tree = self._parser.parse(bytes(source, 'utf8'))
+            tree, changed_ranges = parse_source(self._parser, file_path, source)
 
             # Extract semantic units
             if any(ht in self._config.chunk_types for ht in [ChunkType.HEADER_1, ChunkType.HEADER_2, ChunkType.HEADER_3, ChunkType.HEADER_4, ChunkType.HEADER_5, ChunkType.HEADER_6]):
@@ -199,7 +202,7 @@ class MarkdownParser:
             parse_time=time.time() - start_time,
             errors=errors,
             warnings=warnings,
-            metadata={"file_path": str(file_path)}
+            metadata={"file_path": str(file_path), "changed_ranges": changed_ranges}
         )
 
     def _get_node_text(self, node: TSNode, source: str) -> str:
@@ -214,7 +217,7 @@ class MarkdownParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (atx_heading) @header
                 (setext_heading) @header
             """)
@@ -300,7 +303,7 @@ class MarkdownParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (fenced_code_block) @code_block
                 (indented_code_block) @code_block
             """)
@@ -374,7 +377,7 @@ class MarkdownParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (paragraph) @paragraph
             """)
 
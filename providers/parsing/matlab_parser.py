@@ -9,6 +9,7 @@ from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig
 from providers.parsing.base_parser import TreeSitterParserBase
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Language as TSLanguage
@@ -126,7 +127,7 @@ class MatlabParser(TreeSitterParserBase):
                 return chunks
 
             # Query for function definitions
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_definition
                     name: (identifier) @function_name
                 ) @function_def
@@ -183,7 +184,7 @@ class MatlabParser(TreeSitterParserBase):
                 return chunks
 
             # Query for class definitions
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_definition
                     name: (identifier) @class_name
                 ) @class_def
@@ -239,7 +240,7 @@ class MatlabParser(TreeSitterParserBase):
                 return chunks
 
             # Query for methods within the class - use broader approach
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_definition
                     name: (identifier) @method_name
                 ) @method_def
@@ -385,7 +386,7 @@ class MatlabParser(TreeSitterParserBase):
             if self._language is None:
                 return False
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_definition) @function_def
             """)
 
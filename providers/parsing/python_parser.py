@@ -9,6 +9,8 @@ from loguru import logger
 from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig, ParseResult
+from providers.parsing.incremental import parse_source
+from providers.parsing.queries import get_query
 
 try:
     import tree_sitter_python as tspython
@@ -115,6 +117,7 @@ class PythonParser:
         """
         start_time = time.time()
         chunks = []
+        changed_ranges = None
         errors = []
         warnings = []
 
@@ -149,7 +152,7 @@ class PythonParser:
                     metadata={"file_path": str(file_path)}
                 )
 
-            tree = self._parser.parse(bytes(source, 'utf8'))
+            tree, changed_ranges = parse_source(self._parser, file_path, source)
 
             # Extract semantic units
             if ChunkType.FUNCTION in self._config.chunk_types:
@@ -183,7 +186,7 @@ class PythonParser:
             parse_time=time.time() - start_time,
             errors=errors,
             warnings=warnings,
-            metadata={"file_path": str(file_path)}
+            metadata={"file_path": str(file_path), "changed_ranges": changed_ranges}
         )
 
     def _get_node_text(self, node: TSNode, source: str) -> str:
@@ -198,7 +201,7 @@ class PythonParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_definition
                     name: (identifier) @function_name
                 ) @function_def
@@ -259,7 +262,7 @@ class PythonParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_definition
                     name: (identifier) @class_name
                 ) @class_def
@@ -331,7 +334,7 @@ class PythonParser:
                 return chunks
 
             # Query for methods within the class body
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_definition
                     name: (identifier) @method_name
                 ) @method_def
@@ -472,7 +475,7 @@ class PythonParser:
                 return chunks
                 
             # Query for all string nodes that are docstrings
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (module . (expression_statement (string) @module_docstring))
                 (function_definition body: (block . (expression_statement (string) @function_docstring)))
                 (class_definition body: (block . (expression_statement (string) @class_docstring)))
@@ -540,7 +543,7 @@ class PythonParser:
                 return chunks
                 
             # Query for comment nodes
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (comment) @comment
             """)
             
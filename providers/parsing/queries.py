@@ -0,0 +1,50 @@
+"""Compiled tree-sitter query registry shared by the parser providers.
+
+Compiling a query costs milliseconds, while running it over a typical file costs
+microseconds. Parsers therefore look their queries up here instead of calling
+Language.query() on every extraction pass; each (language, pattern) pair is
+compiled once per process and reused by every parser instance.
+"""
+
+from threading import Lock
+from typing import Any
+
+_compiled_queries: dict[tuple[Any, str], Any] = {}
+_lock = Lock()
+
+
+def get_query(language: Any, pattern: str) -> Any:
+    """Get the compiled query for a pattern, compiling it on first use.
+
+    Queries are shared; callers must not set byte or point ranges on them.
+
+    Args:
+        language: Tree-sitter language the pattern is written for
+        pattern: Query source
+
+    Returns:
+        Compiled tree-sitter Query
+
+    Raises:
+        Exception: If the pattern does not compile for the language
+    """
+    key = (language, pattern)
+    query = _compiled_queries.get(key)
+    if query is None:
+        with _lock:
+            query = _compiled_queries.get(key)
+            if query is None:
+                query = language.query(pattern)
+                _compiled_queries[key] = query
+    return query
+
+
+def clear_query_cache() -> None:
+    """Drop all compiled queries."""
+    with _lock:
+        _compiled_queries.clear()
+
+
+def get_query_cache_size() -> int:
+    """Number of compiled queries currently registered."""
+    return len(_compiled_queries)
@@ -9,6 +9,8 @@ from loguru import logger
 from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig, ParseResult
+from providers.parsing.incremental import parse_source
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Language as TSLanguage
@@ -144,6 +146,7 @@ class RustParser:
         """
         start_time = time.time()
         chunks = []
+        changed_ranges = None
         errors = []
         warnings = []
 
@@ -178,7 +181,7 @@ class RustParser:
                     metadata={"file_path": str(file_path)}
                 )
 
-            tree = self._parser.parse(bytes(source, 'utf8'))
+            tree, changed_ranges = parse_source(self._parser, file_path, source)
 
             # Extract module path for context
             module_path = self._extract_module_path(tree.root_node, source, file_path) if tree else ""
@@ -238,6 +241,7 @@ class RustParser:
             warnings=warnings,
             metadata={
                 "file_path": str(file_path),
+                "changed_ranges": changed_ranges,
                 "module_path": module_path if 'module_path' in locals() else ""
             }
         )
@@ -271,7 +275,7 @@ class RustParser:
                 return chunks
 
             # Query for function declarations (not associated methods)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_item
                     name: (identifier) @func_name
                 ) @func_def
@@ -346,7 +350,7 @@ class RustParser:
                 return chunks
 
             # Query for method declarations in impl blocks
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (impl_item
                     type: (_) @impl_type
                     body: (declaration_list
@@ -434,7 +438,7 @@ class RustParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (struct_item
                     name: (type_identifier) @struct_name
                 ) @struct_def
@@ -492,7 +496,7 @@ class RustParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (enum_item
                     name: (type_identifier) @enum_name
                 ) @enum_def
@@ -550,7 +554,7 @@ class RustParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (trait_item
                     name: (type_identifier) @trait_name
                 ) @trait_def
@@ -608,7 +612,7 @@ class RustParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (impl_item
                     type: (_) @impl_type
                     trait: (_)? @trait_type
@@ -681,7 +685,7 @@ class RustParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (mod_item
                     name: (identifier) @mod_name
                 ) @mod_def
@@ -739,7 +743,7 @@ class RustParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (macro_definition
                     name: (identifier) @macro_name
                 ) @macro_def
@@ -798,7 +802,7 @@ class RustParser:
                 return chunks
 
             # Query for const and static declarations
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (const_item
                     name: (identifier) @const_name
                 ) @const_def
@@ -869,7 +873,7 @@ class RustParser:
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (type_item
                     name: (type_identifier) @type_name
                 ) @type_def
@@ -988,7 +992,7 @@ class RustParser:
             
         try:
             # Extract documentation comments (/// and /** ... */)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (line_comment) @doc_comment
                 (block_comment) @doc_comment
             """)
@@ -1067,7 +1071,7 @@ class RustParser:
             
         try:
             for pattern in comment_patterns:
-                query = self._language.query(pattern)
+                query = get_query(self._language, pattern)
                 matches = query.matches(tree_node)
                 
                 for match in matches:
@@ -9,6 +9,7 @@ from core.types import ChunkType
 from core.types import Language as CoreLanguage
 from interfaces.language_parser import ParseConfig
 from providers.parsing.base_parser import TreeSitterParserBase
+from providers.parsing.queries import get_query
 
 try:
     from tree_sitter import Node as TSNode
@@ -120,7 +121,7 @@ class TypeScriptParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_declaration
                     name: (identifier) @function_name
                 ) @function_def
@@ -196,7 +197,7 @@ class TypeScriptParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (class_declaration
                     name: (type_identifier) @class_name
                 ) @class_def
@@ -246,7 +247,7 @@ class TypeScriptParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (interface_declaration
                     name: (type_identifier) @interface_name
                 ) @interface_def
@@ -291,7 +292,7 @@ class TypeScriptParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (enum_declaration
                     name: (identifier) @enum_name
                 ) @enum_def
@@ -329,7 +330,7 @@ class TypeScriptParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (type_alias_declaration
                     name: (type_identifier) @type_name
                 ) @type_def
@@ -375,7 +376,7 @@ class TypeScriptParser(TreeSitterParserBase):
                 return chunks
 
             # Look for function components (functions returning JSX)
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (function_declaration
                     name: (identifier) @component_name
                 ) @component_def
@@ -454,7 +455,7 @@ class TypeScriptParser(TreeSitterParserBase):
             if self._language is None:
                 return chunks
 
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (method_definition
                     name: (_) @method_name
                 ) @method_def
@@ -566,7 +567,7 @@ class TypeScriptParser(TreeSitterParserBase):
                 return None
 
             # Use tree-sitter query to find type annotations
-            query = self._language.query("""
+            query = get_query(self._language, """
                 (type_annotation) @return_type
             """)
 
@@ -12,6 +12,8 @@ except ImportError:
     # Fallback for different execution contexts
     from core.types.common import Language
 
+from chunkhound.core.config.embedding_config import EmbeddingConfig
+
 # Import concrete providers with PyInstaller fallback
 try:
     from providers.database.duckdb_provider import DuckDBProvider
@@ -227,10 +229,20 @@ class ProviderRegistry:
 
         language_parsers = self.get_all_language_parsers()
 
+        # Files written per transaction during directory indexing (IndexingConfig.db_batch_size)
+        db_batch_size = int(os.getenv('CHUNKHOUND_DB_BATCH_SIZE',
+                                      self._config.get('database', {}).get('batch_size', 500)))
+
+        # Parse worker processes (IndexingConfig.max_concurrent); 1 parses in-process
+        parse_workers = int(os.getenv('CHUNKHOUND_PARSE_WORKERS',
+                                      self._config.get('indexing', {}).get('max_concurrent', 1)))
+
         return IndexingCoordinator(
             database_provider=database_provider,
             embedding_provider=embedding_provider,
-            language_parsers=language_parsers
+            language_parsers=language_parsers,
+            db_batch_size=db_batch_size,
+            parse_workers=parse_workers
         )
 
     def create_search_service(self) -> SearchService:
@@ -412,8 +424,23 @@ class ProviderRegistry:
             if hasattr(cls, '__name__'):
                 if 'DuckDBProvider' in cls.__name__:
                     # DuckDB provider needs db_path parameter and connection
-                    db_path = self._config.get('database', {}).get('path', 'chunkhound.db')
+                    database_config = self._config.get('database', {})
+                    db_path = database_config.get('path', 'chunkhound.db')
                     instance = cls(db_path)
+                    # Coarse-to-fine search prefix length (EmbeddingConfig.coarse_dimensions)
+                    instance.coarse_dims = self._config.get('embedding', {}).get('coarse_dimensions')
+                    # Embedding cache bounds (EmbeddingConfig.cache_max_entries / cache_max_age_days);
+                    # None disables a bound, so only missing keys fall back to the defaults
+                    embedding_config = self._config.get('embedding', {})
+                    instance.embedding_cache_max_entries = embedding_config.get(
+                        'cache_max_entries', EmbeddingConfig.model_fields['cache_max_entries'].default
+                    )
+                    instance.embedding_cache_max_age_days = embedding_config.get(
+                        'cache_max_age_days', EmbeddingConfig.model_fields['cache_max_age_days'].default
+                    )
+                    # Regex engine (DatabaseConfig.regex_backend / regex_workers)
+                    instance.regex_backend = database_config.get('regex_backend', 'sql')
+                    instance.regex_workers = database_config.get('regex_workers', 4)
                     instance.connect()
                     return instance
                 elif 'Database' in cls.__name__:
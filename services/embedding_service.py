@@ -6,6 +6,7 @@ from typing import Any
 from loguru import logger
 from tqdm import tqdm
 
+from core.models import chunk_content_hash
 from core.types import ChunkId
 from interfaces.database_provider import DatabaseProvider
 from interfaces.embedding_provider import EmbeddingProvider
@@ -80,8 +81,12 @@ class EmbeddingService(BaseService):
                 logger.debug("All chunks already have embeddings")
                 return 0
 
-            # Generate embeddings in batches
-            total_generated = await self._generate_embeddings_in_batches(filtered_chunks, show_progress)
+            # Generate embeddings in batches; HNSW rebuilds are deferred to the end
+            self._db.begin_bulk_index_mode()
+            try:
+                total_generated = await self._generate_embeddings_in_batches(filtered_chunks, show_progress)
+            finally:
+                self._db.end_bulk_index_mode()
 
             logger.debug(f"Successfully generated {total_generated} embeddings")
             return total_generated
@@ -120,8 +125,13 @@ class EmbeddingService(BaseService):
             if not chunk_ids_without_embeddings:
                 return {"status": "complete", "generated": 0, "message": "All chunks have embeddings"}
 
-            # Generate embeddings in streaming fashion (loads chunk content in batches)
-            generated_count = await self._generate_embeddings_streaming(chunk_ids_without_embeddings)
+            # Generate embeddings in streaming fashion (loads chunk content in batches).
+            # One bulk session spans all batches so HNSW indexes are rebuilt only once.
+            self._db.begin_bulk_index_mode()
+            try:
+                generated_count = await self._generate_embeddings_streaming(chunk_ids_without_embeddings)
+            finally:
+                self._db.end_bulk_index_mode()
 
             return {
                 "status": "success",
@@ -189,6 +199,53 @@ class EmbeddingService(BaseService):
             logger.error(f"Failed to regenerate embeddings: {e}")
             return {"status": "error", "error": str(e), "regenerated": 0}
 
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts through the content-addressed embedding cache.
+
+        Texts are keyed by (provider, model, hash of normalized text). Only texts
+        not found in the cache are sent to the provider, each distinct text once,
+        and their vectors are added to the cache.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per input text, in input order (empty if the provider
+            returned an unexpected number of vectors)
+        """
+        if not self._embedding_provider or not texts:
+            return []
+
+        provider_name = self._embedding_provider.name
+        model_name = self._embedding_provider.model
+
+        content_hashes = [self._content_hash(text) for text in texts]
+        vectors = self._db.get_cached_embeddings(provider_name, model_name, content_hashes)
+
+        # First occurrence of every distinct uncached text
+        missing: dict[str, str] = {}
+        for content_hash, text in zip(content_hashes, texts):
+            if content_hash not in vectors and content_hash not in missing:
+                missing[content_hash] = text
+
+        if missing:
+            new_vectors = await self._embedding_provider.embed(list(missing.values()))
+            if len(new_vectors) != len(missing):
+                logger.warning(f"Expected {len(missing)} embeddings from provider, got {len(new_vectors)}")
+                return []
+
+            new_entries = list(zip(missing.keys(), new_vectors))
+            self._db.cache_embeddings(provider_name, model_name, new_entries)
+            vectors.update(new_entries)
+
+        logger.debug(f"Embedded {len(texts)} texts: {len(texts) - len(missing)} from cache, {len(missing)} from provider")
+        return [list(vectors[content_hash]) for content_hash in content_hashes]
+
+    @staticmethod
+    def _content_hash(text: str) -> str:
+        """Hash chunk text after normalizing line endings and surrounding whitespace."""
+        return chunk_content_hash(text)
+
     def get_embedding_stats(self) -> dict[str, Any]:
         """Get statistics about embeddings in the database.
 
@@ -205,7 +262,8 @@ class EmbeddingService(BaseService):
                     "total_unique_chunks": 0,
                     "providers": [],
                     "configured_provider": self._embedding_provider.name if self._embedding_provider else None,
-                    "configured_model": self._embedding_provider.model if self._embedding_provider else None
+                    "configured_model": self._embedding_provider.model if self._embedding_provider else None,
+                    "cache": self._db.get_embedding_cache_stats()
                 }
 
             # Query each table and aggregate results
@@ -242,7 +300,8 @@ class EmbeddingService(BaseService):
                 "total_unique_chunks": total_unique_chunks,
                 "providers": all_results,
                 "configured_provider": self._embedding_provider.name if self._embedding_provider else None,
-                "configured_model": self._embedding_provider.model if self._embedding_provider else None
+                "configured_model": self._embedding_provider.model if self._embedding_provider else None,
+                "cache": self._db.get_embedding_cache_stats()
             }
 
         except Exception as e:
@@ -269,23 +328,12 @@ class EmbeddingService(BaseService):
         provider_name = self._embedding_provider.name
         model_name = self._embedding_provider.model
 
-        # Get existing embeddings from database
+        # Get existing embeddings from the provider/model's partitions
         try:
-            # Determine table name based on embedding dimensions
-            # We need to check what dimensions this provider/model uses
-            if hasattr(self._embedding_provider, 'get_dimensions'):
-                dims = self._embedding_provider.get_dimensions()
-            else:
-                # Default to 1536 for most embedding models (OpenAI, etc.)
-                dims = 1536
-
-            table_name = f"embeddings_{dims}"
-
             existing_chunk_ids = self._db.get_existing_embeddings(
                 chunk_ids=chunk_ids,
                 provider=provider_name,
-                model=model_name,
-                table_name=table_name
+                model=model_name
             )
         except Exception as e:
             logger.error(f"Failed to get existing embeddings: {e}")
@@ -335,10 +383,10 @@ class EmbeddingService(BaseService):
                     chunk_ids = [chunk_id for chunk_id, _ in batch]
                     texts = [text for _, text in batch]
 
-                    # Generate embeddings
+                    # Generate embeddings (cached vectors are reused)
                     if not self._embedding_provider:
                         return 0
-                    embedding_results = await self._embedding_provider.embed(texts)
+                    embedding_results = await self.embed_texts(texts)
 
                     if len(embedding_results) != len(chunk_ids):
                         logger.warning(f"Batch {batch_num}: Expected {len(chunk_ids)} embeddings, got {len(embedding_results)}")
@@ -695,7 +743,7 @@ class EmbeddingService(BaseService):
         logger.debug(f"Deleted existing embeddings for {len(chunk_ids)} chunks from {deleted_count} tables")
 
     def _get_all_embedding_tables(self) -> list[str]:
-        """Get list of all embedding tables (dimension-specific)."""
+        """Get list of all embedding tables (per-model partitions)."""
         try:
             tables = self._db.execute_query("""
                 SELECT table_name FROM information_schema.tables
@@ -1,6 +1,8 @@
 """Indexing coordinator service for ChunkHound - orchestrates indexing workflows."""
 
+import asyncio
 import zlib
+from concurrent.futures.process import BrokenProcessPool
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any
@@ -8,23 +10,34 @@ from typing import Any
 from loguru import logger
 from tqdm import tqdm
 
-from core.models import File
-from core.types import FileId, FilePath, Language
+from chunkhound.chunker import ChunkDiff, IncrementalChunker
+from chunkhound.tree_cache import get_default_cache
+from core.models import Chunk, File
+from core.types import ChunkType, FileId, FilePath, Language
 from interfaces.database_provider import DatabaseProvider
 from interfaces.embedding_provider import EmbeddingProvider
-from interfaces.language_parser import LanguageParser, ParseResult
+from interfaces.language_parser import LanguageParser
 
 from .base_service import BaseService
+from .parse_worker import ParsePool, extract_chunks, filter_valid_chunks
 
 
 class IndexingCoordinator(BaseService):
     """Coordinates file indexing workflows with parsing, chunking, and embeddings."""
 
+    # Below this many files to parse, worker startup and IPC cost more than they save
+    _MIN_FILES_FOR_PARSE_POOL = 64
+
+    # Batches buffered between pipeline stages in process_directory
+    _PIPELINE_QUEUE_SIZE = 2
+
     def __init__(
         self,
         database_provider: DatabaseProvider,
         embedding_provider: EmbeddingProvider | None = None,
-        language_parsers: dict[Language, LanguageParser] | None = None
+        language_parsers: dict[Language, LanguageParser] | None = None,
+        db_batch_size: int = 500,
+        parse_workers: int = 1
     ):
         """Initialize indexing coordinator.
 
@@ -32,13 +45,21 @@ class IndexingCoordinator(BaseService):
             database_provider: Database provider for persistence
             embedding_provider: Optional embedding provider for vector generation
             language_parsers: Optional mapping of language to parser implementations
+            db_batch_size: Number of files written per database transaction in process_directory
+            parse_workers: Worker processes used to parse files in process_directory
+                (1 parses on the event loop thread)
         """
         super().__init__(database_provider)
         self._embedding_provider = embedding_provider
         self._language_parsers = language_parsers or {}
+        self._db_batch_size = max(1, db_batch_size)
+        self._parse_workers = max(1, parse_workers)
+        self._parse_pool: ParsePool | None = None
+        self._pipeline_queues: dict[str, asyncio.Queue] = {}
 
         # Performance optimization: shared instances
         self._parser_cache: dict[Language, LanguageParser] = {}
+        self._chunk_differ = IncrementalChunker()
 
     def add_language_parser(self, language: Language, parser: LanguageParser) -> None:
         """Add or update a language parser.
@@ -149,26 +170,11 @@ class IndexingCoordinator(BaseService):
             # Note: Removed timestamp checking logic - if process_file()
             # was called, the file needs processing. File watcher handles change detection.
 
-            # Parse file content - can return ParseResult or List[Dict[str, Any]]
-            parsed_data = parser.parse_file(file_path)
-            if not parsed_data:
+            # Parse file content and filter empty chunks
+            chunks = self._parse_file_chunks(parser, file_path)
+            if chunks is None:
                 return {"status": "no_content", "chunks": 0}
 
-            # Extract chunks from ParseResult object or direct list
-            raw_chunks: list[dict[str, Any]]
-            if isinstance(parsed_data, ParseResult):
-                # New parser providers return ParseResult object
-                raw_chunks = parsed_data.chunks
-            elif isinstance(parsed_data, list):
-                # Legacy parsers return chunks directly
-                raw_chunks = parsed_data
-            else:
-                # Fallback for unexpected types
-                raw_chunks = []
-
-            # Filter empty chunks early to reduce storage warnings
-            chunks = self._filter_valid_chunks(raw_chunks)
-
             if not chunks:
                 return {"status": "no_chunks", "chunks": 0}
 
@@ -178,51 +184,7 @@ class IndexingCoordinator(BaseService):
             is_file_modified = False
 
             if existing_file:
-                # Check if file was actually modified (different mtime)
-                # Use same field resolution logic as process_file_incremental
-                existing_mtime = 0
-                current_mtime = file_stat.st_mtime
-
-                if isinstance(existing_file, dict):
-                    # Try different possible timestamp field names
-                    for field in [
-                        'mtime', 'modified_time', 'modification_time', 'timestamp'
-                    ]:
-                        if field in existing_file and existing_file[field] is not None:
-                            timestamp_value = existing_file[field]
-                            if isinstance(timestamp_value, int | float):
-                                existing_mtime = float(timestamp_value)
-                                break
-                            elif hasattr(timestamp_value, "timestamp"):
-                                existing_mtime = timestamp_value.timestamp()
-                                break
-                else:
-                    # Handle File model objects
-                    if hasattr(existing_file, 'mtime'):
-                        existing_mtime = float(existing_file.mtime)
-
-                # Two-tier change detection: mtime first, then CRC32 if needed
-                if abs(current_mtime - existing_mtime) > 0.001:
-                    # mtime changed, file is definitely modified
-                    is_file_modified = True
-                    logger.debug(f"File modification check: {file_path} - mtime changed (existing: {existing_mtime}, current: {current_mtime})")
-                else:
-                    # mtime unchanged, check CRC32 for robust content detection
-                    current_crc32 = self._calculate_file_crc32(file_path)
-                    existing_crc32 = existing_file.get('content_crc32') if isinstance(existing_file, dict) else getattr(existing_file, 'content_crc32', None)
-
-                    if current_crc32 is None:
-                        # Can't calculate CRC32, assume modified for safety
-                        is_file_modified = True
-                        logger.debug(f"File modification check: {file_path} - CRC32 calculation failed, assuming modified")
-                    elif existing_crc32 is None:
-                        # No existing CRC32, file needs processing to store CRC32
-                        is_file_modified = True
-                        logger.debug(f"File modification check: {file_path} - no existing CRC32, needs processing")
-                    else:
-                        # Compare CRC32 checksums
-                        is_file_modified = (current_crc32 != existing_crc32)
-                        logger.debug(f"File modification check: {file_path} - CRC32 comparison (existing: {existing_crc32}, current: {current_crc32}, modified: {is_file_modified})")
+                is_file_modified = self._is_file_modified(file_path, file_stat, existing_file)
 
                 # If file hasn't been modified, return up_to_date status
                 if not is_file_modified:
@@ -241,29 +203,35 @@ class IndexingCoordinator(BaseService):
             if file_id is None:
                 return {"status": "error", "chunks": 0, "error": "Failed to store file record"}
 
-            # Delete old chunks only if file was actually modified
+            # Modified files are updated differentially: only added/changed chunks are
+            # inserted (and embedded), removed ones deleted, untouched rows kept
+            diff: ChunkDiff | None = None
             if existing_file and is_file_modified:
-                self._db.delete_file_chunks(file_id)
-                logger.debug(f"Deleted existing chunks for modified file: {file_path}")
+                chunk_ids, diff = self._apply_chunk_diff(file_id, chunks, language)
+                new_chunks = diff.chunks_to_insert
+            else:
+                # Note: Transaction safety is handled by the database provider layer
+                chunk_ids = self._store_chunks(file_id, chunks, language)
+                new_chunks = chunks
 
-            # Store chunks and generate embeddings
-            # Note: Transaction safety is handled by the database provider layer
-            chunk_ids = self._store_chunks(file_id, chunks, language)
             embeddings_generated = 0
             if not skip_embeddings and self._embedding_provider and chunk_ids:
-                embeddings_generated = await self._generate_embeddings(chunk_ids, chunks)
+                embeddings_generated = await self._generate_embeddings(chunk_ids, new_chunks)
 
             result = {
                 "status": "success",
                 "file_id": file_id,
                 "chunks": len(chunks),
                 "chunk_ids": chunk_ids,
-                "embeddings": embeddings_generated
+                "embeddings": embeddings_generated,
+                "chunks_inserted": len(new_chunks),
+                "chunks_deleted": len(diff.chunks_to_delete) if diff else 0,
+                "chunks_unchanged": diff.unchanged_count if diff else 0
             }
 
-            # Include chunk data for batch processing
+            # Include chunk data for batch processing (chunk_ids and chunk_data line up)
             if skip_embeddings:
-                result["chunk_data"] = chunks
+                result["chunk_data"] = new_chunks
 
             return result
 
@@ -271,6 +239,364 @@ class IndexingCoordinator(BaseService):
             logger.error(f"Failed to process file {file_path}: {e}")
             return {"status": "error", "error": str(e), "chunks": 0}
 
+    def _apply_chunk_diff(
+        self, file_id: int, chunks: list[dict[str, Any]], language: Language
+    ) -> tuple[list[int], ChunkDiff]:
+        """Diff a modified file's new chunks against its stored ones and apply the result.
+
+        Args:
+            file_id: ID of the stored file
+            chunks: Chunks parsed from the current file content
+            language: File language
+
+        Returns:
+            Tuple of (IDs of the inserted chunks, applied ChunkDiff)
+        """
+        old_chunks = self._db.get_chunks_by_file_id(file_id)
+        diff = self._chunk_differ.diff_chunks(old_chunks, chunks)
+        chunk_ids = self._db.apply_chunk_diff(
+            file_id,
+            diff.chunks_to_delete,
+            diff.chunks_to_update,
+            self._build_chunk_models(file_id, diff.chunks_to_insert, language)
+        )
+        logger.debug(f"Differential update of file {file_id}: {len(chunk_ids)} inserted, "
+                     f"{len(diff.chunks_to_delete)} deleted, {diff.unchanged_count} unchanged")
+        return chunk_ids, diff
+
+    async def _update_modified_files(
+        self, file_paths: list[Path], results: list[dict[str, Any]], modified: list[int]
+    ) -> None:
+        """Diff the modified files of a batch and write all their updates in one transaction.
+
+        If the batched write fails, each file is retried on its own so one bad
+        file does not fail the batch.
+
+        Args:
+            file_paths: Files of the batch
+            results: Per-file results from _parse_file_batch (updated in place)
+            modified: Indexes of the pending files that are already in the index
+        """
+        diffs: dict[int, ChunkDiff] = {}
+        file_diffs = []
+        for index in list(modified):
+            file = results[index]["file"]
+            file_id = results[index]["existing_file_id"]
+            try:
+                diff = self._chunk_differ.diff_chunks(self._db.get_chunks_by_file_id(file_id), results[index]["chunks"])
+            except Exception as e:
+                logger.error(f"Failed to diff file {file_paths[index]}: {e}")
+                results[index] = {"status": "error", "error": str(e), "chunks": 0}
+                modified.remove(index)
+                continue
+            diffs[index] = diff
+            file_diffs.append((
+                file.with_id(file_id),
+                diff.chunks_to_delete,
+                diff.chunks_to_update,
+                self._build_chunk_models(file_id, diff.chunks_to_insert, results[index]["language"])
+            ))
+
+        try:
+            inserted = self._db.update_files_batch(file_diffs)
+        except Exception as e:
+            logger.warning(f"Batched update of {len(file_diffs)} files failed, falling back to per-file updates: {e}")
+            for index in modified:
+                results[index] = await self.process_file(file_paths[index], skip_embeddings=True)
+            return
+
+        for index, chunk_ids in zip(modified, inserted):
+            diff = diffs[index]
+            results[index] = {
+                "status": "success",
+                "file_id": results[index]["existing_file_id"],
+                "chunks": len(results[index]["chunks"]),
+                "chunk_ids": chunk_ids,
+                "embeddings": 0,
+                "chunk_data": diff.chunks_to_insert,
+                "chunks_inserted": len(diff.chunks_to_insert),
+                "chunks_deleted": len(diff.chunks_to_delete),
+                "chunks_unchanged": diff.unchanged_count
+            }
+        logger.debug(f"Differential update of {len(file_diffs)} files: "
+                     f"{sum(len(ids) for ids in inserted)} chunks inserted")
+
+    def _parse_file_chunks(self, parser: LanguageParser, file_path: Path) -> list[dict[str, Any]] | None:
+        """Parse a file and return its non-empty chunks.
+
+        Args:
+            parser: Parser for the file's language
+            file_path: Path to the file to parse
+
+        Returns:
+            List of valid chunks, or None if the parser produced no content
+        """
+        # Parse file content - can return ParseResult or List[Dict[str, Any]]
+        return extract_chunks(parser.parse_file(file_path))
+
+    def _is_file_modified(
+        self,
+        file_path: Path,
+        file_stat: Any,
+        existing_file: dict[str, Any] | File,
+        current_crc32: int | None = None
+    ) -> bool:
+        """Check whether a file differs from its stored record.
+
+        Two-tier change detection: mtime first, then CRC32 when mtime is unchanged.
+
+        Args:
+            file_path: Path to the file on disk
+            file_stat: Current stat result of the file
+            existing_file: Stored file record (dict or File model)
+            current_crc32: Precomputed CRC32 of the current content, if available
+
+        Returns:
+            True if the file needs to be re-indexed
+        """
+        # Use same field resolution logic as process_file_incremental
+        existing_mtime = 0
+        current_mtime = file_stat.st_mtime
+
+        if isinstance(existing_file, dict):
+            # Try different possible timestamp field names
+            for field in [
+                'mtime', 'modified_time', 'modification_time', 'timestamp'
+            ]:
+                if field in existing_file and existing_file[field] is not None:
+                    timestamp_value = existing_file[field]
+                    if isinstance(timestamp_value, int | float):
+                        existing_mtime = float(timestamp_value)
+                        break
+                    elif hasattr(timestamp_value, "timestamp"):
+                        existing_mtime = timestamp_value.timestamp()
+                        break
+        else:
+            # Handle File model objects
+            if hasattr(existing_file, 'mtime'):
+                existing_mtime = float(existing_file.mtime)
+
+        if abs(current_mtime - existing_mtime) > 0.001:
+            # mtime changed, file is definitely modified
+            logger.debug(f"File modification check: {file_path} - mtime changed (existing: {existing_mtime}, current: {current_mtime})")
+            return True
+
+        # mtime unchanged, check CRC32 for robust content detection
+        if current_crc32 is None:
+            current_crc32 = self._calculate_file_crc32(file_path)
+        existing_crc32 = existing_file.get('content_crc32') if isinstance(existing_file, dict) else getattr(existing_file, 'content_crc32', None)
+
+        if current_crc32 is None:
+            # Can't calculate CRC32, assume modified for safety
+            logger.debug(f"File modification check: {file_path} - CRC32 calculation failed, assuming modified")
+            return True
+        if existing_crc32 is None:
+            # No existing CRC32, file needs processing to store CRC32
+            logger.debug(f"File modification check: {file_path} - no existing CRC32, needs processing")
+            return True
+
+        # Compare CRC32 checksums
+        is_modified = current_crc32 != existing_crc32
+        logger.debug(f"File modification check: {file_path} - CRC32 comparison (existing: {existing_crc32}, current: {current_crc32}, modified: {is_modified})")
+        return is_modified
+
+    def _prepare_file_for_batch(
+        self, file_path: Path, existing_file: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Run the read-only part of the pipeline for one file of a write batch.
+
+        Args:
+            file_path: Path to the file to process
+            existing_file: Stored record for the file (from get_files_by_paths), if any
+
+        Returns:
+            A final per-file result, or a result with status "pending" carrying the
+            File model and language of a file that still has to be parsed and written
+        """
+        try:
+            if not file_path.exists() or not file_path.is_file():
+                return {"status": "error", "error": f"File not found: {file_path}", "chunks": 0}
+
+            language = self.detect_file_language(file_path)
+            if not language:
+                return {"status": "skipped", "reason": "unsupported_type", "chunks": 0}
+
+            parser = self.get_parser_for_language(language)
+            if not parser:
+                return {"status": "error", "error": f"No parser available for {language}", "chunks": 0}
+
+            file_stat = file_path.stat()
+            content_crc32 = self._calculate_file_crc32(file_path)
+
+            # Skip parsing entirely for unchanged files
+            if existing_file and not self._is_file_modified(file_path, file_stat, existing_file, content_crc32):
+                return {
+                    "status": "up_to_date",
+                    "file_id": existing_file["id"],
+                    "chunks": existing_file.get("chunk_count", 0),
+                    "embeddings": 0
+                }
+
+            return {
+                "status": "pending",
+                "file": File(
+                    path=FilePath(str(file_path)),
+                    size_bytes=file_stat.st_size,
+                    mtime=file_stat.st_mtime,
+                    language=language,
+                    content_crc32=content_crc32
+                ),
+                "language": language,
+                "existing_file_id": existing_file["id"] if existing_file else None
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to process file {file_path}: {e}")
+            return {"status": "error", "error": str(e), "chunks": 0}
+
+    async def _parse_files(
+        self, files: list[tuple[Path, Language]]
+    ) -> list[list[dict[str, Any]] | None | BaseException]:
+        """Parse files in the parse pool, or in-process when no pool is running.
+
+        Args:
+            files: (path, language) pairs to parse
+
+        Returns:
+            One entry per input file, in input order: valid chunks, None for no
+            content, or the exception raised while parsing the file
+        """
+        if self._parse_pool is not None and len(files) >= self._MIN_FILES_FOR_PARSE_POOL:
+            try:
+                return await self._parse_pool.parse_files(files)
+            except BrokenProcessPool as e:
+                # Don't retry a dead pool for every batch; finish this run in-process
+                logger.warning(f"Parse pool failed, parsing in-process for the rest of this run: {e}")
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+
+        # Batch runs parse each file once, so keeping every tree and source for an
+        # incremental reparse would hold the whole run in memory; only single-file
+        # updates (process_file) retain them
+        tree_cache = get_default_cache()
+        results: list[list[dict[str, Any]] | None | BaseException] = []
+        for file_path, language in files:
+            try:
+                parser = self.get_parser_for_language(language)
+                if not parser:
+                    raise RuntimeError(f"No parser available for {language}")
+                results.append(self._parse_file_chunks(parser, file_path))
+            except Exception as e:
+                results.append(e)
+            finally:
+                tree_cache.invalidate(file_path)
+        return results
+
+    async def _process_file_batch(self, file_paths: list[Path]) -> list[dict[str, Any]]:
+        """Process a batch of files and write all changed ones in one transaction.
+
+        Args:
+            file_paths: Files to process
+
+        Returns:
+            Per-file results (same shape as process_file), in input order
+        """
+        results = await self._parse_file_batch(file_paths)
+        return await self._store_file_batch(file_paths, results)
+
+    async def _parse_file_batch(self, file_paths: list[Path]) -> list[dict[str, Any]]:
+        """Read-only half of batch processing: change detection and parsing.
+
+        Existing records are fetched with one query, unchanged files are skipped
+        without parsing, and changed files are parsed (in the parse pool when one
+        is running).
+
+        Args:
+            file_paths: Files to process
+
+        Returns:
+            Per-file results in input order; files that still have to be written
+            have status "pending" and carry their File model, language and chunks
+        """
+        existing_files = self._db.get_files_by_paths([str(path) for path in file_paths])
+
+        results = [
+            self._prepare_file_for_batch(file_path, existing_files.get(str(file_path)))
+            for file_path in file_paths
+        ]
+        to_parse = [index for index, result in enumerate(results) if result["status"] == "pending"]
+        if not to_parse:
+            return results
+
+        parsed = await self._parse_files([(file_paths[index], results[index]["language"]) for index in to_parse])
+        for index, chunks in zip(to_parse, parsed):
+            if isinstance(chunks, BaseException):
+                logger.error(f"Failed to parse file {file_paths[index]}: {chunks}")
+                results[index] = {"status": "error", "error": str(chunks), "chunks": 0}
+            elif chunks is None:
+                results[index] = {"status": "no_content", "chunks": 0}
+            elif not chunks:
+                results[index] = {"status": "no_chunks", "chunks": 0}
+            else:
+                results[index]["chunks"] = chunks
+
+        return results
+
+    async def _store_file_batch(
+        self, file_paths: list[Path], results: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Write the pending files of a parsed batch.
+
+        New files are written in one transaction with store_files_batch; if that
+        fails they fall back to per-file processing. Files already in the index
+        are updated differentially, so unchanged chunks keep their rows and
+        embeddings and only inserted chunks are returned for embedding.
+
+        Args:
+            file_paths: Files of the batch
+            results: Per-file results from _parse_file_batch (updated in place)
+
+        Returns:
+            Final per-file results (same shape as process_file), in input order
+        """
+        modified = [
+            index for index, result in enumerate(results)
+            if result["status"] == "pending" and result["existing_file_id"] is not None
+        ]
+        if modified:
+            await self._update_modified_files(file_paths, results, modified)
+
+        pending = [index for index, result in enumerate(results) if result["status"] == "pending"]
+        if not pending:
+            return results
+
+        file_batch = [
+            (results[index]["file"],
+             self._build_chunk_models(0, results[index]["chunks"], results[index]["language"]))
+            for index in pending
+        ]
+
+        try:
+            stored = self._db.store_files_batch(file_batch)
+        except Exception as e:
+            logger.warning(f"Batched write of {len(pending)} files failed, falling back to per-file processing: {e}")
+            for index in pending:
+                results[index] = await self.process_file(file_paths[index], skip_embeddings=True)
+            return results
+
+        for index, (file_id, chunk_ids) in zip(pending, stored):
+            chunks = results[index]["chunks"]
+            results[index] = {
+                "status": "success",
+                "file_id": file_id,
+                "chunks": len(chunks),
+                "chunk_ids": chunk_ids,
+                "embeddings": 0,
+                "chunk_data": chunks
+            }
+
+        return results
+
     async def _process_file_modification_safe(
         self,
         file_id: int,
@@ -418,14 +744,21 @@ class IndexingCoordinator(BaseService):
         self,
         directory: Path,
         patterns: list[str] | None = None,
-        exclude_patterns: list[str] | None = None
+        exclude_patterns: list[str] | None = None,
+        generate_embeddings: bool = False
     ) -> dict[str, Any]:
         """Process all supported files in a directory with batch optimization and consistency checks.
 
+        Files flow through a pipeline of stages (discover -> parse -> store -> embed)
+        connected by bounded queues, so at most a few batches are in flight at once
+        and embedding starts as soon as the first batch is written.
+
         Args:
             directory: Directory path to process
             patterns: Optional file patterns to include
             exclude_patterns: Optional file patterns to exclude
+            generate_embeddings: If True, embed newly stored chunks while indexing
+                (requires an embedding provider)
 
         Returns:
             Dictionary with processing statistics
@@ -442,19 +775,96 @@ class IndexingCoordinator(BaseService):
 
             logger.info(f"Directory consistency: {len(files)} files discovered, {cleaned_files} orphaned files cleaned")
 
-            # Phase 3: Update - Process files with enhanced cache logic
-            total_files = 0
-            total_chunks = 0
+            # Phase 3: Update - Stream batches through parse, store and embed stages
+            # Parse in worker processes; all writes stay on the store stage
+            if self._parse_workers > 1 and len(files) > 1:
+                parser_classes = {
+                    language: type(parser) for language, parser in self._language_parsers.items()
+                }
+                self._parse_pool = ParsePool(parser_classes, min(self._parse_workers, len(files)))
+
+            embed = generate_embeddings and self._embedding_provider is not None
+            stats = await self._run_directory_pipeline(files, embed)
+
+            result = {
+                "status": "success",
+                "files_processed": stats["files_processed"],
+                "total_chunks": stats["total_chunks"]
+            }
+            if embed:
+                result["embeddings_generated"] = stats["embeddings_generated"]
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to process directory {directory}: {e}")
+            return {"status": "error", "error": str(e)}
+
+        finally:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+
+    async def _run_directory_pipeline(self, files: list[Path], embed: bool) -> dict[str, int]:
+        """Run discovered files through the bounded parse/store/embed pipeline.
+
+        Each stage is a coroutine reading batches from its input queue. The store
+        stage is the only database writer; it hands chunk IDs and texts straight
+        to the embed stage, so embedding needs no second read of the chunks.
+
+        Args:
+            files: Discovered files, in processing order
+            embed: Whether to run the embed stage
+
+        Returns:
+            Dictionary with files_processed, total_chunks and embeddings_generated
+        """
+        stage_names = ["parse", "store"] + (["embed"] if embed else [])
+        self._pipeline_queues = {
+            name: asyncio.Queue(maxsize=self._PIPELINE_QUEUE_SIZE) for name in stage_names
+        }
+        queues = self._pipeline_queues
+        stats = {"files_processed": 0, "total_chunks": 0, "embeddings_generated": 0}
+
+        embedding_service = None
+        if embed:
+            # Deferred import, as in generate_missing_embeddings
+            from .embedding_service import EmbeddingService
+
+            embedding_service = EmbeddingService(
+                database_provider=self._db,
+                embedding_provider=self._embedding_provider
+            )
+
+        pbar = tqdm(total=len(files), desc="Processing files", unit="file")
 
-            # Create progress bar for file processing
-            with tqdm(total=len(files), desc="Processing files", unit="file") as pbar:
-                for file_path in files:
-                    result = await self.process_file(file_path, skip_embeddings=True)
+        async def discover_stage() -> None:
+            for batch_start in range(0, len(files), self._db_batch_size):
+                await queues["parse"].put(files[batch_start:batch_start + self._db_batch_size])
+            await queues["parse"].put(None)
 
+        async def parse_stage() -> None:
+            while (batch_files := await queues["parse"].get()) is not None:
+                results = await self._parse_file_batch(batch_files)
+                await queues["store"].put((batch_files, results))
+            await queues["store"].put(None)
+
+        async def store_stage() -> None:
+            while (item := await queues["store"].get()) is not None:
+                batch_files, results = item
+                results = await self._store_file_batch(batch_files, results)
+
+                chunk_ids: list[int] = []
+                chunk_texts: list[str] = []
+                for file_path, result in zip(batch_files, results):
                     if result["status"] in ["success", "up_to_date"]:
-                        total_files += 1
-                        total_chunks += result["chunks"]
-                        pbar.set_postfix_str(f"{total_chunks} chunks")
+                        stats["files_processed"] += 1
+                        stats["total_chunks"] += result["chunks"]
+                        if result["status"] == "success":
+                            for chunk_id, chunk in zip(result.get("chunk_ids", []), result.get("chunk_data", [])):
+                                text = chunk.get("code", "").strip()
+                                if text:
+                                    chunk_ids.append(chunk_id)
+                                    chunk_texts.append(text)
                     elif result["status"] in ["skipped", "no_content", "no_chunks"]:
                         # Still update progress for skipped files
                         pass
@@ -462,20 +872,65 @@ class IndexingCoordinator(BaseService):
                         # Log errors but continue processing
                         logger.warning(f"Failed to process {file_path}: {result.get('error', 'unknown error')}")
 
-                    pbar.update(1)
+                if embed and chunk_ids:
+                    await queues["embed"].put((chunk_ids, chunk_texts))
 
-            # Note: Embedding generation is handled separately via generate_missing_embeddings()
-            # to provide a unified progress experience
+                depths = "/".join(str(queues[name].qsize()) for name in stage_names)
+                pbar.set_postfix_str(f"{stats['total_chunks']} chunks, queues {depths}")
+                pbar.update(len(batch_files))
 
-            return {
-                "status": "success",
-                "files_processed": total_files,
-                "total_chunks": total_chunks
-            }
+            if embed:
+                await queues["embed"].put(None)
 
-        except Exception as e:
-            logger.error(f"Failed to process directory {directory}: {e}")
-            return {"status": "error", "error": str(e)}
+        async def embed_stage() -> None:
+            assert embedding_service is not None
+            while (item := await queues["embed"].get()) is not None:
+                chunk_ids, chunk_texts = item
+                try:
+                    stats["embeddings_generated"] += await embedding_service.generate_embeddings_for_chunks(
+                        chunk_ids, chunk_texts, show_progress=False
+                    )
+                except Exception as e:
+                    # Missed chunks are picked up by generate_missing_embeddings
+                    logger.warning(f"Failed to embed {len(chunk_ids)} chunks: {e}")
+
+        stages = [discover_stage(), parse_stage(), store_stage()]
+        if embed:
+            stages.append(embed_stage())
+        tasks = [asyncio.create_task(stage) for stage in stages]
+
+        # Keep HNSW rebuilds out of the per-batch embedding inserts
+        if embed:
+            self._db.begin_bulk_index_mode()
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            if embed:
+                self._db.end_bulk_index_mode()
+            pbar.close()
+            self._pipeline_queues = {}
+
+        return stats
+
+    def get_pipeline_status(self) -> dict[str, Any]:
+        """Get queue depths of the running process_directory pipeline.
+
+        Returns:
+            Dictionary with running flag and, per stage, the number of batches
+            waiting in its input queue and the queue bound
+        """
+        return {
+            "running": bool(self._pipeline_queues),
+            "queues": {
+                name: {"depth": queue.qsize(), "max": queue.maxsize}
+                for name, queue in self._pipeline_queues.items()
+            }
+        }
 
     def _extract_file_id(self, file_record: dict[str, Any] | File) -> int | None:
         """Safely extract file ID from either dict or File model."""
@@ -514,30 +969,12 @@ class IndexingCoordinator(BaseService):
 
     def _filter_valid_chunks(self, chunks: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Filter out chunks with empty content early in the process."""
-        valid_chunks = []
-        filtered_count = 0
+        return filter_valid_chunks(chunks)
 
+    def _build_chunk_models(self, file_id: int, chunks: list[dict[str, Any]], language: Language) -> list[Chunk]:
+        """Convert parsed chunk dicts into Chunk models for storage."""
+        chunk_models = []
         for chunk in chunks:
-            code_content = chunk.get("code", "")
-            if code_content and code_content.strip():
-                valid_chunks.append(chunk)
-            else:
-                filtered_count += 1
-
-        # Log summary instead of individual warnings to reduce noise
-        if filtered_count > 0:
-            logger.debug(f"Filtered {filtered_count} empty chunks during parsing")
-
-        return valid_chunks
-
-    def _store_chunks(self, file_id: int, chunks: list[dict[str, Any]], language: Language) -> list[int]:
-        """Store chunks in database and return chunk IDs."""
-        chunk_ids = []
-        for chunk in chunks:
-            # Create Chunk model instance
-            from core.models import Chunk
-            from core.types import ChunkType
-
             # Convert chunk_type string to enum
             chunk_type_str = chunk.get("chunk_type", "function")
             try:
@@ -545,7 +982,7 @@ class IndexingCoordinator(BaseService):
             except ValueError:
                 chunk_type_enum = ChunkType.FUNCTION  # default fallback
 
-            chunk_model = Chunk(
+            chunk_models.append(Chunk(
                 file_id=FileId(file_id),
                 symbol=chunk.get("symbol", ""),
                 start_line=chunk.get("start_line", 0),
@@ -553,11 +990,16 @@ class IndexingCoordinator(BaseService):
                 code=chunk.get("code", ""),
                 chunk_type=chunk_type_enum,
                 language=language,  # Use the file's detected language
-                parent_header=chunk.get("parent_header")
-            )
-            chunk_id = self._db.insert_chunk(chunk_model)
-            chunk_ids.append(chunk_id)
-        return chunk_ids
+                parent_header=chunk.get("parent_header"),
+                start_byte=chunk.get("start_byte"),
+                end_byte=chunk.get("end_byte")
+            ))
+        return chunk_models
+
+    def _store_chunks(self, file_id: int, chunks: list[dict[str, Any]], language: Language) -> list[int]:
+        """Store chunks in database and return chunk IDs."""
+        # Single round trip; IDs come back in input order
+        return self._db.insert_chunks_batch(self._build_chunk_models(file_id, chunks, language))
 
     async def get_stats(self) -> dict[str, Any]:
         """Get database statistics.
@@ -655,8 +1097,15 @@ class IndexingCoordinator(BaseService):
             [chunk for _, chunk, _ in valid_chunk_data]
             texts = [text for _, _, text in valid_chunk_data]
 
-            # Generate embeddings (progress tracking handled by missing embeddings phase)
-            embedding_results = await self._embedding_provider.embed(texts)
+            # Generate embeddings through the content-hash cache, so unchanged chunk
+            # text is not re-embedded (progress tracking handled by missing embeddings phase)
+            from .embedding_service import EmbeddingService
+
+            embedding_service = EmbeddingService(
+                database_provider=self._db,
+                embedding_provider=self._embedding_provider
+            )
+            embedding_results = await embedding_service.embed_texts(texts)
 
             # Store embeddings in database
             embeddings_data = []
@@ -0,0 +1,167 @@
+"""Process-pool parse stage for the indexing pipeline.
+
+Worker processes build their own parser instances once, in the pool initializer,
+and return plain chunk dicts. Tree-sitter objects never cross the process boundary;
+all database writes stay in the parent process.
+"""
+
+import asyncio
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from chunkhound.tree_cache import configure_default_cache
+from core.types import Language
+from interfaces.language_parser import LanguageParser, ParseResult
+
+# Parser instances owned by the current worker process, keyed by language value
+_worker_parsers: dict[str, LanguageParser] = {}
+
+
+def extract_chunks(parsed_data: Any) -> list[dict[str, Any]] | None:
+    """Normalize parser output to a list of non-empty chunk dicts.
+
+    Args:
+        parsed_data: Return value of LanguageParser.parse_file
+
+    Returns:
+        List of valid chunks, or None if the parser produced no content
+    """
+    if not parsed_data:
+        return None
+
+    # Extract chunks from ParseResult object or direct list
+    raw_chunks: list[dict[str, Any]]
+    if isinstance(parsed_data, ParseResult):
+        # New parser providers return ParseResult object
+        raw_chunks = parsed_data.chunks
+    elif isinstance(parsed_data, list):
+        # Legacy parsers return chunks directly
+        raw_chunks = parsed_data
+    else:
+        # Fallback for unexpected types
+        raw_chunks = []
+
+    return filter_valid_chunks(raw_chunks)
+
+
+def filter_valid_chunks(chunks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Filter out chunks with empty content early in the process."""
+    valid_chunks = []
+    filtered_count = 0
+
+    for chunk in chunks:
+        code_content = chunk.get("code", "")
+        if code_content and code_content.strip():
+            valid_chunks.append(chunk)
+        else:
+            filtered_count += 1
+
+    # Log summary instead of individual warnings to reduce noise
+    if filtered_count > 0:
+        logger.debug(f"Filtered {filtered_count} empty chunks during parsing")
+
+    return valid_chunks
+
+
+def _init_parse_worker(parser_classes: dict[str, type]) -> None:
+    """Pool initializer: build one parser per language in this worker process."""
+    # Workers start with loguru's default DEBUG handler; only surface problems
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    # Workers live for one indexing run, so previous trees would never be reused
+    configure_default_cache(max_entries=0, max_memory_mb=0)
+
+    for language_value, parser_class in parser_classes.items():
+        try:
+            parser = parser_class()
+            if hasattr(parser, 'setup') and callable(getattr(parser, 'setup')):
+                parser.setup()
+            _worker_parsers[language_value] = parser
+        except Exception as e:
+            logger.warning(f"Parse worker failed to initialize {parser_class.__name__}: {e}")
+
+
+def _parse_file_in_worker(file_path: str, language_value: str) -> list[dict[str, Any]] | None:
+    """Parse one file with this worker's parser and return plain chunk dicts."""
+    parser = _worker_parsers.get(language_value)
+    if parser is None:
+        raise RuntimeError(f"No parser available for {language_value}")
+    return extract_chunks(parser.parse_file(Path(file_path)))
+
+
+class ParsePool:
+    """Pool of parser worker processes used by IndexingCoordinator.process_directory."""
+
+    def __init__(self, parser_classes: dict[Language, type], max_workers: int):
+        """Initialize parse pool. Worker processes are started on first use.
+
+        Args:
+            parser_classes: Mapping of language to parser implementation class
+            max_workers: Number of worker processes
+        """
+        self._parser_classes = {
+            language.value: parser_class for language, parser_class in parser_classes.items()
+        }
+        self._max_workers = max(1, max_workers)
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def max_workers(self) -> int:
+        """Number of worker processes."""
+        return self._max_workers
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that holds an open DuckDB connection and
+            # background threads is not safe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_parse_worker,
+                initargs=(self._parser_classes,),
+            )
+            logger.debug(f"Started parse pool with {self._max_workers} workers")
+        return self._executor
+
+    async def parse_files(
+        self, files: list[tuple[Path, Language]]
+    ) -> list[list[dict[str, Any]] | None | BaseException]:
+        """Parse files in the worker processes.
+
+        Args:
+            files: (path, language) pairs to parse
+
+        Returns:
+            One entry per input file, in input order: the file's valid chunks,
+            None if the parser produced no content, or the exception raised
+            while parsing it
+
+        Raises:
+            BrokenProcessPool: If a worker process died
+        """
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(executor, _parse_file_in_worker, str(path), language.value)
+            for path, language in files
+        ]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+        # A dead worker poisons the whole pool; let the caller decide how to recover
+        for result in results:
+            if isinstance(result, BrokenProcessPool):
+                raise result
+        return list(results)
+
+    def shutdown(self) -> None:
+        """Stop all worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
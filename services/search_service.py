@@ -1,6 +1,5 @@
 """Search service for ChunkHound - handles semantic and regex search operations."""
 
-import asyncio
 from pathlib import Path
 from typing import Any
 
@@ -38,7 +37,9 @@ class SearchService(BaseService):
         threshold: float | None = None,
         provider: str | None = None,
         model: str | None = None,
-        path_filter: str | None = None
+        path_filter: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """Perform semantic search using vector similarity.
 
@@ -50,6 +51,8 @@ class SearchService(BaseService):
             provider: Optional specific embedding provider to use
             model: Optional specific model to use
             path_filter: Optional relative path to limit search scope (e.g., 'src/', 'tests/')
+            cursor: Optional next_cursor from a previous page; takes precedence over offset
+            include_total: Include an estimated total in the pagination metadata
 
         Returns:
             Tuple of (results, pagination_metadata)
@@ -79,7 +82,9 @@ class SearchService(BaseService):
                 page_size=page_size,
                 offset=offset,
                 threshold=threshold,
-                path_filter=path_filter
+                path_filter=path_filter,
+                cursor=cursor,
+                include_total=include_total
             )
 
             # Enhance results with additional metadata
@@ -95,7 +100,15 @@ class SearchService(BaseService):
             logger.error(f"Semantic search failed: {e}")
             raise
 
-    def search_regex(self, pattern: str, page_size: int = 10, offset: int = 0, path_filter: str | None = None) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    def search_regex(
+        self,
+        pattern: str,
+        page_size: int = 10,
+        offset: int = 0,
+        path_filter: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """Perform regex search on code content.
 
         Args:
@@ -103,6 +116,8 @@ class SearchService(BaseService):
             page_size: Number of results per page
             offset: Starting position for pagination
             path_filter: Optional relative path to limit search scope (e.g., 'src/', 'tests/')
+            cursor: Optional next_cursor from a previous page; takes precedence over offset
+            include_total: Include the exact match count in the pagination metadata
 
         Returns:
             Tuple of (results, pagination_metadata)
@@ -111,7 +126,14 @@ class SearchService(BaseService):
             logger.debug(f"Performing regex search for pattern: '{pattern}'")
 
             # Perform regex search
-            results, pagination = self._db.search_regex(pattern=pattern, page_size=page_size, offset=offset, path_filter=path_filter)
+            results, pagination = self._db.search_regex(
+                pattern=pattern,
+                page_size=page_size,
+                offset=offset,
+                path_filter=path_filter,
+                cursor=cursor,
+                include_total=include_total
+            )
 
             # Enhance results with additional metadata
             enhanced_results = []
@@ -126,24 +148,79 @@ class SearchService(BaseService):
             logger.error(f"Regex search failed: {e}")
             raise
 
+    def search_text(
+        self,
+        query: str,
+        page_size: int = 10,
+        offset: int = 0,
+        path_filter: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Perform BM25-ranked keyword search on chunk symbols and code.
+
+        Args:
+            query: Keywords or identifiers to search for
+            page_size: Number of results per page
+            offset: Starting position for pagination
+            path_filter: Optional relative path to limit search scope (e.g., 'src/', 'tests/')
+            cursor: Optional next_cursor from a previous page; takes precedence over offset
+            include_total: Include the exact match count in the pagination metadata
+
+        Returns:
+            Tuple of (results, pagination_metadata)
+        """
+        try:
+            logger.debug(f"Performing text search for: '{query}'")
+
+            results, pagination = self._db.search_text(
+                query=query,
+                page_size=page_size,
+                offset=offset,
+                path_filter=path_filter,
+                cursor=cursor,
+                include_total=include_total
+            )
+
+            # Enhance results with additional metadata
+            enhanced_results = [self._enhance_search_result(result) for result in results]
+
+            logger.info(f"Text search completed: {len(enhanced_results)} results found")
+            return enhanced_results, pagination
+
+        except Exception as e:
+            logger.error(f"Text search failed: {e}")
+            raise
+
     async def search_hybrid(
         self,
         query: str,
         regex_pattern: str | None = None,
         page_size: int = 10,
         offset: int = 0,
-        semantic_weight: float = 0.7,
-        threshold: float | None = None
+        provider: str | None = None,
+        model: str | None = None,
+        path_filter: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        """Perform hybrid search combining semantic and regex results.
+        """Perform hybrid search fusing semantic and BM25 keyword rankings.
+
+        The query is embedded once; the database then ranks vector and keyword
+        candidates and fuses them with reciprocal rank fusion in a single query,
+        so offset and cursor pages all come from one consistent ranking. Without
+        an embedding provider results are ranked by keywords alone.
 
         Args:
-            query: Natural language search query
-            regex_pattern: Optional regex pattern to include in search
+            query: Natural language or keyword search query
+            regex_pattern: Optional regex pattern results must match
             page_size: Number of results per page
             offset: Starting position for pagination
-            semantic_weight: Weight given to semantic results (0.0-1.0)
-            threshold: Optional similarity threshold for semantic results
+            provider: Optional specific embedding provider to use
+            model: Optional specific model to use
+            path_filter: Optional relative path to limit search scope (e.g., 'src/', 'tests/')
+            cursor: Optional next_cursor from a previous page; takes precedence over offset
+            include_total: Include the number of fused candidates in the pagination metadata
 
         Returns:
             Tuple of (results, pagination_metadata)
@@ -151,49 +228,34 @@ class SearchService(BaseService):
         try:
             logger.debug(f"Performing hybrid search: query='{query}', pattern='{regex_pattern}'")
 
-            # Perform searches concurrently
-            tasks = []
-
-            # Semantic search
+            query_vector = None
+            search_provider = provider
+            search_model = model
             if self._embedding_provider:
-                semantic_task = asyncio.create_task(
-                    self.search_semantic(query, page_size=page_size*2, offset=offset, threshold=threshold)
-                )
-                tasks.append(('semantic', semantic_task))
-
-            # Regex search
-            if regex_pattern:
-                async def get_regex_results():
-                    return self.search_regex(regex_pattern, page_size=page_size*2, offset=offset)
-                tasks.append(('regex', asyncio.create_task(get_regex_results())))
-
-            # Wait for all searches to complete
-            results_by_type = {}
-            pagination_data = {}
-            for search_type, task in tasks:
-                results, pagination = await task
-                results_by_type[search_type] = results
-                pagination_data[search_type] = pagination
-
-            # Combine and rank results
-            combined_results = self._combine_search_results(
-                semantic_results=results_by_type.get('semantic', []),
-                regex_results=results_by_type.get('regex', []),
-                semantic_weight=semantic_weight,
-                limit=page_size
+                search_provider = provider or self._embedding_provider.name
+                search_model = model or self._embedding_provider.model
+                query_results = await self._embedding_provider.embed([query])
+                if query_results:
+                    query_vector = query_results[0]
+
+            results, pagination = self._db.search_hybrid(
+                query=query,
+                query_embedding=query_vector,
+                provider=search_provider,
+                model=search_model,
+                page_size=page_size,
+                offset=offset,
+                path_filter=path_filter,
+                cursor=cursor,
+                regex_pattern=regex_pattern,
+                include_total=include_total
             )
 
-            # Create combined pagination metadata
-            combined_pagination = {
-                "offset": offset,
-                "page_size": page_size,
-                "has_more": len(combined_results) == page_size,
-                "next_offset": offset + page_size if len(combined_results) == page_size else None,
-                "total": None  # Cannot estimate for hybrid search
-            }
+            # Enhance results with additional metadata
+            enhanced_results = [self._enhance_search_result(result) for result in results]
 
-            logger.info(f"Hybrid search completed: {len(combined_results)} results found")
-            return combined_results, combined_pagination
+            logger.info(f"Hybrid search completed: {len(enhanced_results)} results found")
+            return enhanced_results, pagination
 
         except Exception as e:
             logger.error(f"Hybrid search failed: {e}")
@@ -329,70 +391,3 @@ class SearchService(BaseService):
             enhanced["similarity_percentage"] = round(result["similarity"] * 100, 2)
 
         return enhanced
-
-    def _combine_search_results(
-        self,
-        semantic_results: list[dict[str, Any]],
-        regex_results: list[dict[str, Any]],
-        semantic_weight: float,
-        limit: int
-    ) -> list[dict[str, Any]]:
-        """Combine semantic and regex search results with weighted ranking.
-
-        Args:
-            semantic_results: Results from semantic search
-            regex_results: Results from regex search
-            semantic_weight: Weight for semantic results (0.0-1.0)
-            limit: Maximum number of results to return
-
-        Returns:
-            Combined and ranked results
-        """
-        combined = {}
-        regex_weight = 1.0 - semantic_weight
-
-        # Process semantic results
-        for i, result in enumerate(semantic_results):
-            chunk_id = result.get("chunk_id") or result.get("id")
-            if chunk_id:
-                # Score based on position and similarity
-                position_score = (len(semantic_results) - i) / len(semantic_results)
-                similarity_score = result.get("similarity", 0.5)
-                score = (position_score * 0.3 + similarity_score * 0.7) * semantic_weight
-
-                combined[chunk_id] = {
-                    **result,
-                    "search_type": "semantic",
-                    "combined_score": score,
-                    "semantic_score": similarity_score
-                }
-
-        # Process regex results
-        for i, result in enumerate(regex_results):
-            chunk_id = result.get("chunk_id") or result.get("id")
-            if chunk_id:
-                # Score based on position (regex has no similarity score)
-                position_score = (len(regex_results) - i) / len(regex_results)
-                score = position_score * regex_weight
-
-                if chunk_id in combined:
-                    # Boost existing result
-                    combined[chunk_id]["combined_score"] += score
-                    combined[chunk_id]["search_type"] = "hybrid"
-                    combined[chunk_id]["regex_score"] = position_score
-                else:
-                    combined[chunk_id] = {
-                        **result,
-                        "search_type": "regex",
-                        "combined_score": score,
-                        "regex_score": position_score
-                    }
-
-        # Sort by combined score and return top results
-        sorted_results = sorted(
-            combined.values(),
-            key=lambda x: x["combined_score"],
-            reverse=True
-        )
-
-        return sorted_results[:limit]
@@ -0,0 +1,65 @@
+"""Shared fixtures for database provider tests."""
+
+import hashlib
+import time
+
+import pytest
+
+from core.models import Chunk, File
+from core.types import ChunkType, Language
+from providers.database.duckdb_provider import DuckDBProvider
+
+
+@pytest.fixture
+def provider(tmp_path):
+    """Connected DuckDB provider on a fresh database file."""
+    db = DuckDBProvider(tmp_path / "test.duckdb")
+    db.connect()
+    yield db
+    db.disconnect()
+
+
+def add_chunks(db: DuckDBProvider, path: str, codes: list[str]) -> list[int]:
+    """Store a Python file with one function chunk per code string and return the chunk ids."""
+    file_id = db.insert_file(File(path=path, mtime=time.time(), language=Language.PYTHON, size_bytes=0))
+    return db.insert_chunks_batch([
+        Chunk(
+            file_id=file_id,
+            symbol=f"f{i}",
+            start_line=i * 10 + 1,
+            end_line=i * 10 + 9,
+            code=code,
+            chunk_type=ChunkType.FUNCTION,
+            language=Language.PYTHON,
+        )
+        for i, code in enumerate(codes)
+    ])
+
+
+class FakeEmbeddingProvider:
+    """Deterministic embedding provider that records every text it embeds."""
+
+    name = "fake"
+    model = "fake-model"
+    dims = 8
+    distance = "cosine"
+    batch_size = 16
+    max_tokens = None
+
+    def __init__(self):
+        self.embedded: list[str] = []
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [self.vector(text) for text in texts]
+
+    @classmethod
+    def vector(cls, text: str) -> list[float]:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [byte / 255 - 0.5 for byte in digest[:cls.dims]]
+
+
+@pytest.fixture
+def embedding_provider():
+    """Fake embedding provider."""
+    return FakeEmbeddingProvider()
@@ -0,0 +1,82 @@
+"""Tests for BM25 keyword search (search_text)."""
+
+import math
+
+import pytest
+
+from chunkhound.code_tokens import code_terms, query_terms
+from tests.conftest import add_chunks
+
+CODES = [
+    "def parseHttpResponse(raw):\n    return HttpResponse(raw)",
+    "def parse_config(path):\n    return load(path)",
+    "class HttpClient:\n    def send(self, request):\n        return self.transport.send(request)",
+    "def render(template):\n    return template.format()",
+    "def parse(tokens):\n    # parse parse parse\n    return tokens",
+]
+
+
+def _bm25(provider, query, k1=1.2, b=0.75):
+    """Reference Okapi BM25 scores, recomputed from the stored chunks."""
+    docs = {}
+    for chunk_id, symbol, code in provider.connection.execute("SELECT id, symbol, code FROM chunks").fetchall():
+        terms = code_terms(code)
+        terms.update(code_terms(symbol))
+        docs[chunk_id] = terms
+    avgdl = sum(sum(terms.values()) for terms in docs.values()) / len(docs)
+    scores = {}
+    for term in query_terms(query):
+        df = sum(1 for terms in docs.values() if term in terms)
+        idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+        for chunk_id, terms in docs.items():
+            if term in terms:
+                tf, length = terms[term], sum(terms.values())
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avgdl))
+    return scores
+
+
+@pytest.fixture
+def corpus(provider):
+    add_chunks(provider, "/repo/src/http.py", CODES[:3])
+    add_chunks(provider, "/repo/tests/misc.py", CODES[3:])
+    return provider
+
+
+def test_code_terms_split_compound_identifiers():
+    assert set(code_terms("parseHttpResponse")) == {"parsehttpresponse", "parse", "http", "response"}
+    assert set(code_terms("load_value x")) == {"load_value", "load", "value"}
+    assert query_terms("HTTP response http") == ["http", "response"]
+
+
+@pytest.mark.parametrize("query", ["parse", "http response", "send request", "HttpResponse"])
+def test_scores_match_reference_bm25(corpus, query):
+    results, pagination = corpus.search_text(query, page_size=50, include_total=True)
+
+    expected = _bm25(corpus, query)
+    assert [result["chunk_id"] for result in results] == sorted(expected, key=lambda chunk_id: (-expected[chunk_id], chunk_id))
+    assert [result["score"] for result in results] == pytest.approx([expected[r["chunk_id"]] for r in results])
+    assert pagination["total"] == len(expected)
+
+
+def test_cursor_pages_and_path_filter(corpus):
+    full, _ = corpus.search_text("parse http", page_size=50)
+    seen, cursor = [], None
+    while True:
+        page, pagination = corpus.search_text("parse http", page_size=1, cursor=cursor)
+        seen += [result["chunk_id"] for result in page]
+        if not (cursor := pagination["next_cursor"]):
+            break
+    assert seen == [result["chunk_id"] for result in full]
+
+    filtered, _ = corpus.search_text("parse", path_filter="tests/")
+    assert {result["file_path"] for result in filtered} == {"/repo/tests/misc.py"}
+
+
+def test_deleted_chunks_leave_the_index(corpus):
+    [chunk_id] = add_chunks(corpus, "/repo/src/zebra.py", ["def zebra(): return quagga"])
+    assert [result["chunk_id"] for result in corpus.search_text("quagga")[0]] == [chunk_id]
+
+    corpus.delete_file_completely("/repo/src/zebra.py")
+
+    assert corpus.search_text("quagga")[0] == []
+    assert corpus.search_text("!!")[0] == []
@@ -0,0 +1,59 @@
+"""Tests for deferring HNSW rebuilds to the end of bulk embedding sessions."""
+
+from tests.conftest import add_chunks
+
+DIMS = 8
+
+
+def _embeddings(chunk_ids):
+    return [
+        {"chunk_id": chunk_id, "provider": "t", "model": "m",
+         "embedding": [1.0 + chunk_id] + [0.5] * (DIMS - 1), "dims": DIMS}
+        for chunk_id in chunk_ids
+    ]
+
+
+def _indexed_tables(provider):
+    return {index["table_name"] for index in provider.get_existing_vector_indexes()}
+
+
+def test_bulk_session_rebuilds_each_table_once(provider):
+    chunk_ids = add_chunks(provider, "src/a.py", [f"def f{i}(): pass" for i in range(6)])
+    provider.insert_embeddings_batch(_embeddings(chunk_ids[:2]))
+    table_name = provider._get_embedding_partition("t", "m", DIMS)["table_name"]
+    assert table_name in _indexed_tables(provider)
+
+    provider.begin_bulk_index_mode()
+    provider.begin_bulk_index_mode()
+    provider.insert_embeddings_batch(_embeddings(chunk_ids[2:4]), batch_size=1)
+    provider.insert_embeddings_batch(_embeddings(chunk_ids[4:]), batch_size=1)
+
+    # The index stays dropped until the outermost session ends
+    assert table_name not in _indexed_tables(provider)
+    status = provider.get_index_status()
+    assert status["bulk_mode"] is True
+    assert status["stale_tables"] == [table_name]
+    assert provider.end_bulk_index_mode() == 0
+    assert table_name not in _indexed_tables(provider)
+
+    assert provider.end_bulk_index_mode() == 1
+    assert table_name in _indexed_tables(provider)
+    assert provider.get_index_status() == {"bulk_mode": False, "stale_tables": [], "pending_rebuilds": 0}
+
+    results, _ = provider.search_semantic(_embeddings(chunk_ids[5:])[0]["embedding"], "t", "m", page_size=1)
+    assert results[0]["chunk_id"] == chunk_ids[5]
+
+
+def test_large_batch_outside_session_rebuilds_immediately(provider):
+    chunk_ids = add_chunks(provider, "src/a.py", [f"def f{i}(): pass" for i in range(4)])
+    provider.insert_embeddings_batch(_embeddings(chunk_ids[:1]))
+    provider.insert_embeddings_batch(_embeddings(chunk_ids[1:]), batch_size=1)
+
+    table_name = provider._get_embedding_partition("t", "m", DIMS)["table_name"]
+    assert table_name in _indexed_tables(provider)
+    assert provider.get_index_status()["stale_tables"] == []
+
+
+def test_unmatched_end_is_ignored(provider):
+    assert provider.end_bulk_index_mode() == 0
+    assert provider.get_index_status()["bulk_mode"] is False
@@ -0,0 +1,70 @@
+"""Tests for the stable-identity chunk diff used on modified files."""
+
+from pathlib import Path
+
+from chunkhound.chunker import IncrementalChunker
+from providers.parsing.python_parser import PythonParser
+from tests.conftest import add_chunks
+
+SOURCE = '''# header comment
+import os
+
+
+def load(path):
+    """Load a file."""
+    # read everything at once
+    with open(path) as handle:
+        return handle.read()
+
+
+class Store:
+    """Keeps loaded files."""
+
+    def get(self, key):
+        # missing keys return None
+        return self.items.get(key)
+'''
+
+
+def _parse(source: str) -> list[dict]:
+    return PythonParser().parse_file(Path("store.py"), source).chunks
+
+
+def _stored(chunks: list[dict]) -> list[dict]:
+    return [{**chunk, "id": index + 1} for index, chunk in enumerate(chunks)]
+
+
+def test_line_shift_keeps_comment_and_docstring_chunks():
+    old_chunks = _stored(_parse(SOURCE))
+    new_chunks = _parse("\n\n\n" + SOURCE)
+
+    diff = IncrementalChunker().diff_chunks(old_chunks, new_chunks)
+
+    assert diff.chunks_to_insert == []
+    assert diff.chunks_to_delete == []
+    assert diff.unchanged_count == len(old_chunks)
+    # Moved rows carry their new line-numbered symbols
+    moved_symbols = {chunk["symbol"] for chunk in diff.chunks_to_update}
+    assert "comment:4" in moved_symbols
+    assert "docstring:function:9" in moved_symbols
+
+
+def test_whitespace_only_edit_replaces_chunk():
+    old_chunks = _stored(_parse(SOURCE))
+    new_chunks = _parse(SOURCE.replace("return handle.read()", "return  handle.read()"))
+
+    diff = IncrementalChunker().diff_chunks(old_chunks, new_chunks)
+
+    assert [chunk["symbol"] for chunk in diff.chunks_to_insert] == ["load"]
+    deleted = [chunk for chunk in old_chunks if chunk["id"] in diff.chunks_to_delete]
+    assert [chunk["symbol"] for chunk in deleted] == ["load"]
+
+
+def test_moved_chunk_symbol_is_updated(provider):
+    chunk_id = add_chunks(provider, "src/a.py", ["# a comment"])[0]
+    file_id = provider.get_chunk_by_id(chunk_id)["file_id"]
+
+    provider.apply_chunk_diff(file_id, [], [{"id": chunk_id, "start_line": 4, "end_line": 4, "symbol": "comment:4"}], [])
+
+    chunk = provider.get_chunk_by_id(chunk_id)
+    assert (chunk["start_line"], chunk["symbol"]) == (4, "comment:4")
@@ -0,0 +1,27 @@
+"""Tests for chunk ids returned by insert_chunks_batch."""
+
+from tests.conftest import add_chunks
+
+
+def test_returned_ids_match_input_order(provider):
+    codes = [f"def f{i}(): return {i}" for i in range(25)]
+    chunk_ids = add_chunks(provider, "src/a.py", codes)
+
+    assert len(set(chunk_ids)) == len(codes)
+    assert [provider.get_chunk_by_id(chunk_id)["code"] for chunk_id in chunk_ids] == codes
+
+
+def test_ids_are_exact_after_deletes_and_across_files(provider):
+    first_ids = add_chunks(provider, "src/a.py", ["def a(): pass", "def b(): pass"])
+    provider.delete_file_completely("src/a.py")
+
+    second_ids = add_chunks(provider, "src/b.py", ["def c(): pass"])
+    third_ids = add_chunks(provider, "src/c.py", ["def d(): pass", "def e(): pass"])
+
+    assert not set(first_ids) & set(second_ids + third_ids)
+    assert provider.get_chunk_by_id(second_ids[0])["code"] == "def c(): pass"
+    assert [provider.get_chunk_by_id(chunk_id)["code"] for chunk_id in third_ids] == ["def d(): pass", "def e(): pass"]
+
+
+def test_empty_batch_returns_no_ids(provider):
+    assert provider.insert_chunks_batch([]) == []
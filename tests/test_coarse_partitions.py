@@ -0,0 +1,63 @@
+"""Tests for Matryoshka prefix partitions (coarse-to-fine semantic search)."""
+
+import random
+
+from tests.conftest import add_chunks
+
+DIMS = 16
+COARSE_DIMS = 4
+
+
+def _embeddings(chunk_ids, rng):
+    return [
+        {"chunk_id": chunk_id, "provider": "t", "model": "m",
+         "embedding": [rng.uniform(-1, 1) for _ in range(DIMS)], "dims": DIMS}
+        for chunk_id in chunk_ids
+    ]
+
+
+def test_enabling_coarse_dims_backfills_existing_vectors(provider):
+    rng = random.Random(0)
+    old_ids = add_chunks(provider, "src/old.py", [f"def old{i}(): pass" for i in range(40)])
+    old_embeddings = _embeddings(old_ids, rng)
+    provider.insert_embeddings_batch(old_embeddings)
+
+    provider.coarse_dims = COARSE_DIMS
+    new_ids = add_chunks(provider, "src/new.py", [f"def new{i}(): pass" for i in range(3)])
+    provider.insert_embeddings_batch(_embeddings(new_ids, rng))
+
+    partition = provider._get_embedding_partition("t", "m", DIMS)
+    assert partition["coarse_dims"] == COARSE_DIMS
+    coarse = provider._get_embedding_partition("t", "m", COARSE_DIMS)
+    coarse_ids = {row[0] for row in provider.connection.execute(f"SELECT chunk_id FROM {coarse['table_name']}").fetchall()}
+    assert coarse_ids == set(old_ids) | set(new_ids)
+
+    # Every pre-existing vector is still found as its own nearest neighbour
+    for emb in old_embeddings[:5]:
+        results, _ = provider.search_semantic(emb["embedding"], "t", "m", page_size=1)
+        assert results[0]["chunk_id"] == emb["chunk_id"]
+
+
+def test_partial_prefix_partition_falls_back_to_full_partition(provider):
+    rng = random.Random(1)
+    provider.coarse_dims = COARSE_DIMS
+    first_ids = add_chunks(provider, "src/a.py", [f"def a{i}(): pass" for i in range(5)])
+    provider.insert_embeddings_batch(_embeddings(first_ids, rng))
+
+    # Written without coarse dimensions configured: no prefix rows
+    provider.coarse_dims = None
+    later_ids = add_chunks(provider, "src/b.py", [f"def b{i}(): pass" for i in range(5)])
+    later_embeddings = _embeddings(later_ids, rng)
+    provider.insert_embeddings_batch(later_embeddings)
+
+    results, _ = provider.search_semantic(later_embeddings[0]["embedding"], "t", "m", page_size=1)
+    assert results[0]["chunk_id"] == later_ids[0]
+
+
+def test_stats_exclude_prefix_partitions(provider):
+    rng = random.Random(2)
+    provider.coarse_dims = COARSE_DIMS
+    chunk_ids = add_chunks(provider, "src/a.py", [f"def a{i}(): pass" for i in range(7)])
+    provider.insert_embeddings_batch(_embeddings(chunk_ids, rng))
+
+    assert provider.get_stats()["embeddings"] == 7
@@ -0,0 +1,83 @@
+"""Tests for running searches concurrently on per-thread read cursors."""
+
+import asyncio
+import threading
+
+from chunkhound.task_coordinator import TaskCoordinator
+from providers.database.duckdb_provider import DuckDBProvider
+from tests.conftest import add_chunks
+
+
+async def _started(provider, read_workers=4):
+    coordinator = TaskCoordinator(read_workers=read_workers, read_context=provider.read_cursor)
+    await coordinator.start()
+    return coordinator
+
+
+async def test_concurrent_searches_match_serial_results(provider):
+    for f in range(4):
+        add_chunks(provider, f"src/m{f}.py", [f"def f{f}_{i}(): return value_{i % 3}" for i in range(30)])
+    patterns = ["value_0", "value_1", "value_2", "f2_", "return"] * 4
+    expected = [provider.search_regex(pattern, page_size=200)[0] for pattern in patterns]
+
+    coordinator = await _started(provider)
+    try:
+        pages = await asyncio.gather(*(
+            coordinator.run_read(provider.search_regex, pattern, page_size=200) for pattern in patterns
+        ))
+    finally:
+        await coordinator.stop()
+
+    assert [results for results, _ in pages] == expected
+    assert 1 <= len(provider._read_cursors) <= 4
+
+
+async def test_reads_run_in_parallel(provider):
+    barrier = threading.Barrier(2, timeout=10)
+
+    def read_waiting_for_another_read():
+        barrier.wait()
+        return provider.get_stats()["chunks"]
+
+    coordinator = await _started(provider, read_workers=2)
+    try:
+        # Serialized reads would leave the barrier broken after its timeout
+        assert await asyncio.gather(
+            coordinator.run_read(read_waiting_for_another_read),
+            coordinator.run_read(read_waiting_for_another_read),
+        ) == [0, 0]
+    finally:
+        await coordinator.stop()
+
+
+async def test_reads_do_not_see_an_open_write_transaction(provider):
+    add_chunks(provider, "src/a.py", ["def a(): return token"])
+    coordinator = await _started(provider)
+    try:
+        provider.begin_transaction()
+        add_chunks(provider, "src/b.py", ["def b(): return token"])
+        during, _ = await coordinator.run_read(provider.search_regex, "token")
+        provider.commit_transaction()
+        after, _ = await coordinator.run_read(provider.search_regex, "token")
+    finally:
+        await coordinator.stop()
+
+    assert [result["file_path"] for result in during] == ["src/a.py"]
+    assert [result["file_path"] for result in after] == ["src/a.py", "src/b.py"]
+
+
+def test_disconnect_closes_read_cursors(tmp_path):
+    db = DuckDBProvider(tmp_path / "reads.duckdb")
+    db.connect()
+
+    def read():
+        with db.read_cursor():
+            db.get_stats()
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    thread.join()
+    assert len(db._read_cursors) == 1
+
+    db.disconnect()
+    assert db._read_cursors == []
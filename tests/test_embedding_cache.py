@@ -0,0 +1,89 @@
+"""Tests for the content-addressed embedding cache and its eviction."""
+
+import pytest
+
+from chunkhound.api.cli.utils.config_helpers import create_legacy_registry_config
+from chunkhound.core.config.unified_config import ChunkHoundConfig
+from providers.database.duckdb_provider import DuckDBProvider
+from registry import ProviderRegistry
+from services.embedding_service import EmbeddingService
+
+
+def _entries(prefix: str, count: int) -> list[tuple[str, list[float]]]:
+    return [(f"{prefix}{i}", [float(i), 1.0]) for i in range(count)]
+
+
+def _age_entries(provider, content_hashes: list[str], days: int) -> None:
+    provider.connection.execute(
+        "UPDATE embedding_cache SET last_used_at = CURRENT_TIMESTAMP - to_days(?) "
+        "WHERE content_hash IN (SELECT unnest(?::TEXT[]))",
+        [days, content_hashes],
+    )
+
+
+def test_cache_is_capped_at_max_entries(provider):
+    provider.embedding_cache_max_entries = 5
+    provider.cache_embeddings("t", "m", _entries("old", 5))
+    _age_entries(provider, [f"old{i}" for i in range(5)], 1)
+
+    provider.cache_embeddings("t", "m", _entries("new", 3))
+
+    stats = provider.get_embedding_cache_stats()
+    assert (stats["entries"], stats["evictions"]) == (5, 3)
+    assert set(provider.get_cached_embeddings("t", "m", [f"new{i}" for i in range(3)])) == {"new0", "new1", "new2"}
+
+
+def test_cache_hits_survive_size_eviction(provider):
+    provider.embedding_cache_max_entries = 4
+    provider.cache_embeddings("t", "m", _entries("old", 4))
+    _age_entries(provider, [f"old{i}" for i in range(4)], 1)
+
+    # A lookup marks old0 as recently used
+    assert set(provider.get_cached_embeddings("t", "m", ["old0"])) == {"old0"}
+    provider.cache_embeddings("t", "m", _entries("new", 2))
+
+    remaining = provider.get_cached_embeddings("t", "m", [f"old{i}" for i in range(4)])
+    assert "old0" in remaining
+    assert len(remaining) == 2
+
+
+def test_unused_entries_expire(provider):
+    provider.embedding_cache_max_age_days = 30
+    provider.cache_embeddings("t", "m", _entries("a", 3))
+    _age_entries(provider, ["a0", "a1"], 31)
+
+    provider.cache_embeddings("t", "m", _entries("b", 1))
+
+    assert set(provider.get_cached_embeddings("t", "m", ["a0", "a1", "a2", "b0"])) == {"a2", "b0"}
+
+
+async def test_embed_texts_sends_each_uncached_text_once(provider, embedding_provider):
+    service = EmbeddingService(provider, embedding_provider)
+
+    first = await service.embed_texts(["def a(): pass", "def b(): pass", "def a(): pass"])
+    assert embedding_provider.embedded == ["def a(): pass", "def b(): pass"]
+    assert first[0] == first[2]
+
+    # Trailing whitespace and surrounding blank lines hit the same entry
+    second = await service.embed_texts(["\ndef a(): pass   \n\n", "def c(): pass"])
+    assert embedding_provider.embedded[2:] == ["def c(): pass"]
+    assert second[0] == pytest.approx(first[0], rel=1e-6)
+
+    stats = provider.get_embedding_cache_stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (3, 1, 4)
+
+
+@pytest.mark.parametrize(("settings", "expected"), [
+    ({}, (200_000, 30)),
+    ({"cache_max_entries": None, "cache_max_age_days": 7}, (None, 7)),
+])
+def test_cache_bounds_come_from_embedding_config(tmp_path, settings, expected):
+    config = ChunkHoundConfig(database={"path": str(tmp_path / "db.duckdb")}, embedding=settings)
+    registry = ProviderRegistry()
+    registry.configure(create_legacy_registry_config(config))
+
+    db = registry._create_instance(DuckDBProvider)
+    try:
+        assert (db.embedding_cache_max_entries, db.embedding_cache_max_age_days) == expected
+    finally:
+        db.disconnect()
@@ -0,0 +1,48 @@
+"""Tests for the Arrow and VALUES ingest paths of insert_embeddings_batch."""
+
+import pytest
+
+from tests.conftest import add_chunks
+
+DIMS = 8
+
+
+def _embeddings(chunk_ids):
+    return [
+        {"chunk_id": chunk_id, "provider": "t", "model": "m",
+         "embedding": [chunk_id / 10 + d / 100 for d in range(DIMS)], "dims": DIMS}
+        for chunk_id in chunk_ids
+    ]
+
+
+def _stored(provider):
+    table_name = provider._get_embedding_partition("t", "m", DIMS)["table_name"]
+    return provider.connection.execute(
+        f"SELECT chunk_id, provider, model, dims, embedding FROM {table_name} ORDER BY chunk_id"
+    ).fetchall()
+
+
+@pytest.mark.parametrize("mode", ["arrow", "values"])
+@pytest.mark.parametrize("batch_size", [1, 1000])
+def test_ingest_modes_store_identical_rows(provider, mode, batch_size):
+    provider.embedding_ingest_mode = mode
+    chunk_ids = add_chunks(provider, "src/a.py", [f"def f{i}(): pass" for i in range(6)])
+
+    # batch_size 1 takes the bulk (index-dropping) path, 1000 the small-batch path
+    assert provider.insert_embeddings_batch(_embeddings(chunk_ids), batch_size=batch_size) == 6
+
+    rows = _stored(provider)
+    assert [row[0] for row in rows] == chunk_ids
+    assert all(row[1:4] == ("t", "m", DIMS) for row in rows)
+    expected = {emb["chunk_id"]: emb["embedding"] for emb in _embeddings(chunk_ids)}
+    for chunk_id, *_, vector in rows:
+        assert list(vector) == pytest.approx(expected[chunk_id], rel=1e-6)
+
+
+def test_mismatched_dimensions_are_rejected(provider):
+    chunk_ids = add_chunks(provider, "src/a.py", ["def a(): pass", "def b(): pass"])
+    embeddings = _embeddings(chunk_ids)
+    embeddings[1]["embedding"] = embeddings[1]["embedding"][:-1]
+
+    with pytest.raises(ValueError, match="dimensions"):
+        provider.insert_embeddings_batch(embeddings)
@@ -0,0 +1,193 @@
+"""Tests for upgrading databases written by earlier releases."""
+
+import duckdb
+import pytest
+
+from providers.database.duckdb_provider import DuckDBProvider
+
+DIMS = 8
+
+# Schema written by releases that kept every provider/model of a dimension in
+# one shared embeddings_{dims} table
+BASELINE_SCHEMA = f"""
+CREATE SEQUENCE files_id_seq START 1;
+CREATE SEQUENCE chunks_id_seq START 1;
+CREATE SEQUENCE embeddings_id_seq START 1;
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY DEFAULT nextval('files_id_seq'),
+    path TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    extension TEXT,
+    size INTEGER,
+    modified_time TIMESTAMP,
+    content_crc32 BIGINT,
+    language TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE chunks (
+    id INTEGER PRIMARY KEY DEFAULT nextval('chunks_id_seq'),
+    file_id INTEGER REFERENCES files(id),
+    chunk_type TEXT NOT NULL,
+    symbol TEXT,
+    code TEXT NOT NULL,
+    start_line INTEGER,
+    end_line INTEGER,
+    start_byte INTEGER,
+    end_byte INTEGER,
+    size INTEGER,
+    signature TEXT,
+    language TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE embeddings_{DIMS} (
+    id INTEGER PRIMARY KEY DEFAULT nextval('embeddings_id_seq'),
+    chunk_id INTEGER REFERENCES chunks(id),
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    embedding FLOAT[{DIMS}],
+    dims INTEGER NOT NULL DEFAULT {DIMS},
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+@pytest.fixture
+def baseline_db(tmp_path):
+    """Database file with the baseline schema and vectors from two models."""
+    db_path = tmp_path / "baseline.duckdb"
+    conn = duckdb.connect(str(db_path))
+    conn.execute(BASELINE_SCHEMA)
+    conn.execute("INSERT INTO files (path, name, extension, language) VALUES ('/x/a.py', 'a.py', '.py', 'python')")
+    for i in range(6):
+        conn.execute(
+            "INSERT INTO chunks (file_id, chunk_type, symbol, code, start_line, end_line, language) "
+            "VALUES (1, 'function', ?, ?, ?, ?, 'python')",
+            [f"f{i}", f"def f{i}():\n    return {i}\n", i * 3 + 1, i * 3 + 2],
+        )
+        for model in ("model-a", "model-b"):
+            vector = [float(i + 1)] + [0.5] * (DIMS - 1)
+            conn.execute(
+                f"INSERT INTO embeddings_{DIMS} (chunk_id, provider, model, embedding) VALUES (?, 'openai', ?, ?)",
+                [i + 1, model, vector],
+            )
+    conn.close()
+    return db_path
+
+
+def test_shared_embedding_table_migrates_into_partitions(baseline_db):
+    provider = DuckDBProvider(baseline_db)
+    provider.connect()
+    try:
+        conn = provider.connection
+        assert not provider._table_exists(f"embeddings_{DIMS}")
+
+        partitions = conn.execute(
+            "SELECT model, table_name FROM embedding_partitions WHERE dims = ? ORDER BY model", [DIMS]
+        ).fetchall()
+        assert [model for model, _ in partitions] == ["model-a", "model-b"]
+
+        for model, table_name in partitions:
+            rows = conn.execute(
+                f"SELECT chunk_id, provider, model, dims, code_i8, code_bits, scale FROM {table_name} ORDER BY chunk_id"
+            ).fetchall()
+            assert [row[0] for row in rows] == [1, 2, 3, 4, 5, 6]
+            assert all(row[1:4] == ("openai", model, DIMS) for row in rows)
+            assert all(row[4:] == (None, None, None) for row in rows)
+
+        # Migrated ids are kept, so new rows must not collide with them
+        provider.insert_embeddings_batch([{
+            "chunk_id": 1, "provider": "openai", "model": "model-c",
+            "embedding": [0.1] * DIMS, "dims": DIMS,
+        }])
+        assert provider.get_existing_embeddings([1], "openai", "model-c") == {1}
+    finally:
+        provider.disconnect()
+
+
+def test_migration_failure_keeps_shared_table(baseline_db, monkeypatch):
+    provider = DuckDBProvider(baseline_db)
+
+    # Fail after the first partition copy; the shared table must survive intact
+    original = DuckDBProvider._ensure_embedding_table_exists
+    calls = []
+
+    def ensure_then_fail(self, provider_name, model, dims, *args, **kwargs):
+        calls.append(model)
+        if len(calls) > 1:
+            raise RuntimeError("interrupted")
+        return original(self, provider_name, model, dims, *args, **kwargs)
+
+    monkeypatch.setattr(DuckDBProvider, "_ensure_embedding_table_exists", ensure_then_fail)
+    with pytest.raises(RuntimeError, match="interrupted"):
+        provider.connect()
+    provider.disconnect()
+
+    conn = duckdb.connect(str(baseline_db))
+    try:
+        assert conn.execute(f"SELECT count(*) FROM embeddings_{DIMS}").fetchone()[0] == 12
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def partitioned_db(tmp_path):
+    """Database file with per-model partitions written before quantized storage."""
+    db_path = tmp_path / "partitioned.duckdb"
+    table_name = "embeddings_8_openai_model_a"
+    conn = duckdb.connect(str(db_path))
+    conn.execute(BASELINE_SCHEMA.replace(f"TABLE embeddings_{DIMS} ", f"TABLE {table_name} "))
+    conn.execute("""
+        CREATE TABLE embedding_partitions (
+            provider TEXT NOT NULL,
+            model TEXT NOT NULL,
+            dims INTEGER NOT NULL,
+            table_name TEXT NOT NULL UNIQUE,
+            metric TEXT NOT NULL DEFAULT 'cosine',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (provider, model, dims)
+        )
+    """)
+    conn.execute(
+        "INSERT INTO embedding_partitions (provider, model, dims, table_name) VALUES ('openai', 'model-a', ?, ?)",
+        [DIMS, table_name],
+    )
+    conn.execute("INSERT INTO files (path, name, extension, language) VALUES ('/x/a.py', 'a.py', '.py', 'python')")
+    for i in range(4):
+        conn.execute(
+            "INSERT INTO chunks (file_id, chunk_type, symbol, code, language) VALUES (1, 'function', ?, ?, 'python')",
+            [f"f{i}", f"def f{i}(): pass\n"],
+        )
+        conn.execute(
+            f"INSERT INTO {table_name} (chunk_id, provider, model, embedding) VALUES (?, 'openai', 'model-a', ?)",
+            [i + 1, [float(i) - 1.5] + [0.25] * (DIMS - 1)],
+        )
+    conn.close()
+    return db_path
+
+
+def test_partitions_gain_quantization_columns(partitioned_db):
+    provider = DuckDBProvider(partitioned_db)
+    provider.connect()
+    try:
+        partition = provider._get_embedding_partition("openai", "model-a", DIMS)
+        assert partition["storage"] == "float"
+        assert partition["keep_full"] is True
+
+        # Partitions are rebuilt without the chunks foreign key
+        foreign_keys = provider.connection.execute(
+            "SELECT count(*) FROM duckdb_constraints() WHERE table_name = ? AND constraint_type = 'FOREIGN KEY'",
+            [partition["table_name"]],
+        ).fetchone()[0]
+        assert foreign_keys == 0
+        assert any(index["table_name"] == partition["table_name"] for index in provider.get_existing_vector_indexes())
+
+        provider.set_embedding_storage("openai", "model-a", DIMS, "int8")
+        codes = provider.connection.execute(
+            f"SELECT code_i8, scale FROM {partition['table_name']} ORDER BY chunk_id"
+        ).fetchall()
+        assert len(codes) == 4
+        assert all(code is not None and scale > 0 for code, scale in codes)
+    finally:
+        provider.disconnect()
@@ -0,0 +1,141 @@
+"""Tests for the batched file writes used by directory indexing."""
+
+import time
+
+import pytest
+
+from core.models import Chunk, File
+from core.types import ChunkType, Language
+from providers.database.duckdb_provider import DuckDBProvider
+from providers.parsing.python_parser import PythonParser
+from services.indexing_coordinator import IndexingCoordinator
+from tests.conftest import add_chunks
+
+DIMS = 4
+
+
+def _embed(provider, chunk_ids):
+    provider.insert_embeddings_batch([
+        {"chunk_id": chunk_id, "provider": "t", "model": "m", "embedding": [1.0, 0.5, 0.25, float(chunk_id)], "dims": DIMS}
+        for chunk_id in chunk_ids
+    ])
+
+
+def _embedded_ids(provider):
+    table_name = provider._get_embedding_partition("t", "m", DIMS)["table_name"]
+    return {row[0] for row in provider.connection.execute(f"SELECT chunk_id FROM {table_name}").fetchall()}
+
+
+def _chunk(code, symbol, line):
+    return Chunk(file_id=0, symbol=symbol, start_line=line, end_line=line, code=code,
+                 chunk_type=ChunkType.FUNCTION, language=Language.PYTHON)
+
+
+def _file(path, file_id=None, size=0):
+    return File(path=path, mtime=time.time(), language=Language.PYTHON, size_bytes=size,
+                content_crc32=size, id=file_id)
+
+
+def test_store_files_batch_replaces_embedded_chunks(provider):
+    old_ids = add_chunks(provider, "src/a.py", ["def a(): pass", "def b(): pass"])
+    _embed(provider, old_ids)
+
+    [(_, new_ids)] = provider.store_files_batch([(_file("src/a.py"), [_chunk("def c(): pass", "c", 1)])])
+
+    assert provider.get_chunk_by_id(old_ids[0]) is None
+    assert provider.get_chunk_by_id(new_ids[0])["symbol"] == "c"
+    assert _embedded_ids(provider) == set()
+
+
+def test_failed_batch_write_keeps_embeddings(provider, monkeypatch):
+    old_ids = add_chunks(provider, "src/a.py", ["def a(): pass"])
+    _embed(provider, old_ids)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(provider, "_execute_chunks_insert", fail)
+    with pytest.raises(RuntimeError, match="disk full"):
+        provider.store_files_batch([(_file("src/a.py"), [_chunk("def c(): pass", "c", 1)])])
+
+    assert provider.get_chunk_by_id(old_ids[0]) is not None
+    assert _embedded_ids(provider) == set(old_ids)
+
+
+def test_update_files_batch_applies_every_diff_in_one_call(provider):
+    a_ids = add_chunks(provider, "src/a.py", ["def a0(): pass", "def a1(): pass"])
+    b_ids = add_chunks(provider, "src/b.py", ["# note", "def b1(): pass"])
+    _embed(provider, a_ids + b_ids)
+    a_file = provider.get_chunk_by_id(a_ids[0])["file_id"]
+    b_file = provider.get_chunk_by_id(b_ids[0])["file_id"]
+
+    inserted = provider.update_files_batch([
+        (_file("src/a.py", a_file, size=11), [a_ids[1]], [], [_chunk("def a2(): pass", "a2", 30)]),
+        (_file("src/b.py", b_file, size=22), [],
+         [{"id": b_ids[0], "start_line": 5, "end_line": 5, "symbol": "comment:5"}], []),
+    ])
+
+    assert [len(ids) for ids in inserted] == [1, 0]
+    assert provider.get_chunk_by_id(a_ids[1]) is None
+    assert provider.get_chunk_by_id(inserted[0][0])["file_id"] == a_file
+    moved = provider.get_chunk_by_id(b_ids[0])
+    assert (moved["start_line"], moved["symbol"]) == (5, "comment:5")
+    # Moved chunks keep their embeddings; deleted ones lose them
+    assert _embedded_ids(provider) == {a_ids[0], b_ids[0], b_ids[1]}
+    sizes = dict(provider.connection.execute("SELECT id, size FROM files").fetchall())
+    assert sizes == {a_file: 11, b_file: 22}
+
+
+async def test_directory_reindex_updates_modified_files_in_one_batch(provider, tmp_path, monkeypatch):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    for i in range(3):
+        (source_dir / f"m{i}.py").write_text(f"def f{i}(x):\n    return x + {i}\n")
+    coordinator = IndexingCoordinator(provider, language_parsers={Language.PYTHON: PythonParser()})
+    await coordinator.process_directory(source_dir, patterns=["*.py"])
+
+    calls = []
+    update_files_batch = provider.update_files_batch
+    monkeypatch.setattr(provider, "update_files_batch", lambda diffs: calls.append(len(diffs)) or update_files_batch(diffs))
+    for i in range(2):
+        (source_dir / f"m{i}.py").write_text(f"def f{i}(x):\n    return x + {i}\n\n\ndef g{i}():\n    pass\n")
+    await coordinator.process_directory(source_dir, patterns=["*.py"])
+
+    assert calls == [2]
+    symbols = {row[0] for row in provider.connection.execute("SELECT symbol FROM chunks").fetchall()}
+    assert {"g0", "g1"} <= symbols
+
+
+def test_embedding_tables_lose_the_chunks_foreign_key_on_connect(tmp_path):
+    db_path = tmp_path / "fk.duckdb"
+    provider = DuckDBProvider(db_path)
+    provider.connect()
+    chunk_ids = add_chunks(provider, "src/a.py", ["def a(): pass"])
+    provider.connection.execute(f"""
+        CREATE TABLE embeddings_{DIMS} (
+            id INTEGER PRIMARY KEY DEFAULT nextval('embeddings_id_seq'),
+            chunk_id INTEGER REFERENCES chunks(id),
+            provider TEXT NOT NULL,
+            model TEXT NOT NULL,
+            embedding FLOAT[{DIMS}],
+            dims INTEGER NOT NULL DEFAULT {DIMS},
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    provider.connection.execute(
+        f"INSERT INTO embeddings_{DIMS} (chunk_id, provider, model, embedding) VALUES (?, 't', 'm', [1, 0, 0, 0])",
+        [chunk_ids[0]],
+    )
+    provider.disconnect()
+
+    provider = DuckDBProvider(db_path)
+    provider.connect()
+    try:
+        foreign_keys = provider.connection.execute(
+            "SELECT count(*) FROM duckdb_constraints() "
+            "WHERE table_name LIKE 'embeddings_%' AND constraint_type = 'FOREIGN KEY'"
+        ).fetchone()[0]
+        assert foreign_keys == 0
+        assert _embedded_ids(provider) == set(chunk_ids)
+    finally:
+        provider.disconnect()
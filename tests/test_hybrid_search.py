@@ -0,0 +1,70 @@
+"""Tests for hybrid (vector + BM25) search fused with reciprocal rank fusion."""
+
+import math
+import random
+
+import pytest
+
+from tests.conftest import add_chunks
+
+DIMS = 16
+
+
+def _cosine(a, b):
+    dot = sum(x * y for x, y in zip(a, b))
+    return dot / (math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b)))
+
+
+@pytest.fixture
+def embedded(provider):
+    rng = random.Random(0)
+    chunk_ids = add_chunks(provider, "src/m.py", [f"def f{i}(): return {i}" for i in range(120)])
+    vectors = {chunk_id: [rng.uniform(-1, 1) for _ in range(DIMS)] for chunk_id in chunk_ids}
+    provider.insert_embeddings_batch([
+        {"chunk_id": chunk_id, "provider": "t", "model": "m", "embedding": vector, "dims": DIMS}
+        for chunk_id, vector in vectors.items()
+    ])
+    return provider, vectors
+
+
+def _vector_ranking(provider, query):
+    # A query without keyword matches ranks by the vector leg alone
+    results, _ = provider.search_hybrid("nomatchterm", query, "t", "m", page_size=10)
+    assert [result["vector_rank"] for result in results] == list(range(1, len(results) + 1))
+    return [result["chunk_id"] for result in results]
+
+
+def _exact_ranking(vectors, query, n):
+    return sorted(vectors, key=lambda chunk_id: (-_cosine(vectors[chunk_id], query), chunk_id))[:n]
+
+
+@pytest.mark.parametrize("storage", ["int8", "binary"])
+def test_quantized_vector_leg_is_reranked_on_full_vectors(embedded, storage):
+    provider, vectors = embedded
+    provider.set_embedding_storage("t", "m", DIMS, storage)
+    query = [random.Random(1).uniform(-1, 1) for _ in range(DIMS)]
+
+    assert _vector_ranking(provider, query) == _exact_ranking(vectors, query, 10)
+
+
+def test_coarse_vector_leg_is_reranked_on_full_vectors(provider):
+    rng = random.Random(2)
+    provider.coarse_dims = 4
+    chunk_ids = add_chunks(provider, "src/m.py", [f"def f{i}(): return {i}" for i in range(120)])
+    vectors = {chunk_id: [rng.uniform(-1, 1) for _ in range(DIMS)] for chunk_id in chunk_ids}
+    provider.insert_embeddings_batch([
+        {"chunk_id": chunk_id, "provider": "t", "model": "m", "embedding": vector, "dims": DIMS}
+        for chunk_id, vector in vectors.items()
+    ])
+    query = [rng.uniform(-1, 1) for _ in range(DIMS)]
+
+    assert _vector_ranking(provider, query) == _exact_ranking(vectors, query, 10)
+
+
+def test_fused_score_rewards_both_legs(embedded):
+    provider, vectors = embedded
+    target = next(iter(vectors))
+    results, _ = provider.search_hybrid(f"f{target - 1}", vectors[target], "t", "m", page_size=5)
+
+    assert results[0]["chunk_id"] == target
+    assert results[0]["vector_rank"] == 1 and results[0]["keyword_rank"] == 1
@@ -0,0 +1,59 @@
+"""Tests for the bounded parse/store/embed pipeline of process_directory."""
+
+from core.types import Language
+from providers.parsing.python_parser import PythonParser
+from services.indexing_coordinator import IndexingCoordinator
+from tests.conftest import FakeEmbeddingProvider
+
+
+def _write_sources(directory, count):
+    directory.mkdir()
+    for i in range(count):
+        (directory / f"m{i}.py").write_text(f"def f{i}(x):\n    return x + {i}\n")
+
+
+async def test_pipeline_stores_and_embeds_every_batch(provider, embedding_provider, tmp_path):
+    source_dir = tmp_path / "src"
+    _write_sources(source_dir, 7)
+    coordinator = IndexingCoordinator(
+        provider, embedding_provider, {Language.PYTHON: PythonParser()}, db_batch_size=2
+    )
+
+    depths = []
+    original = coordinator._store_file_batch
+
+    async def recording_store(file_paths, results):
+        status = coordinator.get_pipeline_status()
+        depths.append(max(queue["depth"] for queue in status["queues"].values()))
+        assert all(queue["max"] == IndexingCoordinator._PIPELINE_QUEUE_SIZE for queue in status["queues"].values())
+        return await original(file_paths, results)
+
+    coordinator._store_file_batch = recording_store
+    result = await coordinator.process_directory(source_dir, patterns=["*.py"], generate_embeddings=True)
+
+    assert result["status"] == "success"
+    assert result["files_processed"] == 7
+    assert result["embeddings_generated"] == result["total_chunks"] > 0
+    assert len(depths) == 4
+    assert max(depths) <= IndexingCoordinator._PIPELINE_QUEUE_SIZE
+    assert coordinator.get_pipeline_status() == {"running": False, "queues": {}}
+
+    assert provider.get_stats()["embeddings"] == result["total_chunks"]
+    assert provider.get_index_status()["stale_tables"] == []
+    query = FakeEmbeddingProvider.vector(embedding_provider.embedded[0])
+    results, _ = provider.search_semantic(query, "fake", "fake-model", page_size=1)
+    assert results
+
+
+async def test_unchanged_files_are_not_reembedded(provider, embedding_provider, tmp_path):
+    source_dir = tmp_path / "src"
+    _write_sources(source_dir, 3)
+    coordinator = IndexingCoordinator(provider, embedding_provider, {Language.PYTHON: PythonParser()})
+
+    await coordinator.process_directory(source_dir, patterns=["*.py"], generate_embeddings=True)
+    embedded = len(embedding_provider.embedded)
+    result = await coordinator.process_directory(source_dir, patterns=["*.py"], generate_embeddings=True)
+
+    assert result["files_processed"] == 3
+    assert result["embeddings_generated"] == 0
+    assert len(embedding_provider.embedded) == embedded
@@ -0,0 +1,57 @@
+"""Tests for serving MCP over streamable HTTP."""
+
+import asyncio
+import socket
+from contextlib import asynccontextmanager
+
+import pytest
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+from chunkhound import mcp_server
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+async def http_url(monkeypatch):
+    # Serve the tool handlers without opening a database
+    @asynccontextmanager
+    async def no_lifespan(server):
+        yield {}
+
+    monkeypatch.setattr(mcp_server, "server_lifespan", no_lifespan)
+    port = _free_port()
+    task = asyncio.create_task(mcp_server.run_http_server("127.0.0.1", port))
+    for _ in range(100):
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            await writer.wait_closed()
+            break
+        except OSError:
+            await asyncio.sleep(0.05)
+    yield f"http://127.0.0.1:{port}/mcp"
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def _list_tools(url: str) -> tuple[str | None, list[str]]:
+    async with streamablehttp_client(url) as (read, write, get_session_id):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            tools = await session.list_tools()
+            return get_session_id(), [tool.name for tool in tools.tools]
+
+
+async def test_concurrent_clients_get_their_own_sessions(http_url):
+    results = await asyncio.wait_for(asyncio.gather(*(_list_tools(http_url) for _ in range(3))), timeout=30)
+
+    session_ids = {session_id for session_id, _ in results}
+    assert None not in session_ids and len(session_ids) == 3
+    for _, names in results:
+        assert {"search_regex", "search_semantic"} <= set(names)
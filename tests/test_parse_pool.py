@@ -0,0 +1,62 @@
+"""Tests for parsing files in worker processes during directory indexing."""
+
+import pytest
+
+from core.types import Language
+from providers.database.duckdb_provider import DuckDBProvider
+from providers.parsing.python_parser import PythonParser
+from services.indexing_coordinator import IndexingCoordinator
+from services.parse_worker import ParsePool
+
+FILE_COUNT = IndexingCoordinator._MIN_FILES_FOR_PARSE_POOL + 6
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    for i in range(FILE_COUNT):
+        (source_dir / f"m{i}.py").write_text(
+            f'"""Module {i}."""\n\n\ndef f{i}(x):\n    return x + {i}\n\n\nclass C{i}:\n    def get(self):\n        return {i}\n'
+        )
+    (source_dir / "broken.py").write_bytes(b"\xff\xfe\x00def")
+    return source_dir
+
+
+async def _index(tmp_path, source_dir, name, parse_workers):
+    db = DuckDBProvider(tmp_path / f"{name}.duckdb")
+    db.connect()
+    try:
+        coordinator = IndexingCoordinator(
+            db, language_parsers={Language.PYTHON: PythonParser()}, parse_workers=parse_workers
+        )
+        result = await coordinator.process_directory(source_dir, patterns=["*.py"])
+        chunks = db.execute_query("""
+            SELECT f.path, c.chunk_type, c.symbol, c.code, c.start_line, c.end_line
+            FROM chunks c JOIN files f ON c.file_id = f.id
+            ORDER BY f.path, c.start_line, c.symbol
+        """)
+        return result, chunks
+    finally:
+        db.disconnect()
+
+
+async def test_pool_parses_like_the_event_loop(tmp_path, source_dir, monkeypatch):
+    pooled_batches = []
+    original = ParsePool.parse_files
+
+    async def recording_parse_files(self, files):
+        pooled_batches.append(len(files))
+        return await original(self, files)
+
+    monkeypatch.setattr(ParsePool, "parse_files", recording_parse_files)
+
+    serial_result, serial_chunks = await _index(tmp_path, source_dir, "serial", parse_workers=1)
+    assert pooled_batches == []
+    pooled_result, pooled_chunks = await _index(tmp_path, source_dir, "pooled", parse_workers=2)
+    assert sum(pooled_batches) == FILE_COUNT + 1
+
+    assert pooled_result == serial_result
+    assert pooled_result["files_processed"] >= FILE_COUNT
+    assert pooled_chunks == serial_chunks
+    assert len({chunk["path"] for chunk in pooled_chunks}) >= FILE_COUNT
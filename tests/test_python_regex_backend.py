@@ -0,0 +1,68 @@
+"""Tests for the Python regex backend over memory-mapped chunk text."""
+
+import random
+
+import pytest
+
+from providers.database.chunk_text_segment import _SHARD_SIZE, ChunkTextSegment
+from tests.conftest import add_chunks
+
+WORDS = ["parse", "Parser", "http", "buffer", "état", "naïve", "load_value", "x1"]
+
+
+@pytest.fixture
+def corpus(provider):
+    rng = random.Random(5)
+    for f in range(3):
+        add_chunks(provider, f"src/m{f}.py", [
+            f"def f{f}_{i}():\n    " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 8)))
+            for i in range(30)
+        ])
+    return provider
+
+
+def _search_ids(provider, pattern):
+    results, pagination = provider.search_regex(pattern, page_size=1000, include_total=True)
+    assert pagination["total"] == len(results)
+    return [result["chunk_id"] for result in results]
+
+
+@pytest.mark.parametrize("pattern", ["parse", "(?i)parser", "load_value|buffer", "[a-z]+", "état|na[ïi]ve", "^def f1_"])
+def test_python_backend_matches_sql_backend(corpus, pattern):
+    expected = _search_ids(corpus, pattern)
+    corpus.regex_backend = "python"
+    corpus.regex_workers = 1
+
+    assert _search_ids(corpus, pattern) == expected
+
+
+def test_python_backend_supports_backreferences(provider):
+    provider.regex_backend = "python"
+    chunk_ids = add_chunks(provider, "src/a.py", ["x = foo_foo", "x = foo_bar"])
+
+    assert _search_ids(provider, r"(\w+)_\1") == chunk_ids[:1]
+
+
+def test_segment_follows_chunk_deletes(corpus):
+    corpus.regex_backend = "python"
+    chunk_id = add_chunks(corpus, "src/new.py", ["def zebra(): return quagga"])[0]
+    assert _search_ids(corpus, "quag+a") == [chunk_id]
+
+    file_id = corpus.get_chunk_by_id(chunk_id)["file_id"]
+    corpus.apply_chunk_diff(file_id, [chunk_id], [], [])
+    replacement = add_chunks(corpus, "src/other.py", ["def okapi(): return quagga"])[0]
+
+    assert _search_ids(corpus, "quag+a") == [replacement]
+
+
+def test_worker_shards_match_in_process_scan(provider):
+    codes = [f"def f{i}(): return {'hit' if i % 7 == 0 else 'miss'}" for i in range(_SHARD_SIZE * 2 + 10)]
+    chunk_ids = add_chunks(provider, "src/big.py", codes)
+
+    segment = ChunkTextSegment(max_workers=2)
+    try:
+        segment.sync(provider.connection)
+        assert segment.chunk_count == len(codes)
+        assert segment.search("hit", chunk_ids) == {chunk_ids[i] for i in range(0, len(codes), 7)}
+    finally:
+        segment.close()
@@ -0,0 +1,74 @@
+"""Tests for int8 and binary quantized embedding partitions."""
+
+import math
+import random
+
+import pytest
+
+from tests.conftest import add_chunks
+
+DIMS = 32
+
+
+def _cosine(a, b):
+    return sum(x * y for x, y in zip(a, b)) / (math.hypot(*a) * math.hypot(*b))
+
+
+@pytest.fixture
+def vectors(provider):
+    rng = random.Random(7)
+    chunk_ids = add_chunks(provider, "src/a.py", [f"def f{i}(): return {i}" for i in range(80)])
+    vectors = {chunk_id: [rng.gauss(0, 1) for _ in range(DIMS)] for chunk_id in chunk_ids}
+    provider.insert_embeddings_batch([
+        {"chunk_id": chunk_id, "provider": "t", "model": "m", "embedding": vector, "dims": DIMS}
+        for chunk_id, vector in vectors.items()
+    ])
+    return vectors
+
+
+@pytest.mark.parametrize("storage", ["int8", "binary"])
+def test_quantized_search_reranks_to_exact_order(provider, vectors, storage):
+    provider.set_embedding_storage("t", "m", DIMS, storage)
+    table_name = provider._get_embedding_partition("t", "m", DIMS)["table_name"]
+    assert not any(index["table_name"] == table_name for index in provider.get_existing_vector_indexes())
+
+    query = [random.Random(8).gauss(0, 1) for _ in range(DIMS)]
+    results, _ = provider.search_semantic(query, "t", "m", page_size=5)
+
+    # Every vector fits in the oversampled candidate set, so re-ranking restores the exact top 5
+    expected = sorted(vectors, key=lambda chunk_id: -_cosine(query, vectors[chunk_id]))[:5]
+    assert [result["chunk_id"] for result in results] == expected
+    assert [result["similarity"] for result in results] == pytest.approx(
+        [_cosine(query, vectors[chunk_id]) for chunk_id in expected], abs=1e-5
+    )
+
+
+def test_int8_without_full_vectors_ranks_by_codes(provider, vectors):
+    provider.set_embedding_storage("t", "m", DIMS, "int8", keep_full=False)
+
+    chunk_id = min(vectors)
+    results, _ = provider.search_semantic(vectors[chunk_id], "t", "m", page_size=3)
+
+    assert results[0]["chunk_id"] == chunk_id
+    assert results[0]["similarity"] == pytest.approx(1.0, abs=0.02)
+    with pytest.raises(ValueError, match="full-precision"):
+        provider.set_embedding_storage("t", "m", DIMS, "float")
+
+
+def test_new_vectors_are_encoded_on_insert(provider, vectors):
+    provider.set_embedding_storage("t", "m", DIMS, "binary")
+    [chunk_id] = add_chunks(provider, "src/b.py", ["def late(): pass"])
+    vector = [1.0] * DIMS
+    provider.insert_embeddings_batch([{"chunk_id": chunk_id, "provider": "t", "model": "m", "embedding": vector, "dims": DIMS}])
+
+    results, _ = provider.search_semantic(vector, "t", "m", page_size=1)
+    assert results[0]["chunk_id"] == chunk_id
+
+
+def test_switching_back_to_float_restores_the_index(provider, vectors):
+    provider.set_embedding_storage("t", "m", DIMS, "int8")
+    provider.set_embedding_storage("t", "m", DIMS, "float")
+
+    table_name = provider._get_embedding_partition("t", "m", DIMS)["table_name"]
+    assert any(index["table_name"] == table_name for index in provider.get_existing_vector_indexes())
+    assert provider.connection.execute(f"SELECT count(code_i8) FROM {table_name}").fetchone()[0] == 0
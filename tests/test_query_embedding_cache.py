@@ -0,0 +1,108 @@
+"""Tests for the query embedding LRU cache."""
+
+import pytest
+
+from chunkhound import query_embedding_cache
+from chunkhound.query_embedding_cache import QueryEmbeddingCache
+
+
+class FailingStore:
+    def get_cached_embeddings(self, provider, model, content_hashes, track_usage=True):
+        raise RuntimeError("database closed")
+
+    def cache_embeddings(self, provider, model, entries, evict=True):
+        raise RuntimeError("database closed")
+
+
+async def test_lru_evicts_least_recently_used():
+    cache = QueryEmbeddingCache(max_entries=2)
+    await cache.put("p", "m", "first", [1.0])
+    await cache.put("p", "m", "second", [2.0])
+    assert await cache.get("p", "m", "first") == [1.0]
+
+    await cache.put("p", "m", "third", [3.0])
+
+    assert await cache.get("p", "m", "second") is None
+    assert await cache.get("p", "m", "first") == [1.0]
+    assert cache.get_stats()["evictions"] == 1
+
+
+async def test_keys_normalize_whitespace_and_separate_models():
+    cache = QueryEmbeddingCache()
+    await cache.put("p", "m", "find parser", [1.0])
+
+    assert await cache.get("p", "m", "  find parser\n") == [1.0]
+    assert await cache.get("p", "other", "find parser") is None
+    assert await cache.get("q", "m", "find parser") is None
+
+
+async def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(query_embedding_cache.time, "time", lambda: now[0])
+    cache = QueryEmbeddingCache(ttl_seconds=60)
+    await cache.put("p", "m", "query", [1.0])
+
+    now[0] += 59
+    assert await cache.get("p", "m", "query") == [1.0]
+    now[0] += 2
+    assert await cache.get("p", "m", "query") is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+async def test_persisted_vectors_survive_a_new_cache(provider):
+    await QueryEmbeddingCache(store=provider).put("p", "m", "query", [0.5, 0.25])
+
+    restarted = QueryEmbeddingCache(max_entries=0, store=provider)
+
+    assert restarted.enabled
+    assert await restarted.get("p", "m", "query") == pytest.approx([0.5, 0.25])
+    assert restarted.get_stats()["store_hits"] == 1
+
+
+async def test_store_failures_degrade_to_misses():
+    cache = QueryEmbeddingCache(store=FailingStore())
+    await cache.put("p", "m", "query", [1.0])
+    cache.clear()
+
+    assert await cache.get("p", "m", "query") is None
+    assert cache.get_stats()["misses"] == 1
+
+
+async def test_zero_size_without_store_is_disabled():
+    cache = QueryEmbeddingCache(max_entries=0)
+    await cache.put("p", "m", "query", [1.0])
+
+    assert not cache.enabled
+    assert await cache.get("p", "m", "query") is None
+
+
+async def test_query_lookups_leave_chunk_cache_stats_and_eviction_alone(provider):
+    provider.embedding_cache_max_entries = 1
+    provider.cache_embeddings("p", "m", [("chunk", [1.0, 0.0])])
+    cache = QueryEmbeddingCache(max_entries=0, store=provider)
+
+    await cache.put("p", "m", "query", [0.5, 0.25])
+    assert await cache.get("p", "m", "query") == pytest.approx([0.5, 0.25])
+    assert await cache.get("p", "m", "unknown") is None
+
+    stats = provider.get_embedding_cache_stats()
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 0, 0, 0)
+    assert cache.get_stats()["store_hits"] == 1
+
+
+async def test_store_calls_go_through_runners(provider):
+    calls = []
+
+    def runner(lane):
+        async def run(func, *args, **kwargs):
+            calls.append((lane, func.__name__))
+            return func(*args, **kwargs)
+        return run
+
+    cache = QueryEmbeddingCache(
+        max_entries=0, store=provider, run_store_read=runner("read"), run_store_write=runner("write")
+    )
+    await cache.put("p", "m", "query", [1.0])
+    await cache.get("p", "m", "query")
+
+    assert calls == [("write", "cache_embeddings"), ("read", "get_cached_embeddings")]
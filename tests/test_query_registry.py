@@ -0,0 +1,58 @@
+"""Tests for the compiled tree-sitter query registry."""
+
+from pathlib import Path
+
+from providers.parsing.java_parser import JavaParser
+from providers.parsing.python_parser import PythonParser
+from providers.parsing.queries import clear_query_cache, get_query, get_query_cache_size
+
+PYTHON_SOURCE = '''
+class Shape:
+    """A shape."""
+
+    def area(self):
+        # compute area
+        return 2
+
+
+def helper(x):
+    return x
+'''
+
+JAVA_SOURCE = '''
+class Shape {
+    int area() { return 2; }
+}
+
+class Circle {
+    int area() { return 3; }
+    int scale(int factor) { return area() * factor; }
+}
+'''
+
+
+def test_queries_compile_once_across_parsers_and_files():
+    clear_query_cache()
+    first = PythonParser().parse_file(Path("a.py"), PYTHON_SOURCE).chunks
+    compiled = get_query_cache_size()
+    assert compiled > 0
+
+    second = PythonParser().parse_file(Path("b.py"), PYTHON_SOURCE).chunks
+    assert get_query_cache_size() == compiled
+    assert [(c["symbol"], c["start_line"]) for c in second] == [(c["symbol"], c["start_line"]) for c in first]
+
+
+def test_per_class_queries_are_shared_within_a_file():
+    clear_query_cache()
+    chunks = JavaParser().parse_file(Path("Shape.java"), JAVA_SOURCE).chunks
+    compiled = get_query_cache_size()
+
+    JavaParser().parse_file(Path("Other.java"), JAVA_SOURCE.replace("Circle", "Square"))
+    assert get_query_cache_size() == compiled
+    assert {"Circle.scale", "Shape.area"} <= {chunk["symbol"] for chunk in chunks}
+
+
+def test_get_query_returns_the_cached_query():
+    language = PythonParser()._language
+    pattern = "(function_definition name: (identifier) @name)"
+    assert get_query(language, pattern) is get_query(language, pattern)
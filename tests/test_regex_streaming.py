@@ -0,0 +1,53 @@
+"""Tests for streaming, early-terminating regex search."""
+
+from tests.conftest import add_chunks
+
+
+def _record_windows(provider, monkeypatch):
+    windows = []
+    original = provider._match_regex_window
+
+    def recording_match(pattern, chunk_ids):
+        windows.append(len(chunk_ids))
+        return original(pattern, chunk_ids)
+
+    monkeypatch.setattr(provider, "_match_regex_window", recording_match)
+    return windows
+
+
+def test_scan_stops_once_the_page_is_filled(provider, monkeypatch):
+    for f in range(4):
+        add_chunks(provider, f"src/m{f}.py", [f"def f{f}_{i}(): return value" for i in range(50)])
+    provider.regex_scan_window = 16
+    windows = _record_windows(provider, monkeypatch)
+
+    results, pagination = provider.search_regex("value", page_size=5)
+
+    assert len(results) == 5
+    assert pagination["has_more"] is True
+    assert "total" not in pagination
+    assert windows == [16]
+
+
+def test_sparse_matches_widen_the_window_until_chunks_run_out(provider, monkeypatch):
+    codes = [f"def f{i}(): return {i}" for i in range(99)] + ["def last(): return needle"]
+    chunk_ids = add_chunks(provider, "src/a.py", codes)
+    provider.regex_scan_window = 4
+    windows = _record_windows(provider, monkeypatch)
+
+    # No required trigram, so every chunk is walked
+    results, pagination = provider.search_regex("n.e.l.e|ne.dl", page_size=2, include_total=True)
+
+    assert [result["chunk_id"] for result in results] == [chunk_ids[-1]]
+    assert pagination["has_more"] is False
+    assert pagination["total"] == 1
+    assert windows == [4, 16, 64, 16]
+
+
+def test_path_filter_limits_scanned_chunks(provider):
+    add_chunks(provider, "/repo/src/a.py", ["def a(): return token"])
+    wanted = add_chunks(provider, "/repo/tests/b.py", ["def b(): return token"])
+
+    results, _ = provider.search_regex("token", path_filter="tests/")
+
+    assert [result["chunk_id"] for result in results] == wanted
@@ -0,0 +1,105 @@
+"""Tests that trigram-accelerated regex search matches a full regexp_matches scan."""
+
+import random
+
+import pytest
+
+from chunkhound.regex_trigrams import extract_trigrams, regex_trigram_query
+from tests.conftest import add_chunks
+
+WORDS = ["parse", "Parser", "http", "HTTPResponse", "config", "load_value", "buffer", "état", "naïve", "x1", "__init__"]
+
+PATTERNS = [
+    "parse",
+    "Parser",
+    "(?i)httpresponse",
+    "load_value|buffer",
+    "conf(ig)?",
+    "def \\w+_\\d+",
+    "pa(rs|ck)e",
+    "http.*buffer",
+    "[a-z]+",
+    ".*",
+    "^def",
+    "état",
+    "na[ïi]ve",
+    "__init__\\(",
+    "x1{2,}",
+    "(?:load|store)_value",
+    "buf+er",
+    "HTTP[A-Z]\\w+",
+    "[[:space:]]parse",
+    "[[:alpha:]]+_value",
+    "[[:upper:]]TTP[[:alnum:]]*",
+    "[^[:space:]]buffer",
+]
+
+
+@pytest.fixture
+def corpus(provider):
+    rng = random.Random(0)
+    for f in range(6):
+        add_chunks(provider, f"{'src' if f % 2 else 'tests'}/m{f}.py", [
+            f"def f{f}_{i}():\n    " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 12)))
+            for i in range(25)
+        ])
+    return provider
+
+
+def _scan(provider, pattern):
+    """Chunk ids matching pattern by a full regexp_matches scan, in search_regex order."""
+    rows = provider.connection.execute("""
+        SELECT c.id FROM chunks c JOIN files f ON c.file_id = f.id
+        WHERE regexp_matches(c.code, ?)
+        ORDER BY f.path, c.start_line, c.id
+    """, [pattern]).fetchall()
+    return [row[0] for row in rows]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_search_regex_matches_full_scan(corpus, pattern):
+    results, pagination = corpus.search_regex(pattern, page_size=1000, include_total=True)
+
+    expected = _scan(corpus, pattern)
+    assert [result["chunk_id"] for result in results] == expected
+    assert pagination["total"] == len(expected)
+
+
+@pytest.mark.parametrize("pattern", ["parse", "load_value|buffer", "[a-z]+"])
+def test_cursor_pages_match_full_scan(corpus, pattern):
+    seen, cursor = [], None
+    while True:
+        page, pagination = corpus.search_regex(pattern, page_size=7, cursor=cursor)
+        seen += [result["chunk_id"] for result in page]
+        cursor = pagination["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == _scan(corpus, pattern)
+
+
+def test_postings_follow_rewritten_chunks(corpus):
+    chunk_id = add_chunks(corpus, "src/new.py", ["def zebra(): return quagga"])[0]
+    assert [r["chunk_id"] for r in corpus.search_regex("quagga")[0]] == [chunk_id]
+
+    file_id = corpus.get_chunk_by_id(chunk_id)["file_id"]
+    corpus.apply_chunk_diff(file_id, [chunk_id], [], [])
+
+    assert corpus.search_regex("quagga")[0] == []
+
+
+def test_trigram_query_requires_literal_trigrams():
+    assert regex_trigram_query("parse") == ("and", [("tri", "ars"), ("tri", "par"), ("tri", "rse")])
+    assert regex_trigram_query("(?i)Http") == ("and", [("tri", "htt"), ("tri", "ttp")])
+    assert regex_trigram_query("conf(ig)?") == ("and", [("tri", "con"), ("tri", "onf")])
+    assert regex_trigram_query("load|buffer")[0] == "or"
+    # No required trigram, or an unparsable pattern: every chunk is a candidate
+    assert regex_trigram_query("ab") is None
+    assert regex_trigram_query(".*") is None
+    assert regex_trigram_query("[a-z]+") is None
+    assert regex_trigram_query("(") is None
+    # RE2 bracket expressions read as literals by Python's parser
+    assert regex_trigram_query("[[:space:]]return") is None
+    with pytest.warns(FutureWarning, match="nested set"):
+        assert regex_trigram_query("[[:space:]]return", backend="python") is not None
+    assert extract_trigrams("AbCd") == {"abc", "bcd"}
@@ -0,0 +1,59 @@
+"""Tests for building MCP search responses within a token budget."""
+
+import json
+
+from chunkhound.mcp_server import build_search_response, estimate_tokens
+
+
+def _results(count, lines=3):
+    return [
+        {"chunk_id": i, "name": f"f{i}", "content": "\n".join(f"    value_{i} = {j}" for j in range(lines)),
+         "start_line": i * 10, "end_line": i * 10 + lines, "file_path": f"/repo/src/m{i}.py"}
+        for i in range(count)
+    ]
+
+
+def _pagination(count, has_more=False):
+    return {"offset": 20, "page_size": count, "has_more": has_more,
+            "next_offset": 20 + count if has_more else None, "next_cursor": None}
+
+
+def test_page_within_budget_is_returned_whole():
+    results = _results(5)
+
+    response = json.loads(build_search_response(results, _pagination(5), 25000))
+
+    assert response == {"results": results, "pagination": _pagination(5)}
+
+
+def test_results_beyond_the_budget_move_to_the_next_page():
+    results = _results(40, lines=20)
+
+    text = build_search_response(results, _pagination(40), 2000)
+    response = json.loads(text)
+
+    kept = response["results"]
+    assert 0 < len(kept) < 40
+    assert estimate_tokens(text) <= 2000
+    assert [result["chunk_id"] for result in kept] == list(range(len(kept)))
+    assert response["pagination"]["page_size"] == len(kept)
+    assert response["pagination"]["has_more"] is True
+    assert response["pagination"]["next_offset"] == 20 + len(kept)
+
+
+def test_oversized_first_result_is_truncated_not_dropped():
+    results = _results(2, lines=2000)
+
+    text = build_search_response(results, _pagination(2), 1000)
+    response = json.loads(text)
+
+    assert [result["chunk_id"] for result in response["results"]] == [0]
+    assert response["results"][0]["content_truncated"] is True
+    assert response["results"][0]["content"].endswith("\n...")
+    assert estimate_tokens(text) <= 1000
+    assert response["pagination"]["next_offset"] == 21
+
+
+def test_empty_page_keeps_pagination():
+    pagination = _pagination(0)
+    assert json.loads(build_search_response([], pagination, 1000)) == {"results": [], "pagination": pagination}
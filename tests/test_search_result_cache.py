@@ -0,0 +1,67 @@
+"""Tests for the MCP search result page cache."""
+
+from chunkhound.pagination import regex_cursor
+from chunkhound.search_result_cache import SearchResultCache
+from tests.conftest import add_chunks
+
+
+def _cached_page(cache, provider, offset, page_size, include_total=False):
+    """Serve a regex page through the cache the way the MCP server does."""
+    generation = provider.index_generation
+    page = cache.get_page("regex", generation, offset, page_size, include_total, regex_cursor)
+    if page is not None:
+        return page
+    results, pagination = provider.search_regex("value", page_size=cache.window(offset, page_size),
+                                                include_total=include_total)
+    return cache.put("regex", generation, results, pagination, offset, page_size, include_total, regex_cursor)
+
+
+def test_cached_pages_match_database_pages(provider):
+    add_chunks(provider, "src/a.py", [f"def f{i}(): return value" for i in range(40)])
+    cache = SearchResultCache(prefetch_pages=2)
+
+    offset = 0
+    while offset is not None:
+        results, pagination = _cached_page(cache, provider, offset, 6, include_total=True)
+        expected, expected_pagination = provider.search_regex("value", page_size=6, offset=offset, include_total=True)
+        assert [r["chunk_id"] for r in results] == [r["chunk_id"] for r in expected]
+        assert {k: v for k, v in pagination.items() if k != "next_cursor"} == \
+            {k: v for k, v in expected_pagination.items() if k != "next_cursor"}
+        offset = pagination["next_offset"]
+
+    # Windows double with the offset: 7 pages take 3 searches
+    assert cache.get_stats()["misses"] == 3
+    assert cache.get_stats()["hits"] == 4
+
+
+def test_writes_invalidate_cached_searches(provider):
+    add_chunks(provider, "src/a.py", ["def a(): return value"])
+    cache = SearchResultCache()
+    assert len(_cached_page(cache, provider, 0, 10)[0]) == 1
+
+    add_chunks(provider, "src/b.py", ["def b(): return value"])
+
+    assert len(_cached_page(cache, provider, 0, 10)[0]) == 2
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_results_from_before_a_write_are_not_stored():
+    cache = SearchResultCache()
+    cache.get_page("k", 5, 0, 10, False, regex_cursor)
+
+    page, _ = cache.put("k", 4, [{"chunk_id": 1}], {"has_more": False}, 0, 10, False, regex_cursor)
+
+    assert page == [{"chunk_id": 1}]
+    assert cache.get_page("k", 5, 0, 10, False, regex_cursor) is None
+
+
+def test_lru_bound_and_missing_totals():
+    cache = SearchResultCache(max_entries=1)
+    cache.put("a", 1, [], {"has_more": False}, 0, 10, False, regex_cursor)
+    cache.put("b", 1, [], {"has_more": False}, 0, 10, False, regex_cursor)
+
+    assert cache.get_page("a", 1, 0, 10, False, regex_cursor) is None
+    assert cache.get_page("b", 1, 0, 10, False, regex_cursor) is not None
+    # Entries stored without a total cannot answer a request for one
+    assert cache.get_page("b", 1, 0, 10, True, regex_cursor) is None
+    assert cache.get_stats()["evictions"] == 1
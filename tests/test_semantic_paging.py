@@ -0,0 +1,79 @@
+"""Tests for COUNT-free semantic search pagination."""
+
+import math
+import random
+
+import pytest
+
+from tests.conftest import add_chunks
+
+DIMS = 8
+
+
+def _cosine(a, b):
+    return sum(x * y for x, y in zip(a, b)) / (math.hypot(*a) * math.hypot(*b))
+
+
+@pytest.fixture
+def embedded(provider):
+    rng = random.Random(3)
+    chunk_ids = add_chunks(provider, "src/a.py", [f"def f{i}(): return {i}" for i in range(60)])
+    vectors = {chunk_id: [rng.uniform(-1, 1) for _ in range(DIMS)] for chunk_id in chunk_ids}
+    provider.insert_embeddings_batch([
+        {"chunk_id": chunk_id, "provider": "t", "model": "m", "embedding": vector, "dims": DIMS}
+        for chunk_id, vector in vectors.items()
+    ])
+    return provider, vectors
+
+
+def test_cursor_and_offset_pages_walk_the_full_ranking(embedded):
+    provider, vectors = embedded
+    query = [random.Random(4).uniform(-1, 1) for _ in range(DIMS)]
+    expected = sorted(vectors, key=lambda chunk_id: (-_cosine(query, vectors[chunk_id]), chunk_id))
+
+    by_cursor, cursor = [], None
+    while True:
+        results, pagination = provider.search_semantic(query, "t", "m", page_size=7, cursor=cursor)
+        by_cursor += [result["chunk_id"] for result in results]
+        assert "total" not in pagination
+        if not pagination["has_more"]:
+            assert pagination["next_cursor"] is None and pagination["next_offset"] is None
+            break
+        assert len(results) == 7
+        cursor = pagination["next_cursor"]
+
+    by_offset, offset = [], 0
+    while offset is not None:
+        results, pagination = provider.search_semantic(query, "t", "m", page_size=7, offset=offset)
+        by_offset += [result["chunk_id"] for result in results]
+        offset = pagination["next_offset"]
+
+    assert by_cursor == by_offset == expected
+
+
+def test_threshold_ends_paging_early(embedded):
+    provider, vectors = embedded
+    query = vectors[min(vectors)]
+
+    results, pagination = provider.search_semantic(query, "t", "m", page_size=100, threshold=0.5)
+
+    assert results[0]["chunk_id"] == min(vectors)
+    assert all(result["similarity"] >= 0.5 for result in results)
+    assert len(results) == sum(1 for vector in vectors.values() if _cosine(query, vector) >= 0.5)
+    assert pagination["has_more"] is False
+
+
+def test_total_is_an_estimate_on_request(embedded):
+    provider, vectors = embedded
+
+    _, pagination = provider.search_semantic(vectors[min(vectors)], "t", "m", page_size=5, include_total=True)
+
+    assert pagination["total_is_estimate"] is True
+    assert pagination["total"] >= 5
+    assert pagination["has_more"] is True
+
+
+def test_malformed_cursor_is_rejected(embedded):
+    provider, vectors = embedded
+    with pytest.raises(ValueError):
+        provider.search_semantic(vectors[min(vectors)], "t", "m", cursor="not-a-cursor")
@@ -0,0 +1,43 @@
+"""Tests that semantic search candidates come from the HNSW index."""
+
+import random
+
+import pytest
+
+from tests.conftest import add_chunks
+
+DIMS = 16
+
+
+@pytest.fixture
+def indexed_provider(provider):
+    rng = random.Random(0)
+    chunk_ids = []
+    for directory in ("src", "tests"):
+        chunk_ids += add_chunks(provider, f"/bench/{directory}/module.py",
+                                [f"def func_{i}():\n    return {i}" for i in range(200)])
+    provider.insert_embeddings_batch([
+        {"chunk_id": chunk_id, "provider": "bench", "model": "bench-model",
+         "embedding": [rng.random() for _ in range(DIMS)], "dims": DIMS}
+        for chunk_id in chunk_ids
+    ])
+    return provider
+
+
+def test_candidate_query_uses_hnsw_index_scan(indexed_provider):
+    partition = indexed_provider._get_embedding_partition("bench", "bench-model", DIMS)
+    query = [random.Random(1).random() for _ in range(DIMS)]
+
+    candidates_sql = indexed_provider._semantic_candidates_query(partition, query, 40)
+    plan = "\n".join(row[1] for row in indexed_provider.connection.execute(f"EXPLAIN {candidates_sql}").fetchall())
+
+    assert "HNSW_INDEX_SCAN" in plan
+
+
+def test_filtered_search_returns_only_matching_paths(indexed_provider):
+    query = [random.Random(2).random() for _ in range(DIMS)]
+
+    results, _ = indexed_provider.search_semantic(query, "bench", "bench-model", page_size=10, path_filter="tests/")
+
+    assert len(results) == 10
+    assert all("/tests/" in result["file_path"] for result in results)
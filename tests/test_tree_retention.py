@@ -0,0 +1,38 @@
+"""Tests for which indexing paths keep syntax trees for incremental reparsing."""
+
+from pathlib import Path
+
+from core.types import Language
+from chunkhound.tree_cache import get_default_cache
+from providers.parsing.python_parser import PythonParser
+from services.indexing_coordinator import IndexingCoordinator
+
+
+async def test_directory_indexing_does_not_retain_trees(provider, tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    for i in range(5):
+        (source_dir / f"m{i}.py").write_text(f"def f{i}(x):\n    return x + {i}\n")
+
+    cache = get_default_cache()
+    cache.clear()
+    coordinator = IndexingCoordinator(provider, language_parsers={Language.PYTHON: PythonParser()})
+
+    result = await coordinator.process_directory(source_dir, patterns=["*.py"])
+    assert result["files_processed"] == 5
+    assert cache.get_stats()["entries"] == 0
+
+    # Single-file updates keep the tree for the next incremental reparse
+    edited = source_dir / "m0.py"
+    edited.write_text("def f0(x):\n    return x * 2\n")
+    await coordinator.process_file(edited)
+    assert cache.get_stats()["entries"] == 1
+
+
+def test_reparse_outlives_the_parser_that_cached_the_tree():
+    source = "def f(x):\n    return x\n"
+    for i in range(4):
+        # A fresh parser each time: the cached tree must keep its language alive
+        result = PythonParser().parse_file(Path("reparsed.py"), "\n" * i + source)
+        assert [chunk["symbol"] for chunk in result.chunks if chunk["chunk_type"] == "function"] == ["f"]
+    assert result.metadata["changed_ranges"]